@@ -1,2 +1,2 @@
 """Initialize package"""
-from .report_def import BacktestingReport
+from .report_def import BacktestingReport, ProfileReport, PhaseReport, ProgressReport
@@ -15,11 +15,19 @@ class Trade():
     """Trade Class"""
     report: TradeReport = field(init=False)
     positions: list[Position] = field(init=False)
+    generation: int = field(init=False)
+    _orders: tuple[int, list[Order]] = field(init=False, repr=False)
+    _deals: tuple[int, list[Deal]] = field(init=False, repr=False)
+    _report_generation: int = field(init=False, repr=False)
 
     def __post_init__(self):
         """Post initialization"""
         self.report = None
         self.positions = []
+        self.generation = 0
+        self._orders = None
+        self._deals = None
+        self._report_generation = None
 
     def clear_positions(self):
         """Remove all positions"""
@@ -27,6 +35,7 @@ class Trade():
             pos.clear_orders()
 
         self.positions.clear()
+        self.generation += 1
 
     def open_position(self, symbol: Symbol, open_datetime: dt, pos_type: PositionType,
                       volume: float, open_price: float,
@@ -35,6 +44,7 @@ class Trade():
         pos = Position(symbol, open_datetime, pos_type,
                        volume, open_price, margin, comment)
         self.positions.insert(0, pos)
+        self.generation += 1
         return pos
 
     def close_position(self, position_id: int, tick: Tick) -> Position:
@@ -42,6 +52,7 @@ class Trade():
         for pos in self.positions:
             if pos.status == PositionStatus.OPEN and pos.id == position_id:
                 pos.close(tick)
+                self.generation += 1
                 return pos
 
         return None
@@ -54,6 +65,9 @@ class Trade():
                 pos.close(tick)
                 result.insert(0, pos)
 
+        if result:
+            self.generation += 1
+
         return result
 
     def get_position(self, position_id: int) -> Position:
@@ -70,20 +84,21 @@ class Trade():
 
     def get_orders(self) -> list[Order]:
         """Return a list of all order"""
-        orders = []
-        for pos in self.positions:
-            orders.extend(pos.get_orders())
+        if self._orders is None or self._orders[0] != self.generation:
+            self._orders = (self.generation,
+                            [order for pos in self.positions for order in pos.orders])
 
-        return orders
+        # the cached list is never handed out, callers may change their copy
+        return list(self._orders[1])
 
     def get_deals(self) -> list[Deal]:
         """Return a list of all deal"""
-        deals = []
-        for pos in self.positions:
-            for order in pos.get_orders():
-                deals.extend(order.get_deals())
+        if self._deals is None or self._deals[0] != self.generation:
+            self._deals = (self.generation,
+                           [deal for pos in self.positions
+                            for order in pos.orders for deal in order.deals])
 
-        return deals
+        return list(self._deals[1])
 
     def get_all_open_position(self) -> list[Position]:
         """Return a list of all open position"""
@@ -128,8 +143,9 @@ class Trade():
     def get_report(self, do_print: bool=False,
               rerun: bool=False) -> TradeReport:
         """Return report"""
-        if self.report is None or rerun:
+        if self.report is None or rerun or self._report_generation != self.generation:
             self._run_report()
+            self._report_generation = self.generation
 
         if do_print:
             self._print_report()
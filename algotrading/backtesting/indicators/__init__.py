@@ -0,0 +1,2 @@
+"""Initialize package"""
+from .cache import IndicatorCache, IndicatorCacheHandle
@@ -0,0 +1,117 @@
+"""Module of Indicator Cache Class"""
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import ClassVar, Self
+import numpy as np
+
+from ...ticker import Ticker
+
+@dataclass(frozen=True)
+class IndicatorCacheHandle:
+    """Picklable reference to an indicator cache placed in shared memory"""
+    name: str
+    length: int
+
+@dataclass
+class IndicatorCache():
+    """Indicator Cache Class
+
+    Holds the per-dataset bases (mid price, log returns and their prefix sums)
+    so every strategy of a parameter sweep derives its indicators from the
+    same arrays instead of recomputing them on its own data copy.
+    """
+    _MID: ClassVar[int] = 0
+    _RETURNS: ClassVar[int] = 1
+    _CUM_RETURNS: ClassVar[int] = 2
+    _ROWS: ClassVar[int] = 3
+
+    bases: np.ndarray
+    _shm: shared_memory.SharedMemory = field(default=None, repr=False)
+    _is_owner: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_ticker(cls, ticker: Ticker) -> Self | None:
+        """Compute the shared bases of the ticker data"""
+        if ticker is None or ticker.data is None:
+            return None
+
+        mid = ticker.get_prices("mid")
+        bases = np.empty((cls._ROWS, len(mid)), dtype=np.float64)
+        bases[cls._MID] = mid
+
+        # log(mid / mid[0]) is the prefix sum of the log returns, taking the
+        # difference of two of them gives an exact zero on an unchanged price
+        if len(mid) > 0:
+            np.log(mid / mid[0], out=bases[cls._CUM_RETURNS])
+            bases[cls._RETURNS, 0] = np.nan
+            np.subtract(bases[cls._CUM_RETURNS, 1:], bases[cls._CUM_RETURNS, :-1],
+                        out=bases[cls._RETURNS, 1:])
+
+        return cls(bases)
+
+    @classmethod
+    def attach(cls, handle: IndicatorCacheHandle) -> Self:
+        """Return the cache shared by another process"""
+        shm = shared_memory.SharedMemory(name=handle.name)
+        bases = np.ndarray((cls._ROWS, handle.length), dtype=np.float64, buffer=shm.buf)
+        bases.flags.writeable = False
+        return cls(bases, shm, False)
+
+    def share(self) -> IndicatorCacheHandle:
+        """Copy the bases into shared memory and return a handle for worker processes"""
+        if self._shm is None:
+            shm = shared_memory.SharedMemory(create=True, size=max(self.bases.nbytes, 1))
+            shared = np.ndarray(self.bases.shape, dtype=np.float64, buffer=shm.buf)
+            shared[:] = self.bases
+            shared.flags.writeable = False
+            (self.bases, self._shm, self._is_owner) = (shared, shm, True)
+
+        return IndicatorCacheHandle(self._shm.name, self.get_length())
+
+    def release(self):
+        """Detach from shared memory, the owner also frees it"""
+        if self._shm is None:
+            return
+
+        self.bases = self.bases.copy()
+        self._shm.close()
+        if self._is_owner:
+            self._shm.unlink()
+
+        (self._shm, self._is_owner) = (None, False)
+
+    def get_length(self) -> int:
+        """Return number of tick"""
+        return self.bases.shape[1]
+
+    def get_mid(self) -> np.ndarray:
+        """Return mid prices"""
+        return self._view(self._MID)
+
+    def get_returns(self) -> np.ndarray:
+        """Return log returns, the first one is undefined (NaN)"""
+        return self._view(self._RETURNS)
+
+    def get_cumulative_returns(self) -> np.ndarray:
+        """Return prefix sums of the log returns"""
+        return self._view(self._CUM_RETURNS)
+
+    def get_rolling_returns(self, window: int) -> np.ndarray:
+        """Return the rolling mean of the log returns in O(n),
+        matching pandas' rolling(window).mean() over the returns"""
+        if window <= 0:
+            raise ValueError("window must be an integer greater than 0")
+
+        length = self.get_length()
+        result = np.full(length, np.nan)
+        if window < length:
+            cum_returns = self.bases[self._CUM_RETURNS]
+            np.subtract(cum_returns[window:], cum_returns[:-window], out=result[window:])
+            result[window:] /= window
+
+        return result
+
+    def _view(self, row: int) -> np.ndarray:
+        view = self.bases[row].view()
+        view.flags.writeable = False
+        return view
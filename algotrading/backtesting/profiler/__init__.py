@@ -0,0 +1,2 @@
+"""Initialize package"""
+from .profiler import Profiler
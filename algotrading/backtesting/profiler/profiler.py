@@ -0,0 +1,146 @@
+"""Module of Profiler Class"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, ClassVar, Iterator
+import time
+import tracemalloc
+
+from ..report_def import ProfileReport, PhaseReport
+
+@dataclass
+class Profiler():
+    """Profiler Class
+
+    Measures wall time, CPU time and tracemalloc memory per phase and counts
+    calls of instrumented methods. Phases can be nested, the peak memory of
+    an inner phase is also accounted to the outer one. Memory is only traced
+    between start and stop (or finish), a profiler reused after finish starts
+    a new report.
+    """
+    TOP_ALLOCATIONS: ClassVar[int] = 10
+
+    snapshot: bool = True
+    report: ProfileReport = field(init=False)
+    _stack: list[list] = field(init=False, repr=False)
+    _patched: list[tuple[Any, str, Any]] = field(init=False, repr=False)
+    _is_tracing_owner: bool = field(init=False, repr=False)
+    _is_finished: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Post initialization"""
+        self.report = ProfileReport()
+        self._stack = []
+        self._patched = []
+        self._is_tracing_owner = False
+        self._is_finished = False
+
+    def start(self):
+        """Start tracing memory allocations"""
+        self._renew()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._is_tracing_owner = True
+
+    def stop(self):
+        """Remove instrumentation and stop tracing, if started by this profiler"""
+        self.restore()
+        if self._is_tracing_owner:
+            tracemalloc.stop()
+            self._is_tracing_owner = False
+
+    def finish(self, sizes: dict[str, int]=None) -> ProfileReport:
+        """Remove instrumentation, stop tracing and return the report"""
+        self.restore()
+        if sizes:
+            self.report.sizes.update(sizes)
+
+        if tracemalloc.is_tracing():
+            self.report.peak_memory = max(self.report.peak_memory,
+                                          tracemalloc.get_traced_memory()[1])
+            if self.snapshot:
+                stats = tracemalloc.take_snapshot().statistics("lineno")
+                self.report.top_allocations = [(str(stat.traceback), stat.size)
+                                               for stat in stats[:self.TOP_ALLOCATIONS]]
+
+        self.stop()
+        self._is_finished = True
+        return self.report
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseReport]:
+        """Profile the enclosed block as the named phase"""
+        self._renew()
+        (current, peak) = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+
+        # frame: [initial memory, peak memory]
+        frame = [current, current]
+        self._stack.append(frame)
+        (wall, cpu) = (time.perf_counter(), time.process_time())
+        phase = self.report.phases.setdefault(name, PhaseReport())
+        try:
+            yield phase
+        finally:
+            phase.wall_time += time.perf_counter() - wall
+            phase.cpu_time += time.process_time() - cpu
+            phase.calls += 1
+
+            self._stack.pop()
+            (current, peak) = tracemalloc.get_traced_memory()
+            frame[1] = max(frame[1], peak)
+            phase.peak_memory = max(phase.peak_memory, frame[1])
+            phase.memory_growth += current - frame[0]
+            self.report.peak_memory = max(self.report.peak_memory, frame[1])
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], frame[1])
+
+    def count(self, obj: Any, name: str, label: str=None):
+        """Count the calls of a method of the object"""
+        self._renew()
+        label = label or f"{type(obj).__name__}.{name}"
+        method = getattr(obj, name)
+        calls = self.report.calls
+        calls.setdefault(label, 0)
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            calls[label] += 1
+            return method(*args, **kwargs)
+
+        self._patch(obj, name, wrapper)
+
+    def time(self, obj: Any, name: str, phase: str=None):
+        """Profile every call of a method of the object as a phase"""
+        self._patch(obj, name, self.wrap(getattr(obj, name), phase or name))
+
+    def wrap(self, function: Callable, phase: str) -> Callable:
+        """Return the function profiled as a phase on every call"""
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.phase(phase):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def restore(self):
+        """Remove every instrumented method"""
+        for (obj, name, previous) in reversed(self._patched):
+            if previous is None:
+                object.__delattr__(obj, name)
+            else:
+                object.__setattr__(obj, name, previous)
+        self._patched.clear()
+
+    def _renew(self):
+        # a finished report is kept by its caller, the next run starts a new one
+        if self._is_finished:
+            self.report = ProfileReport()
+            self._is_finished = False
+
+    def _patch(self, obj: Any, name: str, wrapper: Callable):
+        # instance attributes shadow the class methods, frozen dataclasses included
+        self._patched.append((obj, name, vars(obj).get(name)))
+        object.__setattr__(obj, name, wrapper)
@@ -0,0 +1,3 @@
+"""Initialize package"""
+from .progress import (ProgressHook, SilentProgress, BarProgress,
+                       LoggingProgress, CallbackProgress)
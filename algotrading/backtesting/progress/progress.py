@@ -0,0 +1,109 @@
+"""Module of Progress Hook Classes"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, TextIO
+import logging
+import sys
+import time
+
+from ..report_def import ProgressReport
+
+@dataclass
+class ProgressHook(ABC):
+    """Progress Hook Interface
+
+    Notified every stride ticks of the iteration, a stride of 0 disables
+    the notifications. The tick loop itself never reads the clock or
+    writes anything, only the hooks do.
+    """
+    stride: int = 1000
+
+    def on_start(self, progress: ProgressReport):
+        """Iteration started"""
+
+    @abstractmethod
+    def on_progress(self, progress: ProgressReport):
+        """Another stride of ticks is done"""
+
+    def on_finish(self, progress: ProgressReport):
+        """Iteration ended, completed or interrupted"""
+
+@dataclass
+class SilentProgress(ProgressHook):
+    """Progress hook reporting nothing"""
+    stride: int = 0
+
+    def on_progress(self, progress: ProgressReport):
+        """Another stride of ticks is done"""
+
+@dataclass
+class BarProgress(ProgressHook):
+    """Progress hook drawing a progress bar with rate and remaining time"""
+    width: int = 30
+    stream: TextIO = None
+    _started: float = field(init=False, default=None, repr=False)
+
+    def on_start(self, progress: ProgressReport):
+        """Iteration started"""
+        self._started = time.perf_counter()
+        self._draw(progress, "")
+
+    def on_progress(self, progress: ProgressReport):
+        """Another stride of ticks is done"""
+        self._draw(progress, "")
+
+    def on_finish(self, progress: ProgressReport):
+        """Iteration ended, completed or interrupted"""
+        self._draw(progress, "\n")
+
+    def _draw(self, progress: ProgressReport, end: str):
+        ratio = progress.ticks / progress.length if progress.length else 0
+        filled = int(ratio * self.width)
+        elapsed = time.perf_counter() - self._started
+        rate = progress.ticks / elapsed if elapsed > 0 else 0
+        remaining = (progress.length - progress.ticks) / rate if rate > 0 else 0
+
+        stream = self.stream or sys.stdout
+        stream.write(f"\r|{'█' * filled}{' ' * (self.width - filled)}| "
+                     f"{progress.ticks}/{progress.length} ({int(ratio * 100)}%) "
+                     f"[{elapsed:.1f}s<{remaining:.1f}s, {rate:,.0f} ticks/s]{end}")
+        stream.flush()
+
+@dataclass
+class LoggingProgress(ProgressHook):
+    """Progress hook writing a log record every stride"""
+    LOGGER_NAME: ClassVar[str] = "algotrading.backtesting"
+
+    logger: logging.Logger = None
+    level: int = logging.INFO
+
+    def on_start(self, progress: ProgressReport):
+        """Iteration started"""
+        self._log("Iteration started", progress)
+
+    def on_progress(self, progress: ProgressReport):
+        """Another stride of ticks is done"""
+        self._log("Iteration", progress)
+
+    def on_finish(self, progress: ProgressReport):
+        """Iteration ended, completed or interrupted"""
+        self._log("Iteration ended", progress)
+
+    def _log(self, message: str, progress: ProgressReport):
+        logger = self.logger or logging.getLogger(self.LOGGER_NAME)
+        logger.log(self.level, "%s: %d of %d, equity: %.2f, open positions: %d",
+                   message, progress.ticks, progress.length,
+                   progress.equity, progress.open_positions)
+
+@dataclass
+class CallbackProgress(ProgressHook):
+    """Progress hook passing every progress report to a function"""
+    callback: Callable[[ProgressReport], None] = None
+
+    def on_progress(self, progress: ProgressReport):
+        """Another stride of ticks is done"""
+        self.callback(progress)
+
+    def on_finish(self, progress: ProgressReport):
+        """Iteration ended, completed or interrupted"""
+        self.callback(progress)
@@ -26,6 +26,22 @@ class MeasurementReport:
     expected_payoff: float = 0
     margin_level: float = 0
 
+@dataclass
+class RiskReport:
+    """Risk report data definition, ratios are annualized over trading time
+    (24/5, 260 days of 24 hours a year), exposure is the percent of trading
+    time with margin used"""
+    sharpe_ratio: float = 0
+    sortino_ratio: float = 0
+    calmar_ratio: float = 0
+    ulcer_index: float = 0
+    exposure_time: float = 0
+    average_holding_time: float = 0
+    returns_mean: float = 0
+    returns_std: float = 0
+    returns_skewness: float = 0
+    returns_kurtosis: float = 0
+
 @dataclass
 class PositionReport:
     """Position report data definition"""
@@ -50,6 +66,34 @@ class TradeReport:
     avg_consecutive_wins: float = 0
     avg_consecutive_losses: float = 0
 
+@dataclass
+class ProgressReport:
+    """Progress report data definition"""
+    ticks: int = 0
+    length: int = 0
+    balance: float = 0
+    equity: float = 0
+    open_positions: int = 0
+    is_running: bool = False
+
+@dataclass
+class PhaseReport:
+    """Profiled phase report data definition"""
+    calls: int = 0
+    wall_time: float = 0
+    cpu_time: float = 0
+    peak_memory: int = 0
+    memory_growth: int = 0
+
+@dataclass
+class ProfileReport:
+    """Profile report data definition"""
+    phases: dict[str, PhaseReport] = field(default_factory = dict)
+    calls: dict[str, int] = field(default_factory = dict)
+    sizes: dict[str, int] = field(default_factory = dict)
+    peak_memory: int = 0
+    top_allocations: list[tuple[str, int]] = field(default_factory = list)
+
 @dataclass
 class BacktestingReport:
     """Backtesting report data definition"""
@@ -57,4 +101,7 @@ class BacktestingReport:
     balance_drawdown: DrawdownReport = field(default_factory = DrawdownReport)
     equity_drawdown: DrawdownReport = field(default_factory = DrawdownReport)
     measurement: MeasurementReport = field(default_factory = MeasurementReport)
+    risk: RiskReport = field(default_factory = RiskReport)
     trade: TradeReport = field(default_factory = TradeReport)
+    fingerprint: str = None
+    profile: ProfileReport = None
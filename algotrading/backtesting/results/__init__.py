@@ -0,0 +1,2 @@
+"""Initialize package"""
+from .collector import ResultsCollector
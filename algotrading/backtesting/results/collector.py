@@ -0,0 +1,171 @@
+"""Module of Results Collector Class"""
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Any, ClassVar, Self
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..report_def import BacktestingReport
+
+@dataclass
+class ResultsCollector():
+    """Results Collector Class
+
+    Flattens backtesting reports into typed columns as runs finish and
+    appends them in batches to a Parquet (.parquet) or Arrow (.arrow, .feather)
+    file. Only scalar results are kept, equity curves are never stored. The
+    schema is built from every row buffered before the first flush, rows
+    without a column get nulls. A column first seen after the file is opened,
+    or with another type, raises ValueError instead of being dropped.
+    """
+    SEPARATOR: ClassVar[str] = "."
+    PARQUET_EXT: ClassVar[tuple[str, ...]] = (".parquet",)
+    ARROW_EXT: ClassVar[tuple[str, ...]] = (".arrow", ".feather")
+    _TYPES: ClassVar[dict[type, pa.DataType]] = {bool: pa.bool_(), int: pa.int64(),
+                                                 float: pa.float64(), str: pa.string()}
+    _PAIR_SUFFIXES: ClassVar[tuple[str, str]] = ("total", "profit")
+    _PARETO_CHUNK: ClassVar[int] = 1024
+
+    path: str
+    batch_size: int = 100
+    schema: pa.Schema = field(init=False, default=None)
+    rows: int = field(init=False, default=0)
+    _buffer: list[dict] = field(init=False, default_factory=list, repr=False)
+    _types: dict[str, pa.DataType] = field(init=False, default_factory=dict, repr=False)
+    _writer: Any = field(init=False, default=None, repr=False)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, report: BacktestingReport, params: Any=None, **tags):
+        """Add the report of a finished run, with its parameter set and tags"""
+        (row, types) = ({}, {})
+        for (name, value) in tags.items():
+            self._add_value(name, value, type(value), row, types)
+
+        if params is not None:
+            self._flatten("params", params, row, types)
+        self._flatten("", report, row, types)
+
+        for (name, value_type) in types.items():
+            known = self._types.setdefault(name, value_type)
+            if known != value_type:
+                raise ValueError(f"Column {name} is {value_type}, expected {known}")
+
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered rows to the file"""
+        if not self._buffer:
+            return
+
+        schema = pa.schema(list(self._types.items()))
+        if self._writer is None:
+            self.schema = schema
+            self._writer = self._open_writer()
+        elif not schema.equals(self.schema):
+            added = [name for name in schema.names if name not in self.schema.names]
+            raise ValueError(f"Columns added after the file was opened: {added}")
+
+        table = pa.Table.from_pylist(self._buffer, schema=self.schema)
+
+        self._writer.write_table(table)
+        self.rows += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        """Flush the buffered rows and close the file"""
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    @classmethod
+    def read(cls, path: str, columns: list[str]=None,
+             filters: list[tuple]=None) -> pd.DataFrame:
+        """Return the collected results, reading only the requested columns
+        and rows matching the filters e.g. [("summary.net_profit", ">", 0)]"""
+        file_format = "parquet" if path.endswith(cls.PARQUET_EXT) else "arrow"
+        expression = pq.filters_to_expression(filters) if filters else None
+        table = ds.dataset(path, format=file_format).to_table(columns=columns,
+                                                              filter=expression)
+        return table.to_pandas()
+
+    @classmethod
+    def rank(cls, df: pd.DataFrame, by: str | list[str], ascending: bool=False,
+             top: int=None) -> pd.DataFrame:
+        """Return the results sorted by the columns, optionally the top ones"""
+        df = df.sort_values(by=by, ascending=ascending, kind="stable")
+        return df if top is None else df.head(top)
+
+    @classmethod
+    def pareto_front(cls, df: pd.DataFrame, objectives: dict[str, str]) -> pd.DataFrame:
+        """Return the results not dominated by any other,
+        objectives maps a column to "max" or "min" """
+        signs = np.array([1 if goal == "max" else -1 for goal in objectives.values()])
+        values = df[list(objectives)].to_numpy(dtype=np.float64) * signs
+        values = np.nan_to_num(values, nan=-np.inf)
+
+        dominated = np.zeros(len(values), dtype=bool)
+        for start in range(0, len(values), cls._PARETO_CHUNK):
+            chunk = values[start:start + cls._PARETO_CHUNK, None, :]
+            better_or_equal = (values[None, :, :] >= chunk).all(axis=2)
+            better = (values[None, :, :] > chunk).any(axis=2)
+            dominated[start:start + cls._PARETO_CHUNK] = (better_or_equal & better).any(axis=1)
+
+        return df.loc[~dominated]
+
+    def _flatten(self, prefix: str, obj: Any, row: dict, types: dict):
+        for item in fields(obj):
+            if item.name.startswith("_"):
+                continue
+
+            value = getattr(obj, item.name)
+            name = prefix + self.SEPARATOR + item.name if prefix else item.name
+            if is_dataclass(value):
+                self._flatten(name, value, row, types)
+            elif isinstance(item.type, list):
+                # [count, amount] pairs such as max_consecutive_wins
+                for (suffix, element, element_type) in zip(self._PAIR_SUFFIXES,
+                                                           value, item.type):
+                    self._add_value(name + self.SEPARATOR + suffix, element,
+                                    element_type, row, types)
+            else:
+                self._add_value(name, value, item.type, row, types)
+
+    def _add_value(self, name: str, value: Any, value_type: type, row: dict, types: dict):
+        if isinstance(value, Enum):
+            (value, value_type) = (value.name, str)
+
+        if value_type not in self._TYPES:
+            return
+
+        if value is not None:
+            value = value_type(value)
+
+        row[name] = value
+        types[name] = self._TYPES[value_type]
+
+    def _open_writer(self) -> Any:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.path.endswith(self.PARQUET_EXT):
+            return pq.ParquetWriter(self.path, self.schema)
+
+        if self.path.endswith(self.ARROW_EXT):
+            return pa.ipc.new_file(self.path, self.schema)
+
+        raise ValueError(f"Unsupported results file: {self.path}")
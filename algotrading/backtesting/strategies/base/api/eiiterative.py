@@ -1,7 +1,7 @@
 """Module of Iterative Base Entity Interface"""
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import ClassVar, Callable
+from typing import AsyncIterator, ClassVar, Callable
 import pandas as pd
 
 from .....common.config import config
@@ -12,7 +12,10 @@ from ....components.order import Order
 from ....components.deal import Deal
 from .....ticker import Ticker, Tick
 from ....components.account import Account
-from .....backtesting import BacktestingReport
+from .....backtesting import BacktestingReport, ProgressReport
+from ....indicators import IndicatorCache
+from ....profiler import Profiler
+from ....progress import ProgressHook
 
 @dataclass
 class EIIterativeBase(ABC):
@@ -27,10 +30,17 @@ class EIIterativeBase(ABC):
     data: pd.DataFrame = field(init=False)
     is_interrupted: bool = field(init=False)
     is_running: bool = field(init=False)
+    runs_started: int = field(init=False)
+    runs_finished: int = field(init=False)
     equity_records: list[dict] = field(init=False)
     report: BacktestingReport = field(init=False)
     tick_count: int = field(init=False)
+    iteration_length: int = field(init=False)
     min_margin_level: float = field(init=False)
+    _exports: dict[str, tuple] = field(init=False, repr=False)
+    indicators: IndicatorCache = field(default=None, kw_only=True)
+    profiler: Profiler = field(default=None, kw_only=True)
+    progress: ProgressHook = field(default=None, kw_only=True)
 
     @abstractmethod
     def __post_init__(self):
@@ -38,10 +48,14 @@ class EIIterativeBase(ABC):
         self.trade = Trade()
         self.is_interrupted = False
         self.is_running = False
+        self.runs_started = 0
+        self.runs_finished = 0
         self.equity_records = []
         self.report = None
         self.tick_count = 0
+        self.iteration_length = 0
         self.min_margin_level = None
+        self._exports = {}
 
     @abstractmethod
     def prepare_data(self):
@@ -55,6 +69,22 @@ class EIIterativeBase(ABC):
     def start(self, length: int, callback: Callable):
         """Start the iteration"""
 
+    @abstractmethod
+    async def start_async(self, length: int, callback: Callable, chunk_size: int=None):
+        """Start the iteration, yielding to the event loop between chunks of ticks"""
+
+    @abstractmethod
+    def get_progress(self) -> ProgressReport:
+        """Return the progress of the iteration"""
+
+    @abstractmethod
+    def get_partial_report(self) -> BacktestingReport:
+        """Return the report of the ticks done so far"""
+
+    @abstractmethod
+    def watch(self, interval: float=0.5) -> AsyncIterator[ProgressReport]:
+        """Yield the progress every interval seconds until the iteration ends"""
+
     @abstractmethod
     def stop(self):
         """Stop the iteration"""
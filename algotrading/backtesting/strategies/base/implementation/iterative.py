@@ -1,7 +1,8 @@
 """Module of IterativeBase Class"""
-import time
+import asyncio
 from abc import ABC
-from typing import Callable
+from contextlib import nullcontext
+from typing import AsyncIterator, Callable, ClassVar, ContextManager
 import numpy as np
 import pandas as pd
 
@@ -11,27 +12,39 @@ from ....components.position import Position
 from ....components.order import Order
 from ....components.deal import Deal
 from .....common.trade import MarginHealth, PositionType
-from .....ticker import Tick
-from .....backtesting import BacktestingReport
+from .....ticker import Tick, TickerValidator
+from .....backtesting import BacktestingReport, ProgressReport
+from ....indicators import IndicatorCache
+from ....progress import SilentProgress
 
 class IterativeBase(EIIterativeBase, ABC):
     """Implementation of EIIterativeBase"""
+    # 24/5 market, 52 weeks of 5 full days, weekends are not trading time
+    TRADING_SECONDS_PER_YEAR: ClassVar[int] = 52 * 5 * 86400
+    ASYNC_CHUNK_SIZE: ClassVar[int] = 1000
+    _EXPORT_CATEGORIES: ClassVar[tuple[str, ...]] = ("symbol", "type", "status", "direction")
+    _EXPORT_FLOATS: ClassVar[tuple[str, ...]] = ("volume", "price", "margin", "profit")
 
     def __post_init__(self):
         """Post initialization"""
         super().__post_init__()
-        self.prepare_data()
+        if self.progress is None:
+            self.progress = SilentProgress()
+        with self._profile("prepare_data"):
+            self.prepare_data()
 
     def prepare_data(self):
         """Prepare data to test"""
-        raw = self.ticker.get_data()
-
-        if raw is None:
+        if self.ticker.data is None:
             return
 
-        raw["returns"] = np.log(raw.mid / raw.mid.shift(1))
-        # raw["creturns"] = raw["returns"].cumsum().apply(np.exp)
-        self.data = raw
+        # indicators are read from the shared cache, the ticker data is never copied
+        if self.indicators is None:
+            self.indicators = IndicatorCache.from_ticker(self.ticker)
+        elif self.indicators.get_length() != self.ticker.get_length():
+            raise ValueError("Indicator cache does not match the ticker data")
+
+        self.data = self.ticker.data
 
     def print_iteration(self, i: int, length: int):
         """Print iteration progress"""
@@ -41,24 +54,141 @@ class IterativeBase(EIIterativeBase, ABC):
     def start(self, length: int, callback: Callable):
         """Start the iteration"""
         self.tick_count = 0
-        if self.is_running or length <= 0:
+        if not self._begin(length):
             return
 
         self.is_running = True
-        last_time = time.time()
+        self.iteration_length = length
+        if self.profiler is not None:
+            self.profiler.start()
+            callback = self._instrument(callback)
+
+        try:
+            with self._profile("iteration"):
+                is_completed = self._iterate(length, callback)
+
+            self._finish(is_completed)
+        finally:
+            # instrumentation and tracing never outlive the run, even a failed one
+            if self.profiler is not None:
+                self.profiler.stop()
+
+    async def start_async(self, length: int, callback: Callable, chunk_size: int=None):
+        """Start the iteration, yielding to the event loop between chunks of ticks"""
+        self.tick_count = 0
+        if not self._begin(length):
+            return
+
+        self.is_running = True
+        self.iteration_length = length
+        if self.profiler is not None:
+            self.profiler.start()
+            callback = self._instrument(callback)
+
+        try:
+            with self._profile("iteration"):
+                is_completed = await self._iterate_async(length, callback,
+                                                         chunk_size or self.ASYNC_CHUNK_SIZE)
+        except asyncio.CancelledError:
+            # report on the ticks done so far, like an interrupted run
+            self._finish(False)
+            raise
+        else:
+            self._finish(is_completed)
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
+
+    def get_progress(self) -> ProgressReport:
+        """Return the progress of the iteration"""
+        equity = self.equity_records[-1]["equity"] if self.equity_records else self.balance()
+        return ProgressReport(ticks=self.tick_count, length=self.iteration_length,
+                              balance=self.balance(), equity=equity,
+                              open_positions=len(self.trade.get_all_open_position()),
+                              is_running=self.is_running)
+
+    def get_partial_report(self) -> BacktestingReport:
+        """Return the report of the ticks done so far"""
+        self.populate_report()
+        return self.report
+
+    async def watch(self, interval: float=0.5) -> AsyncIterator[ProgressReport]:
+        """Yield the progress every interval seconds until the running iteration,
+        or the next one, ends. An iteration not started after the first interval
+        is not waited for"""
+        run = self.runs_started if self.is_running else self.runs_started + 1
+        waited = False
+        while True:
+            progress = self.get_progress()
+            yield progress
+            if self.runs_finished >= run or (waited and self.runs_started < run):
+                return
+
+            await asyncio.sleep(interval)
+            waited = True
+
+    def _begin(self, length: int) -> bool:
+        """Count a new run, return false if there is nothing to iterate"""
+        if self.is_running:
+            return False
+
+        self.runs_started += 1
+        if length <= 0:
+            self.runs_finished = self.runs_started
+            return False
+
+        return True
+
+    def _finish(self, is_completed: bool):
+        """Populate the report once the iteration ended"""
+        self.is_running = False
+        self.runs_finished = self.runs_started
+        self.progress.on_finish(self.get_progress())
+
+        with self._profile("report"):
+            self.populate_report()
+
+        if self.profiler is not None:
+            self.report.profile = self.profiler.finish(self._profile_sizes())
+
+    def _iterate(self, length: int, callback: Callable) -> bool:
+        """Iterate over the ticks in strides and return false if interrupted"""
+        self.progress.on_start(self.get_progress())
+        stride = self.progress.stride or length
+        margin_health = MarginHealth.OK
+        for start in range(0, length - 1, stride):
+            end = min(start + stride, length - 1)
+            margin_health = self._iterate_chunk(start, end, callback)
+            if margin_health is None or margin_health == MarginHealth.STOP_OUT:
+                break
+
+            self._notify_progress(start, end)
+
+        return self._iterate_last(length, margin_health)
+
+    async def _iterate_async(self, length: int, callback: Callable, chunk_size: int) -> bool:
+        """Iterate over the ticks in chunks and return false if interrupted"""
+        self.progress.on_start(self.get_progress())
         margin_health = MarginHealth.OK
-        self.print_iteration(0, length)
-        for i in range(length - 1):
+        for start in range(0, length - 1, chunk_size):
+            end = min(start + chunk_size, length - 1)
+            margin_health = self._iterate_chunk(start, end, callback)
+            if margin_health is None or margin_health == MarginHealth.STOP_OUT:
+                break
+
+            self._notify_progress(start, end)
+            await asyncio.sleep(0)
+
+        return self._iterate_last(length, margin_health)
+
+    def _iterate_chunk(self, start: int, end: int, callback: Callable) -> MarginHealth:
+        """Iterate over the ticks from start to end (excluded),
+        return the last margin health or None if interrupted"""
+        margin_health = MarginHealth.OK
+        for i in range(start, end):
             if self.is_interrupted:
                 self.is_interrupted = False
-                self.is_running = False
-                self.populate_report()
-                return
-
-            # print every second
-            if time.time() - last_time >= 0.5:
-                last_time = time.time()
-                self.print_iteration(i+1, length)
+                return None
 
             self.tick_count += 1
             callback(i)
@@ -72,7 +202,19 @@ class IterativeBase(EIIterativeBase, ABC):
                 # self.print_account_info(tick)
                 break
 
-        # close all position on the last tick
+        return margin_health
+
+    def _notify_progress(self, start: int, end: int):
+        """Notify the progress hook when the chunk crossed a stride"""
+        stride = self.progress.stride
+        if stride > 0 and end // stride > start // stride:
+            self.progress.on_progress(self.get_progress())
+
+    def _iterate_last(self, length: int, margin_health: MarginHealth) -> bool:
+        """Close all position on the last tick and return false if interrupted"""
+        if margin_health is None:
+            return False
+
         self.tick_count += 1
         if margin_health != MarginHealth.STOP_OUT:
             last_index = length - 1
@@ -82,9 +224,45 @@ class IterativeBase(EIIterativeBase, ABC):
             self.record_equity(last_tick)
             # self.print_account_info(last_tick)
 
-        self.is_running = False
-        self.print_iteration(length, length)
-        self.populate_report()
+        return True
+
+    def _export(self, name: str, items: Callable[[], list]) -> pd.DataFrame:
+        # built once per trade generation, every call gets its own copy of the frame
+        cached = self._exports.get(name)
+        if (cached is None or cached[0] is not self.trade
+                or cached[1] != self.trade.generation):
+            df = pd.DataFrame([item.as_dict() for item in items()])
+            dtypes = {column: "category" for column in self._EXPORT_CATEGORIES
+                      if column in df.columns}
+            dtypes.update({column: np.float64 for column in self._EXPORT_FLOATS
+                           if column in df.columns})
+            cached = (self.trade, self.trade.generation, df.astype(dtypes).set_index("id"))
+            self._exports[name] = cached
+
+        return cached[2].copy()
+
+    def _profile(self, phase: str) -> ContextManager:
+        """Return the profiled phase context, or a no-op without profiler"""
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.phase(phase)
+
+    def _instrument(self, callback: Callable) -> Callable:
+        """Count the hot methods and profile the per tick phases"""
+        self.profiler.count(self.ticker, "get_data", "Ticker.get_data")
+        self.profiler.count(self.trade, "floating_profit", "Trade.floating_profit")
+        self.profiler.count(self, "margin_health", "IterativeBase.margin_health")
+        self.profiler.time(self, "record_equity")
+        return self.profiler.wrap(callback, "on_tick")
+
+    def _profile_sizes(self) -> dict[str, int]:
+        """Return the size of the data and records kept by the run"""
+        return {"data_bytes": int(self.data.memory_usage(deep=True).sum()),
+                "indicator_bytes": self.indicators.bases.nbytes,
+                "equity_records": len(self.equity_records),
+                "positions": len(self.trade.positions),
+                "ledger_records": len(self.account.ledger)}
 
     def stop(self):
         """Stop the iteration"""
@@ -219,7 +397,9 @@ class IterativeBase(EIIterativeBase, ABC):
         if self.data is None:
             return None
 
-        return self.data.copy()
+        df = self.data.copy()
+        df["returns"] = self.indicators.get_returns()
+        return df
 
     def get_positions(self, as_data_frame: bool=True) -> list[Position] | pd.DataFrame:
         """Return list of position"""
@@ -227,8 +407,7 @@ class IterativeBase(EIIterativeBase, ABC):
             return None
 
         if as_data_frame:
-            return pd.DataFrame([pos.as_dict()
-                                 for pos in self.trade.get_positions()]).set_index("id")
+            return self._export("positions", self.trade.get_positions)
         else:
             return self.trade.get_positions().copy()
 
@@ -238,10 +417,9 @@ class IterativeBase(EIIterativeBase, ABC):
             return None
 
         if as_data_frame:
-            return pd.DataFrame([order.as_dict()
-                                 for order in self.trade.get_orders()]).set_index("id")
+            return self._export("orders", self.trade.get_orders)
         else:
-            return self.trade.get_orders().copy()
+            return self.trade.get_orders()
 
     def get_deals(self, as_data_frame: bool=True) -> list[Deal] | pd.DataFrame:
         """Return list of deal"""
@@ -249,10 +427,9 @@ class IterativeBase(EIIterativeBase, ABC):
             return None
 
         if as_data_frame:
-            return pd.DataFrame([deal.as_dict()
-                                 for deal in self.trade.get_deals()]).set_index("id")
+            return self._export("deals", self.trade.get_deals)
         else:
-            return self.trade.get_deals().copy()
+            return self.trade.get_deals()
 
     def get_equity_records(self) -> pd.DataFrame:
         """Return equity and balance history"""
@@ -304,6 +481,8 @@ class IterativeBase(EIIterativeBase, ABC):
         """Populate report data"""
         trade = self.trade.get_report()
         report = BacktestingReport()
+        # identifies the exact data of the run, hashed once per ticker
+        report.fingerprint = self.ticker.get_fingerprint()
 
         report.summary.ticks = self.tick_count
         report.summary.initial_balance = self.account.initial_balance
@@ -312,7 +491,8 @@ class IterativeBase(EIIterativeBase, ABC):
         report.summary.gross_profit = trade.gross_profit
         report.summary.gross_loss = trade.gross_loss
 
-        self.calculate_drawdown(report)
+        equity_arrays = self.get_equity_arrays()
+        self.calculate_drawdown(report, equity_arrays)
 
         report.measurement.profit_factor = trade.gross_profit / \
             abs(trade.gross_loss) if trade.gross_loss != 0 else 0
@@ -347,52 +527,90 @@ class IterativeBase(EIIterativeBase, ABC):
         report.trade.avg_consecutive_wins = trade.avg_consecutive_wins
         report.trade.avg_consecutive_losses = trade.avg_consecutive_losses
 
+        self.calculate_risk(report, equity_arrays)
         self.report = report
 
-    def calculate_drawdown(self, report: BacktestingReport):
-        """Calculate balance and equity drawdown"""
-        initial = {"balance": self.account.initial_balance,
-                   "equity": self.account.initial_balance}
-        lowest = initial.copy()
-        highest = initial.copy()
-        current_drawdown = {"balance": 0, "equity": 0}
-        max_drawdown = current_drawdown.copy()
-
-        for record in self.equity_records:
-            if record["balance"] > highest["balance"]:
-                highest["balance"] = record["balance"]
+    def get_equity_arrays(self) -> dict[str, np.ndarray]:
+        """Return time (UTC nanoseconds), balance, equity and margin used history
+        as arrays, one record per time"""
+        columns = ("balance", "equity", "marginUsed")
+        df = pd.DataFrame.from_records(self.equity_records, columns=["datetime", *columns])
+        arrays = {column: df[column].to_numpy(dtype=np.float64) for column in columns}
+        arrays["time"] = pd.DatetimeIndex(df["datetime"]).as_unit("ns").asi8
 
-            if record["balance"] < lowest["balance"]:
-                lowest["balance"] = record["balance"]
+        # a stop out records the tick again once the positions are closed, the last is kept
+        keep = np.r_[arrays["time"][1:] != arrays["time"][:-1], True]
+        if not keep.all():
+            arrays = {column: values[keep] for (column, values) in arrays.items()}
 
-            if record["equity"] > highest["equity"]:
-                highest["equity"] = record["equity"]
+        return arrays
 
-            if record["equity"] < lowest["equity"]:
-                lowest["equity"] = record["equity"]
-
-            current_drawdown["balance"] = highest["balance"] - \
-                record["balance"]
-            current_drawdown["equity"] = highest["equity"] - \
-                record["equity"]
-
-            if current_drawdown["balance"] > max_drawdown["balance"]:
-                max_drawdown["balance"] = current_drawdown["balance"]
-
-            if current_drawdown["equity"] > max_drawdown["equity"]:
-                max_drawdown["equity"] = current_drawdown["equity"]
-
-            report.balance_drawdown.abs = initial["balance"] - \
-                lowest["balance"]
-            report.balance_drawdown.max = max_drawdown["balance"]
-            report.balance_drawdown.rel = max_drawdown["balance"] / \
-                highest["balance"] * 100
+    def calculate_drawdown(self, report: BacktestingReport,
+                           equity_arrays: dict[str, np.ndarray]=None):
+        """Calculate balance and equity drawdown"""
+        if equity_arrays is None:
+            equity_arrays = self.get_equity_arrays()
+
+        initial = self.account.initial_balance
+        for (column, drawdown) in (("balance", report.balance_drawdown),
+                                   ("equity", report.equity_drawdown)):
+            values = equity_arrays[column]
+            if len(values) == 0:
+                continue
+
+            highest = np.maximum.accumulate(np.maximum(values, initial))
+            drawdown.abs = initial - min(initial, values.min())
+            drawdown.max = max(0, (highest - values).max())
+            drawdown.rel = drawdown.max / highest[-1] * 100
+
+    def calculate_risk(self, report: BacktestingReport,
+                       equity_arrays: dict[str, np.ndarray]=None):
+        """Calculate risk adjusted ratios, exposure and distribution of the returns"""
+        if equity_arrays is None:
+            equity_arrays = self.get_equity_arrays()
+
+        risk = report.risk
+        equity = equity_arrays["equity"]
+        if len(equity) < 2 or (equity <= 0).any():
+            return
 
-            report.equity_drawdown.abs = initial["equity"] - \
-                lowest["equity"]
-            report.equity_drawdown.max = max_drawdown["equity"]
-            report.equity_drawdown.rel = max_drawdown["equity"] / \
-                highest["equity"] * 100
+        returns = equity[1:] / equity[:-1] - 1
+        # annualized from the elapsed trading time, whatever the gaps between records
+        deltas = np.diff(TickerValidator.to_trading_time(equity_arrays["time"]))
+        trading_time = deltas.sum()
+        elapsed = trading_time / pow(10, 9) if trading_time > 0 else \
+            len(returns) * self.ticker.timeframe.value.seconds
+        periods_per_year = len(returns) * self.TRADING_SECONDS_PER_YEAR / elapsed
+        mean = returns.mean()
+        std = returns.std()
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        drawdown = 1 - equity / np.maximum.accumulate(equity)
+        annual_return = (equity[-1] / equity[0]) ** (periods_per_year / len(returns)) - 1
+
+        risk.returns_mean = mean
+        risk.returns_std = std
+        if std > 0:
+            centered = (returns - mean) / std
+            risk.returns_skewness = np.mean(centered ** 3)
+            risk.returns_kurtosis = np.mean(centered ** 4) - 3
+            risk.sharpe_ratio = mean / std * np.sqrt(periods_per_year)
+        if downside > 0:
+            risk.sortino_ratio = mean / downside * np.sqrt(periods_per_year)
+        if drawdown.max() > 0:
+            risk.calmar_ratio = annual_return / drawdown.max()
+
+        risk.ulcer_index = np.sqrt(np.mean((drawdown * 100) ** 2))
+        # each record holds its margin until the next one, weighted by trading time
+        exposed = equity_arrays["marginUsed"][:-1] > 0
+        risk.exposure_time = deltas[exposed].sum() / trading_time * 100 if trading_time > 0 \
+            else np.mean(exposed) * 100
+
+        closed = [(pos.open_datetime, pos.close_datetime)
+                  for pos in self.trade.get_positions() if pos.close_datetime is not None]
+        if closed:
+            (opens, closes) = zip(*closed)
+            holding = pd.DatetimeIndex(closes) - pd.DatetimeIndex(opens)
+            risk.average_holding_time = holding.total_seconds().to_numpy().mean()
 
     def get_report(self, do_print: bool=False):
         """Return report data"""
@@ -421,7 +639,20 @@ class IterativeBase(EIIterativeBase, ABC):
                   f"    ◦ Recovery Factor: {round(rep.measurement.recovery_factor, 2)}{lf}"
                   f"    ◦ Expected Payoff: {round(rep.measurement.expected_payoff, 2)}{lf}"
                   f"    ◦ Margin Level: {round(rep.measurement.margin_level, 2)}{lf}"
-                  f"4. Trade{lf}"
+                  f"4. Risk{lf}"
+                  f"    ◦ Sharpe Ratio: {round(rep.risk.sharpe_ratio, 2)}, "
+                  f"Sortino Ratio: {round(rep.risk.sortino_ratio, 2)}, "
+                  f"Calmar Ratio: {round(rep.risk.calmar_ratio, 2)}{lf}"
+                  f"    ◦ Ulcer Index: {round(rep.risk.ulcer_index, 2)}{lf}"
+                  f"    ◦ Exposure Time: {round(rep.risk.exposure_time, 2)}%{lf}"
+                  f"    ◦ Average Holding Time: "
+                  f"{pd.Timedelta(seconds=round(rep.risk.average_holding_time))}{lf}"
+                  f"    ◦ Returns:{lf}"
+                  f"       ◦ Mean: {rep.risk.returns_mean:.3e}, "
+                  f"Std: {rep.risk.returns_std:.3e}, "
+                  f"Skewness: {round(rep.risk.returns_skewness, 2)}, "
+                  f"Kurtosis: {round(rep.risk.returns_kurtosis, 2)}{lf}"
+                  f"5. Trade{lf}"
                   f"    ◦ All Position:{lf}"
                   f"       ◦ Total: {rep.trade.all_position.total}, "
                   f"Won: {rep.trade.all_position.won}, "
@@ -16,6 +16,13 @@ class BuyAndHoldStrategy(IterativeBase):
 
         super().start(len(self.data.index), self.on_tick)
 
+    async def run_async(self, chunk_size: int=None):
+        """Start backtesting on the running event loop"""
+        if self.data is None:
+            return
+
+        await super().start_async(len(self.data.index), self.on_tick, chunk_size)
+
     def on_tick(self, i: int):
         """on each tick"""
         if i > 0:
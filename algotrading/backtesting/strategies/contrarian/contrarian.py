@@ -1,6 +1,7 @@
 """Module of Contrarian Strategy Class"""
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 
 from ..base.implementation import IterativeBase
@@ -13,20 +14,31 @@ class ContrarianStrategy(IterativeBase):
     """Implementation of Contrarian Strategy"""
     params: ContrarianParams
     buyandhold: Optional[BuyAndHoldStrategy] = None
+    rolling_returns: np.ndarray = field(init=False, default=None)
 
     def run(self):
         """Start backtesting"""
         if self.data is None:
             return
 
-        self.data["rolling_returns"] = self.data["returns"].rolling(
-            self.params.window).mean()
+        self.rolling_returns = self.indicators.get_rolling_returns(self.params.window)
 
         super().start(len(self.data.index), self.on_tick)
 
         if self.buyandhold:
             self.buyandhold.run()
 
+    async def run_async(self, chunk_size: int=None):
+        """Start backtesting on the running event loop"""
+        if self.data is None:
+            return
+
+        self.rolling_returns = self.indicators.get_rolling_returns(self.params.window)
+        await super().start_async(len(self.data.index), self.on_tick, chunk_size)
+
+        if self.buyandhold:
+            await self.buyandhold.run_async(chunk_size)
+
     def stop(self):
         """Stop Backtesting"""
         super().stop()
@@ -39,18 +51,27 @@ class ContrarianStrategy(IterativeBase):
         tick = self.ticker.get_data(datetime = self.data.index[i])
 
         pos = self.get_last_open_position()
-        if self.data["rolling_returns"].iloc[i] < 0:
+        if self.rolling_returns[i] < 0:
             if pos is None:
                 self.long_buy(tick, self.params.volume)
             elif pos.type == PositionType.SHORT_SELL:
                 self.close_position(pos.id, tick)
 
-        elif self.data["rolling_returns"].iloc[i] > 0:
+        elif self.rolling_returns[i] > 0:
             if pos is None:
                 self.short_sell(tick, self.params.volume)
             elif pos.type == PositionType.LONG_BUY:
                 self.close_position(pos.id, tick)
 
+    def get_data(self) -> pd.DataFrame:
+        """Return data"""
+        df = super().get_data()
+        if df is None:
+            return None
+
+        df["rolling_returns"] = self.indicators.get_rolling_returns(self.params.window)
+        return df
+
     def get_equity_records(self) -> pd.DataFrame:
         """Return equity and balance history"""
         df_equity = super().get_equity_records()
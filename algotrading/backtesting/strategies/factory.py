@@ -7,6 +7,9 @@ from .buyandhold import BuyAndHoldStrategy
 from .contrarian import ContrarianStrategy
 from ...providers import ProviderFactory
 from ..components.account import Account
+from ..indicators import IndicatorCache
+from ..profiler import Profiler
+from ..progress import ProgressHook
 from . import BuyAndHoldParams, ContrarianParams
 
 class StrategyFactory():
@@ -14,29 +17,43 @@ class StrategyFactory():
     PROVIDER_OANDA: ClassVar[str] = ProviderFactory.OANDA
 
     @staticmethod
-    def create_buyandhold(ticker: Ticker, params: BuyAndHoldParams) -> BuyAndHoldStrategy:
+    def create_buyandhold(ticker: Ticker, params: BuyAndHoldParams,
+                          indicators: IndicatorCache=None,
+                          profiler: Profiler=None,
+                          progress: ProgressHook=None) -> BuyAndHoldStrategy:
         """Return new buyandhold strategy object"""
         if ticker is None or ticker.get_length() <= 0:
             return None
 
         account = Account(ticker.get_data(0).datetime, params.balance)
 
-        return BuyAndHoldStrategy(ticker, account, params)
+        return BuyAndHoldStrategy(ticker, account, params, indicators=indicators,
+                                  profiler=profiler, progress=progress)
 
     @staticmethod
     def create_contrarian(ticker: Ticker,
                              params: ContrarianParams,
-                             include_buyandhold: bool=True) -> ContrarianStrategy:
-        """Return new contrarian strategy object"""
+                             include_buyandhold: bool=True,
+                             indicators: IndicatorCache=None,
+                             profiler: Profiler=None,
+                             progress: ProgressHook=None) -> ContrarianStrategy:
+        """Return new contrarian strategy object, pass the same indicator cache
+        to every candidate of a parameter sweep to compute the bases only once"""
         if ticker is None or ticker.get_length() <= 0:
             return None
 
         account = Account(ticker.get_data(0).datetime, params.balance)
+        if indicators is None:
+            indicators = IndicatorCache.from_ticker(ticker)
 
         if include_buyandhold:
             return ContrarianStrategy(ticker, account, params,
                                       BuyAndHoldStrategy(
                                           copy.deepcopy(ticker),
-                                          copy.deepcopy(account), params))
+                                          copy.deepcopy(account), params,
+                                          indicators=indicators),
+                                      indicators=indicators, profiler=profiler,
+                                      progress=progress)
         else:
-            return ContrarianStrategy(ticker, account, params)
+            return ContrarianStrategy(ticker, account, params, indicators=indicators,
+                                      profiler=profiler, progress=progress)
@@ -44,8 +44,13 @@ class Config:
         )
 
         data_manager = DataManagerConfigData(
-            data_directory    = parser['data_manager']['data_directory'],
-            file_extension    = parser['data_manager']['file_extension']
+            data_directory      = parser['data_manager']['data_directory'],
+            file_extension      = parser['data_manager']['file_extension'],
+            chunk_size          = int(parser['data_manager']['chunk_size']),
+            memory_budget_mb    = int(parser['data_manager']['memory_budget_mb']),
+            store_directory     = parser['data_manager']['store_directory'],
+            partition_directory = parser['data_manager']['partition_directory'],
+            cache_budget_mb     = int(parser['data_manager']['cache_budget_mb'])
         )
 
         provider = ProviderConfigData(
@@ -15,6 +15,11 @@ class DataManagerConfigData:
     """Data Manager config data definition"""
     data_directory: str
     file_extension: str
+    chunk_size: int
+    memory_budget_mb: int
+    store_directory: str
+    partition_directory: str
+    cache_budget_mb: int
 
 @dataclass(frozen=True)
 class ProviderConfigData:
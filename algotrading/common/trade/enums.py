@@ -2,18 +2,19 @@
 from enum import Enum
 from collections import namedtuple
 
-TimeframeTuple = namedtuple('Timeframe', ['id', 'granularity', 'resample', 'description'])
+TimeframeTuple = namedtuple('Timeframe', ['id', 'granularity', 'resample',
+                                           'description', 'seconds'])
 
 class Timeframe(Enum):
     """List of available timeframe"""
-    SECOND_5  = TimeframeTuple(0, "S5", "5S",  "5 Seconds")
-    SECOND_15 = TimeframeTuple(1, "S15", "15S", "15 Seconds")
-    SECOND_30 = TimeframeTuple(2, "S30", "30S", "30 Seconds")
-    MINUTE_1  = TimeframeTuple(3, "M1", "1T",  "1 Minute")
-    MINUTE_15 = TimeframeTuple(4, "M15", "15T", "15 Minutes")
-    HOUR_1    = TimeframeTuple(5, "H1", "1H",  "1 Hour")
-    HOUR_4    = TimeframeTuple(6, "H4", "4H",  "4 Hours")
-    DAY_1     = TimeframeTuple(7, "D", "1D",  "1 Day")
+    SECOND_5  = TimeframeTuple(0, "S5", "5S",  "5 Seconds", 5)
+    SECOND_15 = TimeframeTuple(1, "S15", "15S", "15 Seconds", 15)
+    SECOND_30 = TimeframeTuple(2, "S30", "30S", "30 Seconds", 30)
+    MINUTE_1  = TimeframeTuple(3, "M1", "1T",  "1 Minute", 60)
+    MINUTE_15 = TimeframeTuple(4, "M15", "15T", "15 Minutes", 900)
+    HOUR_1    = TimeframeTuple(5, "H1", "1H",  "1 Hour", 3600)
+    HOUR_4    = TimeframeTuple(6, "H4", "4H",  "4 Hours", 14400)
+    DAY_1     = TimeframeTuple(7, "D", "1D",  "1 Day", 86400)
 
 class TransactionType(Enum):
     """List of transaction type in Account"""
@@ -1,2 +1,4 @@
 """Initialize package"""
+from .catalog import Catalog
+from .lock import FileLock
 from .manager import DataManager
@@ -0,0 +1,171 @@
+"""Module of Catalog Class"""
+from dataclasses import dataclass, field
+from typing import ClassVar
+import hashlib
+import os
+import sqlite3
+import threading
+import pandas as pd
+
+@dataclass
+class Catalog():
+    """Catalog Class
+
+    SQLite index of the files of a data directory with their size, row count,
+    checksum, content fingerprint, time range, parsed metadata and latest
+    validation. The directory
+    is listed again only when its modification time moved, and only the
+    entries of files whose size or modification time changed are updated.
+    The generation is incremented on every change so callers can tell when
+    their listing is stale.
+    """
+    FILENAME: ClassVar[str] = ".catalog.sqlite"
+    METADATA: ClassVar[tuple[str, ...]] = ("provider", "symbol", "timeframe", "start", "end")
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS files (
+            name TEXT PRIMARY KEY, ext TEXT, size INTEGER, mtime INTEGER,
+            rows INTEGER, checksum TEXT, first TEXT, last TEXT,
+            parsed INTEGER DEFAULT 0, provider TEXT, symbol TEXT, timeframe TEXT,
+            start TEXT, end TEXT, fingerprint TEXT);
+        CREATE TABLE IF NOT EXISTS validations (
+            name TEXT PRIMARY KEY, checked TEXT, rows INTEGER, duplicates INTEGER,
+            unsorted INTEGER, crossed INTEGER, invalid_prices INTEGER,
+            negative_spreads INTEGER, huge_spreads INTEGER, gaps INTEGER,
+            largest_gap REAL);
+    """
+
+    directory: str
+    generation: int = field(init=False, default=0)
+    _directory_mtime: int = field(init=False, default=None, repr=False)
+    _connection: sqlite3.Connection = field(init=False, default=None, repr=False)
+    _lock: threading.RLock = field(init=False, default_factory=threading.RLock, repr=False)
+
+    def __post_init__(self):
+        """Post initialization"""
+        os.makedirs(self.directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.directory + self.FILENAME,
+                                           check_same_thread=False)
+        # a persistent journal keeps the directory listing, and its mtime, unchanged
+        self._connection.execute("PRAGMA journal_mode = PERSIST")
+        with self._connection:
+            self._connection.executescript(self._SCHEMA)
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(files)")]
+            if "fingerprint" not in columns:
+                self._connection.execute("ALTER TABLE files ADD COLUMN fingerprint TEXT")
+
+    def refresh(self, force: bool=False) -> bool:
+        """Update the catalog from the directory, return true if anything changed"""
+        with self._lock:
+            mtime = os.stat(self.directory).st_mtime_ns
+            if not force and mtime == self._directory_mtime:
+                return False
+
+            stats = {entry.name: entry.stat() for entry in os.scandir(self.directory)
+                     if entry.is_file() and not entry.name.startswith(".")}
+            known = dict(((name, (size, file_mtime)) for (name, size, file_mtime) in
+                          self._connection.execute("SELECT name, size, mtime FROM files")))
+
+            changed = [(name, os.path.splitext(name)[1], stat.st_size, stat.st_mtime_ns)
+                       for (name, stat) in stats.items()
+                       if known.get(name) != (stat.st_size, stat.st_mtime_ns)]
+            removed = [(name,) for name in known if name not in stats]
+
+            with self._connection:
+                # contents of changed files are unknown until written or inspected again
+                self._connection.executemany(
+                    "INSERT INTO files (name, ext, size, mtime) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET size = excluded.size, "
+                    "mtime = excluded.mtime, rows = NULL, checksum = NULL, "
+                    "first = NULL, last = NULL, fingerprint = NULL", changed)
+                self._connection.executemany("DELETE FROM files WHERE name = ?", removed)
+                self._connection.executemany("DELETE FROM validations WHERE name = ?",
+                                             [(name,) for (name, *_) in changed] + removed)
+
+            # entries may also have been written by another process
+            self._directory_mtime = mtime
+            self.generation += 1
+            return True
+
+    def get(self, name: str) -> dict | None:
+        """Return the catalog entry of the file"""
+        with self._lock:
+            cursor = self._connection.execute("SELECT * FROM files WHERE name = ?", (name,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+
+            return dict(zip([column[0] for column in cursor.description], row))
+
+    def find(self) -> pd.DataFrame:
+        """Return every catalog entry"""
+        with self._lock:
+            return pd.read_sql_query("SELECT * FROM files ORDER BY name", self._connection)
+
+    def put(self, name: str, rows: int=None, first: str=None, last: str=None,
+            checksum: str=None, fingerprint: str=None):
+        """Add or replace the entry of a file just written"""
+        stat = os.stat(self.directory + name)
+        if checksum is None:
+            checksum = self.compute_checksum(self.directory + name)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO files (name, ext, size, mtime, rows, checksum, first, last, "
+                "fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (name) DO UPDATE "
+                "SET size = excluded.size, mtime = excluded.mtime, rows = excluded.rows, "
+                "checksum = excluded.checksum, first = excluded.first, last = excluded.last, "
+                "fingerprint = excluded.fingerprint",
+                (name, os.path.splitext(name)[1], stat.st_size, stat.st_mtime_ns,
+                 rows, checksum, first, last, fingerprint))
+            self._connection.execute("DELETE FROM validations WHERE name = ?", (name,))
+            self.generation += 1
+
+    def delete(self, name: str):
+        """Remove the entry of a file"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM files WHERE name = ?", (name,))
+            self._connection.execute("DELETE FROM validations WHERE name = ?", (name,))
+            self.generation += 1
+
+    def get_metadata(self) -> dict[str, tuple]:
+        """Return the parsed metadata of the files, by name"""
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT name, {', '.join(self.METADATA)} FROM files WHERE parsed = 1")
+            return {row[0]: row[1:] for row in cursor}
+
+    def set_metadata(self, metadata: dict[str, tuple]):
+        """Keep the parsed metadata of the files, a tuple of None when not applicable"""
+        if not metadata:
+            return
+
+        assignments = ", ".join(f"{column} = ?" for column in self.METADATA)
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"UPDATE files SET parsed = 1, {assignments} WHERE name = ?",
+                [(*values, name) for (name, values) in metadata.items()])
+
+    def get_validations(self) -> pd.DataFrame:
+        """Return the latest validation of the files"""
+        with self._lock:
+            return pd.read_sql_query("SELECT * FROM validations ORDER BY name",
+                                     self._connection)
+
+    def set_validation(self, name: str, checked: str, result: dict):
+        """Keep the validation counts of the file, dropped when the file changes"""
+        columns = ["name", "checked", *result]
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO validations ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})", (name, checked, *result.values()))
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    @classmethod
+    def compute_checksum(cls, path: str) -> str:
+        """Return the blake2b checksum of the file"""
+        with open(path, "rb") as file:
+            return hashlib.file_digest(file, "blake2b").hexdigest()
@@ -0,0 +1,88 @@
+"""Module of File Lock Class"""
+from dataclasses import dataclass, field
+from typing import ClassVar, Self
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+@dataclass
+class FileLock():
+    """File Lock Class
+
+    Exclusive advisory lock on a lock file, shared by processes and threads
+    (flock on posix, msvcrt on windows). The system releases the lock when the
+    holder exits, a crashed writer never leaves a file locked. Without timeout
+    acquire waits as long as needed, else TimeoutError is raised.
+    """
+    _POLL_INTERVAL: ClassVar[float] = 0.05
+
+    path: str
+    timeout: float = None
+    _fd: int = field(init=False, default=None, repr=False)
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self):
+        """Wait for the lock and hold it"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock(fd, blocking=deadline is None)
+                break
+            except OSError as exp:
+                if deadline is None or time.monotonic() >= deadline:
+                    os.close(fd)
+                    if deadline is None:
+                        raise
+                    raise TimeoutError(f"Lock not acquired in {self.timeout}s: "
+                                       f"{self.path}") from exp
+                time.sleep(self._POLL_INTERVAL)
+
+        self._fd = fd
+
+    def release(self):
+        """Release the lock"""
+        if self._fd is None:
+            return
+
+        (fd, self._fd) = (self._fd, None)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def is_locked(self) -> bool:
+        """Return true if the lock is held by this instance"""
+        return self._fd is not None
+
+    @classmethod
+    def _lock(cls, fd: int, blocking: bool):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+
+        # msvcrt only gives up after about 10s, the lock is polled instead
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if not blocking:
+                    raise
+                time.sleep(cls._POLL_INTERVAL)
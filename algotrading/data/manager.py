@@ -1,39 +1,71 @@
 """Module of Data Manager Class"""
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Callable, ClassVar, Iterator
 import os
+import threading
+import time
 import pandas as pd
 
 from ..common.config import config
+from .catalog import Catalog
+from .lock import FileLock
+from .storage import StorageFactory
 
 @dataclass
 class DataManager():
     """File Manager Class"""
     _DATA: ClassVar[pd.DataFrame] = None
+    _GENERATION: ClassVar[tuple[str, int]] = None
+    _CATALOGS: ClassVar[dict[str, Catalog]] = {}
+    _LOCK: ClassVar[threading.RLock] = threading.RLock()
+    _HELD: ClassVar[threading.local] = threading.local()
+    _HIDDEN_PREFIX: ClassVar[str] = "."
+    _LOCK_EXT: ClassVar[str] = ".lock"
+    _TEMP_EXT: ClassVar[str] = ".tmp"
     _NAME: ClassVar[str] = "NAME"
     _EXT: ClassVar[str] = "EXT"
     _SIZE: ClassVar[float] = "SIZE (KB)"
+    _ROWS: ClassVar[str] = "ROWS"
+    _FIRST: ClassVar[str] = "FIRST"
+    _LAST: ClassVar[str] = "LAST"
+    _CHECKSUM: ClassVar[str] = "CHECKSUM"
+    _FINGERPRINT: ClassVar[str] = "FINGERPRINT"
+    _TARGET: ClassVar[str] = "TARGET"
+    _TARGET_SIZE: ClassVar[str] = "TARGET SIZE (KB)"
+    _READ_TIME: ClassVar[str] = "READ TIME (S)"
+    _TARGET_READ_TIME: ClassVar[str] = "TARGET READ TIME (S)"
 
     DATA_DIR: ClassVar[str] = config.data_manager.data_directory
     FILE_EXT: ClassVar[str] = config.data_manager.file_extension
 
+    RAISE: ClassVar[str] = "raise"
+    SKIP: ClassVar[str] = "skip"
+    REPLACE: ClassVar[str] = "replace"
+    IF_EXISTS: ClassVar[tuple[str, ...]] = (RAISE, SKIP, REPLACE)
+
     @classmethod
     def find(cls, name: str=None,
                   ext: str=None, reload: bool=False) -> pd.DataFrame:
-        """Return list of file"""
-        if cls._DATA is None or reload:
-            data = []
-            if not os.path.exists(cls.DATA_DIR):
-                os.mkdir(cls.DATA_DIR)
-
-            for file in sorted(os.listdir(cls.DATA_DIR)):
-                basename = os.path.basename(file)
-                size = round(os.path.getsize(cls.DATA_DIR + file) / (pow(1024, 1)), 2)
-                data.append((basename, os.path.splitext(basename)[1], size))
-
-            cls._DATA = pd.DataFrame(data, columns=[cls._NAME, cls._EXT, cls._SIZE])
-
-        df = cls._DATA.copy()
+        """Return list of file, reload checks every file instead of the directory"""
+        with cls._LOCK:
+            catalog = cls.get_catalog()
+            catalog.refresh(force=reload)
+            if cls._DATA is None or cls._GENERATION != (cls.DATA_DIR, catalog.generation):
+                data = catalog.find()
+                cls._DATA = pd.DataFrame({
+                    cls._NAME: data["name"],
+                    cls._EXT: data["ext"],
+                    cls._SIZE: (data["size"].astype(float) / (pow(1024, 1))).round(2),
+                    cls._ROWS: data["rows"].astype("Int64"),
+                    cls._FIRST: data["first"],
+                    cls._LAST: data["last"],
+                    cls._CHECKSUM: data["checksum"],
+                    cls._FINGERPRINT: data["fingerprint"]
+                })
+                cls._GENERATION = (cls.DATA_DIR, catalog.generation)
+
+            df = cls._DATA.copy()
 
         if name is not None:
             df = df[df[cls._NAME].str.contains(name, case=False)]
@@ -46,47 +78,161 @@ class DataManager():
     @classmethod
     def exist(cls, name: str, reload: bool=False) -> bool:
         """Return true if file exist"""
-        df = cls.find(reload=reload)
-        df = df[df[cls._NAME] == name]
+        catalog = cls.get_catalog()
+        catalog.refresh(force=reload)
+        return catalog.get(name) is not None
 
-        if df is None or df.empty:
-            return False
+    @classmethod
+    def get_catalog(cls) -> Catalog:
+        """Return the catalog of the data directory"""
+        with cls._LOCK:
+            catalog = cls._CATALOGS.get(cls.DATA_DIR)
+            if catalog is None:
+                catalog = Catalog(cls.DATA_DIR)
+                cls._CATALOGS[cls.DATA_DIR] = catalog
 
-        return True
+            return catalog
 
     @classmethod
     def read(cls, name: str, date_index_col: str=None) -> pd.DataFrame:
-        """Return data from csv file as DataFrame"""
-        if not cls.exist(name, reload=True):
+        """Return data from file as DataFrame, the format is chosen by the file extension"""
+        if not cls.exist(name):
             return None
 
-        if date_index_col is None:
-            return pd.read_csv(cls.DATA_DIR + name)
+        return StorageFactory.get_storage_by_name(name).read(cls.DATA_DIR + name, date_index_col)
 
-        return pd.read_csv(cls.DATA_DIR + name,
-                           parse_dates=[date_index_col],
-                           index_col=date_index_col)
+    @classmethod
+    def write(cls, name: str, data: pd.DataFrame, index: bool=True, fingerprint: str=None,
+              if_exists: str=RAISE, timeout: float=None) -> bool:
+        """Return true if writing from DataFrame to file successful, or the file is kept
+        with if_exists skip. The file is written aside under its lock and renamed,
+        readers never see half written files"""
+        if if_exists not in cls.IF_EXISTS:
+            raise ValueError(f"Unknown if_exists: {if_exists}")
+
+        path = cls.DATA_DIR + name
+        with cls.lock(name, timeout):
+            if os.path.exists(path):
+                if if_exists == cls.RAISE:
+                    raise FileExistsError(path)
+                if if_exists == cls.SKIP:
+                    return True
+
+            temp = cls.DATA_DIR + cls._HIDDEN_PREFIX + name \
+                + f".{os.getpid()}.{threading.get_ident()}" + cls._TEMP_EXT
+            try:
+                StorageFactory.get_storage_by_name(name).write(temp, data, index)
+                os.replace(temp, path)
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+
+            if not os.path.exists(path):
+                return False
+
+            (first, last) = (None, None)
+            if index and isinstance(data.index, pd.DatetimeIndex) and len(data.index):
+                (first, last) = (str(data.index[0]), str(data.index[-1]))
+            cls.get_catalog().put(name, len(data), first, last, fingerprint=fingerprint)
+            return True
 
     @classmethod
-    def write(cls, name: str, data: pd.DataFrame, index: bool=True) -> bool:
-        "Return true if writing from DataFrame to csv file successful"
-        if cls.exist(name, reload=True):
-            raise FileExistsError
+    def read_or_write(cls, name: str, produce: Callable[[], pd.DataFrame],
+                      date_index_col: str=None, timeout: float=None) -> pd.DataFrame | None:
+        """Return the data of the file, the first caller writes it with the produced
+        data while concurrent callers, in any process, wait for it and read it"""
+        with cls.lock(name, timeout):
+            if os.path.exists(cls.DATA_DIR + name):
+                return cls.read(name, date_index_col)
 
-        data.to_csv(cls.DATA_DIR + name, index=index)
-        if cls.exist(name, reload=True):
-            return True
+            data = produce()
+            if data is None or not cls.write(name, data, index=date_index_col is not None):
+                return None
+
+            return data
+
+    @classmethod
+    @contextmanager
+    def lock(cls, name: str, timeout: float=None) -> Iterator[FileLock | None]:
+        """Hold the advisory lock of the file, shared with the other processes,
+        it is reentrant in a thread"""
+        os.makedirs(cls.DATA_DIR, exist_ok=True)
+        path = cls.DATA_DIR + cls._HIDDEN_PREFIX + name + cls._LOCK_EXT
+        held = cls._HELD.__dict__.setdefault("paths", set())
+        if path in held:
+            yield None
+            return
+
+        with FileLock(path, timeout) as file_lock:
+            held.add(path)
+            try:
+                yield file_lock
+            finally:
+                held.discard(path)
 
-        return False
+    @classmethod
+    def convert(cls, name: str, ext: str=None, date_index_col: str=None,
+                remove: bool=False) -> str | None:
+        """Return name of the file converted to another format (default FILE_EXT)"""
+        ext = ext or cls.FILE_EXT
+        target = os.path.splitext(name)[0] + ext
+        if target == name:
+            return None
+
+        data = cls.read(name, date_index_col)
+        if data is None:
+            return None
+
+        cls.write(target, data, index=date_index_col is not None, if_exists=cls.SKIP)
+        if remove:
+            cls.remove(name)
+
+        return target
+
+    @classmethod
+    def convert_all(cls, from_ext: str=".csv", to_ext: str=None, date_index_col: str=None,
+                    remove: bool=False) -> pd.DataFrame:
+        """Convert every file of a format to another one (default FILE_EXT),
+        return the sizes and read times of both formats"""
+        to_ext = to_ext or cls.FILE_EXT
+        report = []
+        for name in cls.find(ext=from_ext, reload=True)[cls._NAME]:
+            if os.path.splitext(name)[1].lower() != from_ext.lower():
+                continue
+
+            (data, read_time) = cls._timed_read(name, date_index_col)
+            target = os.path.splitext(name)[0] + to_ext
+            cls.write(target, data, index=date_index_col is not None, if_exists=cls.SKIP)
+            target_read_time = cls._timed_read(target, date_index_col)[1]
+
+            report.append((name, target, len(data), cls._get_size(name),
+                           cls._get_size(target), read_time, target_read_time))
+            if remove:
+                cls.remove(name)
+
+        cls.find(reload=True)
+        return pd.DataFrame(report, columns=[cls._NAME, cls._TARGET, cls._ROWS,
+                                             cls._SIZE, cls._TARGET_SIZE,
+                                             cls._READ_TIME, cls._TARGET_READ_TIME])
 
     @classmethod
     def remove(cls, name: str) -> bool:
         """Return true if deletion successful"""
-        if not cls.exist(name, reload=True):
+        if not cls.exist(name):
             return False
 
-        os.remove(cls.DATA_DIR + name)
-        if not cls.exist(name, reload=True):
-            return True
+        with cls.lock(name):
+            if os.path.exists(cls.DATA_DIR + name):
+                os.remove(cls.DATA_DIR + name)
+            cls.get_catalog().delete(name)
+            return not os.path.exists(cls.DATA_DIR + name)
 
-        return False
+    @classmethod
+    def _timed_read(cls, name: str, date_index_col: str) -> tuple[pd.DataFrame, float]:
+        start = time.perf_counter()
+        data = cls.read(name, date_index_col)
+        return (data, time.perf_counter() - start)
+
+    @classmethod
+    def _get_size(cls, name: str) -> float:
+        return round(os.path.getsize(cls.DATA_DIR + name) / (pow(1024, 1)), 2)
@@ -0,0 +1,3 @@
+"""Initialize package"""
+from .storage import Storage, CsvStorage, ParquetStorage, FeatherStorage, NpzStorage
+from .factory import StorageFactory
@@ -0,0 +1,25 @@
+"""Module of Storage Factory"""
+import os
+from typing import ClassVar
+
+from .storage import Storage, CsvStorage, ParquetStorage, FeatherStorage, NpzStorage
+
+class StorageFactory():
+    """Static class to get the storage of a file format"""
+    STORAGES: ClassVar[dict[str, type[Storage]]] = {
+        storage.EXT: storage for storage in (CsvStorage, ParquetStorage,
+                                             FeatherStorage, NpzStorage)}
+
+    @classmethod
+    def get_storage(cls, ext: str) -> type[Storage]:
+        """Return storage of the file extension"""
+        storage = cls.STORAGES.get(ext.lower())
+        if storage is None:
+            raise ValueError(f"Unsupported file format: {ext}")
+
+        return storage
+
+    @classmethod
+    def get_storage_by_name(cls, name: str) -> type[Storage]:
+        """Return storage of the file"""
+        return cls.get_storage(os.path.splitext(name)[1])
@@ -0,0 +1,123 @@
+"""Module of Storage Classes"""
+from abc import ABC, abstractmethod
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+
+class Storage(ABC):
+    """Storage Format Interface
+
+    Reads and writes a DataFrame in one file format. The index is stored
+    as a regular column, so every format gives back the same frame with
+    its timezone aware index once date_index_col is set.
+    """
+    EXT: ClassVar[str] = None
+
+    @classmethod
+    @abstractmethod
+    def read(cls, path: str, date_index_col: str=None) -> pd.DataFrame:
+        """Return data from file as DataFrame"""
+
+    @classmethod
+    @abstractmethod
+    def write(cls, path: str, data: pd.DataFrame, index: bool=True):
+        """Write data to file"""
+
+    @classmethod
+    def _columns(cls, data: pd.DataFrame, index: bool) -> pd.DataFrame:
+        return data.reset_index() if index else data.reset_index(drop=True)
+
+    @classmethod
+    def _set_index(cls, data: pd.DataFrame, date_index_col: str) -> pd.DataFrame:
+        return data if date_index_col is None else data.set_index(date_index_col)
+
+class CsvStorage(Storage):
+    """Comma separated values, parsed on every read"""
+    EXT: ClassVar[str] = ".csv"
+
+    @classmethod
+    def read(cls, path: str, date_index_col: str=None) -> pd.DataFrame:
+        """Return data from file as DataFrame"""
+        if date_index_col is None:
+            return pd.read_csv(path)
+
+        return pd.read_csv(path, parse_dates=[date_index_col], index_col=date_index_col)
+
+    @classmethod
+    def write(cls, path: str, data: pd.DataFrame, index: bool=True):
+        """Write data to file"""
+        data.to_csv(path, index=index)
+
+class ParquetStorage(Storage):
+    """Apache Parquet, compressed columnar file"""
+    EXT: ClassVar[str] = ".parquet"
+
+    @classmethod
+    def read(cls, path: str, date_index_col: str=None) -> pd.DataFrame:
+        """Return data from file as DataFrame"""
+        return cls._set_index(pd.read_parquet(path), date_index_col)
+
+    @classmethod
+    def write(cls, path: str, data: pd.DataFrame, index: bool=True):
+        """Write data to file"""
+        cls._columns(data, index).to_parquet(path, index=False)
+
+class FeatherStorage(Storage):
+    """Apache Arrow IPC (Feather), uncompressed columnar file read without decoding"""
+    EXT: ClassVar[str] = ".feather"
+
+    @classmethod
+    def read(cls, path: str, date_index_col: str=None) -> pd.DataFrame:
+        """Return data from file as DataFrame"""
+        return cls._set_index(pd.read_feather(path), date_index_col)
+
+    @classmethod
+    def write(cls, path: str, data: pd.DataFrame, index: bool=True):
+        """Write data to file"""
+        cls._columns(data, index).to_feather(path)
+
+class NpzStorage(Storage):
+    """NumPy archive of one array per column, datetimes as int64 nanoseconds"""
+    EXT: ClassVar[str] = ".npz"
+    _COLUMNS: ClassVar[str] = "__columns__"
+    _TIMEZONES: ClassVar[str] = "__timezones__"
+
+    @classmethod
+    def read(cls, path: str, date_index_col: str=None) -> pd.DataFrame:
+        """Return data from file as DataFrame"""
+        with np.load(path, allow_pickle=False) as archive:
+            columns = [str(column) for column in archive[cls._COLUMNS]]
+            timezones = dict(zip(columns, (str(tz) for tz in archive[cls._TIMEZONES])))
+            data = {}
+            for (i, column) in enumerate(columns):
+                values = archive[f"c{i}"]
+                if timezones[column]:
+                    values = pd.DatetimeIndex(values.view("datetime64[ns]"))
+                    values = values.tz_localize("UTC").tz_convert(timezones[column]) \
+                        if timezones[column] != "naive" else values
+                data[column] = values
+
+        return cls._set_index(pd.DataFrame(data), date_index_col)
+
+    @classmethod
+    def write(cls, path: str, data: pd.DataFrame, index: bool=True):
+        """Write data to file"""
+        data = cls._columns(data, index)
+        (arrays, timezones) = ({}, [])
+        for (i, column) in enumerate(data.columns):
+            values = data[column]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                timezone = values.dt.tz
+                timezones.append(str(timezone) if timezone is not None else "naive")
+                values = values.dt.tz_convert("UTC") if timezone is not None else values
+                arrays[f"c{i}"] = values.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            else:
+                timezones.append("")
+                arrays[f"c{i}"] = values.to_numpy() if values.dtype != object \
+                    else values.to_numpy(dtype=str)
+
+        # numpy adds the extension when missing, the archive is written to the given path
+        with open(path, "wb") as file:
+            np.savez(file, **arrays,
+                     **{cls._COLUMNS: np.array([str(column) for column in data.columns]),
+                        cls._TIMEZONES: np.array(timezones)})
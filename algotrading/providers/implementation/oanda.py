@@ -30,20 +30,24 @@ class OandaProvider(EIProvider):
                                                 columns=["symbol", "instrument"])
         df[["symbol", "instrument"]] = df[["instrument", "symbol"]]
 
-        if TickerManager.write(filename, df):
+        if TickerManager.write(filename, df, if_exists=TickerManager.REPLACE):
             return df
 
         return None
 
     def get_filename(self) -> str:
         """Generate and return filename of saved response"""
-        return TickerManager.generate_filename(TickerMetadata(
+        return TickerManager.generate_filename(self.get_metadata())
+
+    def get_metadata(self) -> TickerMetadata:
+        """Return metadata of the response"""
+        return TickerMetadata(
             provider=self.OANDA,
             symbol=self.symbol,
             start=self.start,
             end=self.end,
             timeframe=self.timeframe
-        ))
+        )
 
     def get_response(self, force_download: bool=False) -> pd.DataFrame:
         """Return response from provider"""
@@ -57,12 +61,38 @@ class OandaProvider(EIProvider):
             if isinstance(result, Ticker):
                 return result.get_data()
 
+            result = self._fetch_gaps(filename)
+            if isinstance(result, Ticker):
+                return result.get_data()
+
+            # the first job downloads, concurrent ones wait for the file and read it
+            return TickerManager.read_or_write(filename, self._prepare_data, "time")
+
         df = self._prepare_data()
-        if TickerManager.write(filename, df):
+        if df is not None and TickerManager.write(filename, df,
+                                                  if_exists=TickerManager.REPLACE):
             return df
 
         return None
 
+    def _fetch_gaps(self, filename: str) -> Ticker | None:
+        """Download only the parts of the range missing from the saved files"""
+        metadata = TickerManager.generate_metadata(filename)
+        if metadata is None:
+            return None
+
+        gaps = TickerManager.find_gaps(metadata)
+        if not gaps or gaps == [(metadata.start, metadata.end)]:
+            return None
+
+        for (start, end) in gaps:
+            provider = OandaProvider(self.symbol, start.strftime(TickerManager.DATE_FORMAT),
+                                     end.strftime(TickerManager.DATE_FORMAT), self.timeframe)
+            if provider.get_response(force_download=True) is None:
+                return None
+
+        return TickerManager.find_by_filename(filename)
+
     def _prepare_data(self) -> pd.DataFrame:
         print("(1/3) Fetching data...", flush=True, end="\r")
         symbol_oanda = self.translate_symbol(self.OANDA, self.symbol)
@@ -3,3 +3,11 @@ from .tick import Tick
 from .ticker import Ticker
 from .metadata import TickerMetadata
 from .manager import TickerManager
+from .profile import HourlyProfile
+from .buffer import TickerBuffer
+from .chunked import ChunkedTicker
+from .generator import TickerGenerator, SpreadProfile, VolumeProfile, Regime
+from .store import TickStore
+from .partitioned import PartitionedStore
+from .cache import TickerCache, TickerCacheStats
+from .validation import TickerValidator, ValidationReport
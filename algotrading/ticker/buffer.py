@@ -0,0 +1,108 @@
+"""Module of Ticker Buffer Class"""
+from dataclasses import dataclass, field
+from typing import Any, Self
+import numpy as np
+import pandas as pd
+
+from ..common.asset import AssetPairCode as Symbol
+from ..common.trade import Timeframe
+from .ticker import Ticker
+
+@dataclass
+class TickerBuffer():
+    """Ticker Buffer Class
+
+    Growable column store to append ticker data in place. The capacity
+    doubles when full, so appending fresh bars never copies the history
+    again, and overlapping data only rewrites the rows from the overlap.
+    """
+    symbol: Symbol
+    timeframe: Timeframe
+    capacity: int = 1024
+    length: int = field(init=False, default=0)
+    _times: np.ndarray = field(init=False, default=None, repr=False)
+    _columns: dict[str, np.ndarray] = field(init=False, default=None, repr=False)
+    _timezone: Any = field(init=False, default=None, repr=False)
+    _frame: pd.DataFrame = field(init=False, default=None, repr=False)
+
+    @classmethod
+    def from_ticker(cls, ticker: Ticker, capacity: int=None) -> Self:
+        """Return a buffer holding the ticker data"""
+        buffer = cls(ticker.symbol, ticker.timeframe,
+                     max(capacity or 0, ticker.get_length(), 1))
+        return buffer.append(ticker.data)
+
+    def append(self, data: pd.DataFrame) -> Self:
+        """Append time ordered data in place,
+        rows with the time of an existing row replace it"""
+        if data is None or len(data.index) <= 0:
+            return self
+
+        if self._columns is None:
+            self._allocate(data)
+        elif list(data.columns) != list(self._columns):
+            raise ValueError(f"Columns {list(data.columns)} do not match "
+                             f"the buffer columns {list(self._columns)}")
+
+        first = data.index[:1].as_unit("ns").asi8[0]
+        if self.length > 0 and first <= self._times[self.length - 1]:
+            # only the rows from the overlap are merged and rewritten
+            cut = int(np.searchsorted(self._times[:self.length], first))
+            data = Ticker.merge_data(self._slice(cut, self.length), data)
+            self.length = cut
+
+        self._write(data)
+        return self
+
+    def get_length(self) -> int:
+        """Return number of tick"""
+        return self.length
+
+    def get_data(self) -> pd.DataFrame:
+        """Return the buffered data, cached until the next append"""
+        if self._frame is None:
+            self._frame = self._slice(0, self.length)
+
+        return self._frame
+
+    def get_ticker(self) -> Ticker:
+        """Return the buffered data as ticker"""
+        data = self.get_data()
+        if len(data.index) <= 0:
+            return None
+
+        return Ticker(self.symbol, data.index[0].to_pydatetime(),
+                      data.index[-1].to_pydatetime(), self.timeframe, data)
+
+    def _allocate(self, data: pd.DataFrame):
+        self.capacity = max(self.capacity, len(data.index))
+        self._times = np.empty(self.capacity, dtype=np.int64)
+        self._columns = {column: np.empty(self.capacity, dtype=data[column].dtype)
+                         for column in data.columns}
+        self._timezone = data.index.tz
+
+    def _write(self, data: pd.DataFrame):
+        end = self.length + len(data.index)
+        if end > self.capacity:
+            self.capacity = max(self.capacity * 2, end)
+            self._times = self._grow(self._times)
+            self._columns = {column: self._grow(values)
+                             for (column, values) in self._columns.items()}
+
+        self._times[self.length:end] = data.index.as_unit("ns").asi8
+        for (column, values) in self._columns.items():
+            values[self.length:end] = data[column].to_numpy()
+        self.length = end
+        self._frame = None
+
+    def _grow(self, values: np.ndarray) -> np.ndarray:
+        grown = np.empty(self.capacity, dtype=values.dtype)
+        grown[:self.length] = values[:self.length]
+        return grown
+
+    def _slice(self, start: int, end: int) -> pd.DataFrame:
+        index = pd.DatetimeIndex(self._times[start:end].view("datetime64[ns]"), name="time")
+        index = index.tz_localize("UTC").tz_convert(self._timezone) \
+            if self._timezone is not None else index
+        return pd.DataFrame({column: values[start:end].copy()
+                             for (column, values) in self._columns.items()}, index=index)
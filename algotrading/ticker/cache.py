@@ -0,0 +1,101 @@
+"""Module of Ticker Cache Class"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable
+import threading
+
+from ..common.config import config
+from .ticker import Ticker
+
+@dataclass
+class TickerCacheStats():
+    """Ticker cache statistics"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+@dataclass
+class TickerCache():
+    """Ticker Cache Class
+
+    Least recently used cache of loaded tickers under a memory budget (in
+    bytes), measured with the actual memory usage of the data. Every entry
+    keeps the version of the files it was loaded from, an entry whose files
+    changed is dropped on access. Keys start with the tuple of the file or
+    partition paths the ticker was loaded from. Cached tickers are shared,
+    not copied.
+    """
+    budget: int = config.data_manager.cache_budget_mb * pow(1024, 2)
+    stats: TickerCacheStats = field(init=False, default_factory=TickerCacheStats)
+    _entries: OrderedDict = field(init=False, default_factory=OrderedDict, repr=False)
+    _lock: threading.RLock = field(init=False, default_factory=threading.RLock, repr=False)
+
+    def get(self, key: Hashable, version: Any) -> Ticker | None:
+        """Return the cached ticker, none when missing or loaded from another version"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != version:
+                self._drop(key)
+                self.stats.invalidations += 1
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version: Any, ticker: Ticker):
+        """Cache the ticker, evicting the least recently used ones over the budget"""
+        size = self.get_size(ticker)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            # a ticker larger than the whole budget is never cached
+            if size > self.budget:
+                return
+
+            self._entries[key] = (version, ticker, size)
+            self.stats.entries += 1
+            self.stats.bytes += size
+            while self.stats.bytes > self.budget:
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, path: str=None):
+        """Drop the entries loaded from the file or partition, every entry without path"""
+        with self._lock:
+            keys = [key for key in self._entries if path is None or path in key[0]]
+            for key in keys:
+                self._drop(key)
+            self.stats.invalidations += len(keys)
+
+    def clear(self):
+        """Drop every entry and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.stats = TickerCacheStats()
+
+    def get_stats(self) -> TickerCacheStats:
+        """Return a copy of the statistics"""
+        with self._lock:
+            return TickerCacheStats(**vars(self.stats))
+
+    @classmethod
+    def get_size(cls, ticker: Ticker) -> int:
+        """Return memory usage of the ticker data in bytes"""
+        if ticker.data is None:
+            return 0
+
+        return int(ticker.data.memory_usage(index=True, deep=True).sum())
+
+    def _drop(self, key: Hashable):
+        (_, _, size) = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= size
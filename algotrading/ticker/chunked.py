@@ -0,0 +1,226 @@
+"""Module of Chunked Ticker Class"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime as dt
+from typing import ClassVar, Iterator
+import numpy as np
+import pandas as pd
+
+from ..common.asset import AssetPairCode as Symbol
+from ..common.config import config
+from ..common.trade import Timeframe
+from .tick import Tick
+from .ticker import Ticker
+
+@dataclass
+class ChunkedTicker():
+    """Chunked Ticker Class
+
+    Ticker backed by a CSV file and loaded lazily in time ordered chunks of
+    chunk_size rows. A byte offset index of the chunks is built with a single
+    scan of the file, loaded chunks are kept in a least recently used cache
+    under the memory budget (in bytes).
+    """
+    EXT: ClassVar[str] = ".csv"
+    _SCAN_BLOCK_SIZE: ClassVar[int] = 16 * pow(1024, 2)
+
+    symbol: Symbol
+    start: dt
+    end: dt
+    timeframe: Timeframe
+    path: str
+    chunk_size: int = config.data_manager.chunk_size
+    memory_budget: int = config.data_manager.memory_budget_mb * pow(1024, 2)
+    length: int = field(init=False, default=None)
+    columns: list[str] = field(init=False, default=None)
+    _offsets: np.ndarray = field(init=False, default=None, repr=False)
+    _first_times: pd.DatetimeIndex = field(init=False, default=None, repr=False)
+    _cache: OrderedDict = field(init=False, default_factory=OrderedDict, repr=False)
+    _cache_bytes: int = field(init=False, default=0, repr=False)
+
+    def get_data(self, index: int = None,
+                 datetime: str = None) -> pd.DataFrame | Tick | None:
+        """Return ticker data, the whole data is loaded without index and datetime"""
+        if index is None and datetime is None:
+            return pd.concat(list(self.iter_chunks()))
+
+        if index is not None:
+            if index < 0:
+                index += self.get_length()
+            chunk = self.get_chunk(index // self.chunk_size)
+            return self._ticker(chunk).get_data(index=index % self.chunk_size)
+
+        datetime = pd.Timestamp(datetime)
+        if self._get_first_times().tz is not None:
+            datetime = self._localize(datetime, self._get_first_times().tz)
+        position = int(self._get_first_times().searchsorted(datetime, side="right")) - 1
+        return self._ticker(self.get_chunk(max(position, 0))).get_data(datetime=datetime)
+
+    def get_length(self) -> int:
+        """Return number of tick"""
+        if self.length is None:
+            self._build_index()
+
+        return self.length
+
+    def get_chunk_count(self) -> int:
+        """Return number of chunk"""
+        return len(self._get_offsets())
+
+    def get_chunk(self, i: int) -> pd.DataFrame:
+        """Return the chunk, loading it when it is not cached"""
+        if i in self._cache:
+            self._cache.move_to_end(i)
+            return self._cache[i]
+
+        chunk = self._read_chunk(i)
+        self._cache[i] = chunk
+        self._cache_bytes += int(chunk.memory_usage(index=True, deep=True).sum())
+
+        # the chunk just loaded is always kept
+        while self._cache_bytes > self.memory_budget and len(self._cache) > 1:
+            (_, evicted) = self._cache.popitem(last=False)
+            self._cache_bytes -= int(evicted.memory_usage(index=True, deep=True).sum())
+
+        return chunk
+
+    def iter_chunks(self, start: int=0) -> Iterator[pd.DataFrame]:
+        """Yield the chunks in time order"""
+        for i in range(start, self.get_chunk_count()):
+            yield self.get_chunk(i)
+
+    def get_range(self, start: dt, end: dt) -> Ticker:
+        """Return an in memory ticker of the data between start and end (included),
+        only the chunks overlapping the range are loaded"""
+        first_times = self._get_first_times()
+        (start_ts, end_ts) = (pd.Timestamp(start), pd.Timestamp(end))
+        if first_times.tz is not None:
+            (start_ts, end_ts) = (self._localize(start_ts, first_times.tz),
+                                  self._localize(end_ts, first_times.tz))
+
+        first = max(int(first_times.searchsorted(start_ts, side="right")) - 1, 0)
+        last = int(first_times.searchsorted(end_ts, side="right"))
+        chunks = [self.get_chunk(i) for i in range(first, max(last, first + 1))]
+
+        return self._ticker(pd.concat(chunks)).get_range(start, end)
+
+    def get_digit(self) -> int:
+        """Return symbol's decimal place"""
+        return int(self.get_chunk(0).iloc[0].digit)
+
+    def get_timezone(self) -> str:
+        """Return ticker timezone"""
+        return self._get_first_times().tz
+
+    def resample(self, to_timeframe: Timeframe) -> Ticker | None:
+        """Resample ticker data chunk by chunk into an in memory ticker of OHLC bars"""
+        if to_timeframe.value.id <= self.timeframe.value.id:
+            print(f"{self.symbol.value} - Resampling to lower and equal timeframe "
+                  f"is not allowed. {self.timeframe.value.description} -> "
+                  f"{to_timeframe.value.description}")
+            return None
+
+        (bars, carry) = ([], None)
+        for chunk in self.iter_chunks():
+            data = chunk if carry is None else pd.concat([carry, chunk])
+            buckets = self._ticker(data)._buckets(to_timeframe)
+
+            # the last bucket may continue in the next chunk
+            is_carried = buckets == buckets[-1]
+            carry = data.loc[is_carried]
+            if not is_carried.all():
+                bars.append(self._ticker(data.loc[~is_carried])._aggregate(to_timeframe))
+
+        if carry is not None:
+            bars.append(self._ticker(carry)._aggregate(to_timeframe))
+
+        print(f"{self.symbol.value} - Resampling {self.timeframe.value.description} -> "
+              f"{to_timeframe.value.description} successful")
+
+        return Ticker(self.symbol, self.start, self.end, to_timeframe, pd.concat(bars))
+
+    def to_ticker(self) -> Ticker:
+        """Return an in memory ticker of the whole data"""
+        return Ticker(self.symbol, self.start, self.end, self.timeframe, self.get_data())
+
+    def get_index(self) -> tuple[np.ndarray, pd.DatetimeIndex, int, list[str]]:
+        """Return the chunk index (offsets, first times, length and columns),
+        the file is scanned on first use"""
+        if self._offsets is None:
+            self._build_index()
+
+        return (self._offsets, self._first_times, self.length, self.columns)
+
+    def set_index(self, index: tuple[np.ndarray, pd.DatetimeIndex, int, list[str]]):
+        """Use the chunk index built before for the same file and chunk size"""
+        (self._offsets, self._first_times, self.length, self.columns) = index
+
+    def _ticker(self, data: pd.DataFrame) -> Ticker:
+        return Ticker(self.symbol, self.start, self.end, self.timeframe, data)
+
+    def _get_offsets(self) -> np.ndarray:
+        if self._offsets is None:
+            self._build_index()
+
+        return self._offsets
+
+    def _get_first_times(self) -> pd.DatetimeIndex:
+        if self._first_times is None:
+            self._build_index()
+
+        return self._first_times
+
+    def _build_index(self):
+        """Scan the file once for the byte offset of every chunk"""
+        (offsets, rows, position) = ([], 0, 0)
+        with open(self.path, "rb") as file:
+            header = file.readline()
+            position = len(header)
+            self.columns = header.decode("utf-8").strip().split(",")
+
+            pending = b""
+            while block := file.read(self._SCAN_BLOCK_SIZE):
+                block = pending + block
+                line_ends = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n"))
+                line_starts = np.r_[0, line_ends[:-1] + 1] if len(line_ends) else np.empty(0)
+
+                # rows starting a chunk, counted over the whole file
+                firsts = np.flatnonzero((rows + np.arange(len(line_ends))) % self.chunk_size == 0)
+                offsets.extend((position + line_starts[firsts]).astype(np.int64).tolist())
+
+                consumed = int(line_ends[-1]) + 1 if len(line_ends) else 0
+                rows += len(line_ends)
+                position += consumed
+                pending = block[consumed:]
+
+            if pending.strip():
+                # last line without line break
+                if rows % self.chunk_size == 0:
+                    offsets.append(position)
+                rows += 1
+
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self.length = rows
+        self._first_times = pd.DatetimeIndex(
+            [pd.Timestamp(self._read_first_field(offset)) for offset in self._offsets])
+
+    def _read_first_field(self, offset: int) -> str:
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            return file.readline().decode("utf-8").split(",", 1)[0]
+
+    def _read_chunk(self, i: int) -> pd.DataFrame:
+        offsets = self._get_offsets()
+        if i < 0 or i >= len(offsets):
+            raise IndexError(f"Chunk {i} out of range ({len(offsets)} chunks)")
+
+        rows = min(self.chunk_size, self.length - i * self.chunk_size)
+        with open(self.path, "rb") as file:
+            file.seek(offsets[i])
+            return pd.read_csv(file, header=None, names=self.columns, nrows=rows,
+                               parse_dates=[self.columns[0]], index_col=self.columns[0])
+
+    @classmethod
+    def _localize(cls, timestamp: pd.Timestamp, tz) -> pd.Timestamp:
+        return timestamp.tz_localize(tz) if timestamp.tzinfo is None \
+            else timestamp.tz_convert(tz)
@@ -0,0 +1,217 @@
+"""Module of Ticker Generator Class"""
+from dataclasses import dataclass, field
+from datetime import datetime as dt
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+
+from ..common.asset import AssetPairCode as Symbol
+from ..common.trade import Timeframe
+from .ticker import Ticker
+
+@dataclass(frozen=True)
+class SpreadProfile:
+    """Spread profile definition, in points"""
+    mean: float = 10
+    std: float = 2
+    min: int = 1
+    hourly: tuple[float, ...] = None
+    volatility_coupling: float = 0
+
+@dataclass(frozen=True)
+class VolumeProfile:
+    """Volume profile definition, log-normally distributed around the mean"""
+    mean: float = 500
+    sigma: float = 0.5
+    hourly: tuple[float, ...] = None
+    volatility_coupling: float = 0
+
+@dataclass(frozen=True)
+class Regime:
+    """Market regime definition with annualized drift and volatility
+    and the expected duration in bars"""
+    drift: float
+    volatility: float
+    duration: float
+
+@dataclass
+class TickerGenerator():
+    """Ticker Generator Class
+
+    Generates tickers with the provider's column schema
+    (ask, bid, mid, volume, digit, spread) without network access.
+    Every array is generated at once, and the same seed and call order
+    always give the same tickers.
+    """
+    _TRADING_SECONDS_PER_YEAR: ClassVar[int] = 252 * 86400
+    _NANOSECONDS: ClassVar[int] = 1_000_000_000
+    _INDEX_COL: ClassVar[str] = "time"
+    _TIMEZONE: ClassVar[str] = "UTC"
+
+    symbol: Symbol = Symbol.EUR_USD
+    timeframe: Timeframe = Timeframe.MINUTE_1
+    start: dt = dt(2020, 1, 1)
+    digit: int = 5
+    seed: int = None
+    spread: SpreadProfile = field(default_factory=SpreadProfile)
+    volume: VolumeProfile = field(default_factory=VolumeProfile)
+    skip_weekends: bool = True
+    rng: np.random.Generator = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Post initialization"""
+        self.rng = np.random.default_rng(self.seed)
+
+    def gbm(self, length: int, price: float=1.1, drift: float=0,
+            volatility: float=0.1) -> Ticker:
+        """Return a ticker following a geometric brownian motion,
+        drift and volatility are annualized"""
+        return self.regime_switching(length, price, [Regime(drift, volatility, np.inf)])
+
+    def regime_switching(self, length: int, price: float, regimes: list[Regime],
+                         transition: np.ndarray=None) -> Ticker:
+        """Return a ticker whose drift and volatility switch between regimes,
+        transition[i][j] is the probability to move from regime i to regime j
+        (uniform over the other regimes by default)"""
+        (index, dt_year) = self._generate_index(length)
+        states = self._generate_states(length, regimes, transition)
+
+        drifts = np.array([regime.drift for regime in regimes])[states]
+        sigmas = np.array([regime.volatility for regime in regimes])[states]
+        shocks = self.rng.standard_normal(length)
+        returns = (drifts - 0.5 * sigmas**2) * dt_year + sigmas * np.sqrt(dt_year) * shocks
+        returns[0] = 0
+
+        mid = price * np.exp(np.cumsum(returns))
+        hours = self._hours(index)
+        spread = self._generate_spread(hours, shocks)
+        volume = self._generate_volume(hours, shocks)
+
+        return self._create_ticker(index, mid, spread, volume)
+
+    def bootstrap(self, ticker: Ticker, length: int=None, block_size: int=100,
+                  price: float=None) -> Ticker:
+        """Return a ticker built from randomly drawn blocks of the ticker's
+        returns, spreads and volumes, keeping their short term dependence"""
+        source = ticker.data
+        length = length or len(source.index)
+        if len(source.index) < 2:
+            raise ValueError("Bootstrapping requires at least 2 ticks")
+
+        mid = ticker.get_prices("mid")
+        returns = np.log(mid[1:] / mid[:-1])
+        spreads = source.spread.to_numpy()[1:]
+        volumes = source.volume.to_numpy()[1:]
+
+        block_size = max(1, min(block_size, len(returns)))
+        blocks = -(-length // block_size)
+        starts = self.rng.integers(0, len(returns), blocks)
+        picks = ((starts[:, None] + np.arange(block_size)) % len(returns)).ravel()[:length]
+
+        sampled = returns[picks]
+        sampled[0] = 0
+        price = price or mid[0]
+        (index, _) = self._generate_index(length)
+
+        return self._create_ticker(index, price * np.exp(np.cumsum(sampled)),
+                                   spreads[picks].astype(np.int64),
+                                   volumes[picks].astype(np.int64),
+                                   ticker.get_digit())
+
+    def _generate_index(self, length: int) -> tuple[pd.DatetimeIndex, float]:
+        if length <= 0:
+            raise ValueError("length must be an integer greater than 0")
+
+        step = self.timeframe.value.seconds * self._NANOSECONDS
+        start = pd.Timestamp(self.start, tz=self._TIMEZONE).value
+
+        if not self.skip_weekends:
+            stamps = start + step * np.arange(length, dtype=np.int64)
+        else:
+            # over-allocate for the weekends then keep the first trading bars
+            stamps = np.empty(0, dtype=np.int64)
+            offset = 0
+            while len(stamps) < length:
+                count = int((length - len(stamps)) * 1.45) + 8
+                candidates = start + step * np.arange(offset, offset + count, dtype=np.int64)
+                # 1970-01-01 was a Thursday (Monday = 0)
+                weekdays = (candidates // (86400 * self._NANOSECONDS) + 3) % 7
+                stamps = np.concatenate([stamps, candidates[weekdays < 5]])
+                offset += count
+            stamps = stamps[:length]
+
+        index = pd.DatetimeIndex(stamps.view("datetime64[ns]"), name=self._INDEX_COL)
+        return (index.tz_localize(self._TIMEZONE),
+                self.timeframe.value.seconds / self._TRADING_SECONDS_PER_YEAR)
+
+    def _generate_states(self, length: int, regimes: list[Regime],
+                         transition: np.ndarray) -> np.ndarray:
+        count = len(regimes)
+        if count == 1:
+            return np.zeros(length, dtype=np.intp)
+
+        if transition is None:
+            transition = (np.ones((count, count)) - np.eye(count)) / (count - 1)
+        cumulative = np.cumsum(np.asarray(transition, dtype=np.float64), axis=1)
+
+        # draw the run length of every visit, only the visits are walked one by one
+        durations = np.array([regime.duration for regime in regimes], dtype=np.float64)
+        states = []
+        state = int(self.rng.integers(0, count))
+        total = 0
+        while total < length:
+            run = int(self.rng.geometric(1 / np.clip(durations[state], 1, length)))
+            states.append((state, run))
+            total += run
+            state = int(np.searchsorted(cumulative[state], self.rng.random(), side="right"))
+            state = min(state, count - 1)
+
+        (visited, runs) = np.array(states).T
+        return np.repeat(visited, runs)[:length]
+
+    def _generate_spread(self, hours: np.ndarray, shocks: np.ndarray) -> np.ndarray:
+        profile = self.spread
+        spread = profile.mean + profile.std * self.rng.standard_normal(len(hours))
+        spread *= self._hourly(profile.hourly)[hours]
+        spread *= 1 + profile.volatility_coupling * np.abs(shocks)
+
+        return np.maximum(np.rint(spread), profile.min).astype(np.int64)
+
+    def _generate_volume(self, hours: np.ndarray, shocks: np.ndarray) -> np.ndarray:
+        profile = self.volume
+        mu = np.log(profile.mean) - 0.5 * profile.sigma**2
+        volume = self.rng.lognormal(mu, profile.sigma, len(hours))
+        volume *= self._hourly(profile.hourly)[hours]
+        volume *= 1 + profile.volatility_coupling * np.abs(shocks)
+
+        return np.maximum(np.rint(volume), 1).astype(np.int64)
+
+    def _create_ticker(self, index: pd.DatetimeIndex, mid: np.ndarray,
+                       spread: np.ndarray, volume: np.ndarray, digit: int=None) -> Ticker:
+        # quote on the point grid so that spread == (ask - bid) * 10^digit
+        digit = self.digit if digit is None else digit
+        scale = pow(10, digit)
+        bid_points = np.rint(mid * scale - spread / 2)
+        ask_points = bid_points + spread
+
+        data = pd.DataFrame({"ask": ask_points / scale,
+                             "bid": bid_points / scale,
+                             "mid": np.round((ask_points + bid_points) / (2 * scale), digit + 1),
+                             "volume": volume,
+                             "digit": np.full(len(index), digit, dtype=np.int64),
+                             "spread": spread}, index=index)
+
+        return Ticker(self.symbol, index[0].to_pydatetime(), index[-1].to_pydatetime(),
+                      self.timeframe, data)
+
+    def _hours(self, index: pd.DatetimeIndex) -> np.ndarray:
+        return (index.asi8 // (3600 * self._NANOSECONDS)) % 24
+
+    def _hourly(self, hourly: tuple[float, ...]) -> np.ndarray:
+        if hourly is None:
+            return np.ones(24)
+
+        if len(hourly) != 24:
+            raise ValueError("Hourly profile requires 24 multipliers")
+
+        return np.asarray(hourly, dtype=np.float64)
@@ -1,7 +1,9 @@
 """Module of Ticker Manager Class"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import ClassVar
 from datetime import datetime as dt
+import os
 import pandas as pd
 import numpy as np
 
@@ -10,13 +12,19 @@ from .metadata import TickerMetadata
 from ..common.asset import AssetPairCode as Symbol
 from ..common.trade import Timeframe
 from .ticker import Ticker
+from .chunked import ChunkedTicker
+from .store import TickStore
+from .partitioned import PartitionedStore
+from .cache import TickerCache
+from .validation import TickerValidator, ValidationReport
 
 @dataclass
 class TickerManager(DataManager):
     """Ticker Manager Class"""
     _TICKER_DATA: ClassVar[pd.DataFrame] = None
+    _TICKER_GENERATION: ClassVar[tuple[str, int]] = None
     _SEPARATOR: ClassVar[str] = "_"
-    _DATE_FORMAT = "%Y-%m-%d"
+    DATE_FORMAT: ClassVar[str] = "%Y-%m-%d"
     _PROVIDER: ClassVar[str] = "PROVIDER"
     _SYMBOL: ClassVar[str] = "SYMBOL"
     _TIMEFRAME: ClassVar[str] = "TIMEFRAME"
@@ -24,67 +32,126 @@ class TickerManager(DataManager):
     _END: ClassVar[str] = "END"
     _INDEX_COL: ClassVar[str] = "time"
 
+    CACHE: ClassVar[TickerCache] = TickerCache()
+    _CHUNK_INDEXES: ClassVar[dict[tuple[str, int], tuple]] = {}
+
+    PYRAMID: ClassVar[tuple[Timeframe, ...]] = (Timeframe.MINUTE_1, Timeframe.MINUTE_15,
+                                               Timeframe.HOUR_1, Timeframe.HOUR_4,
+                                               Timeframe.DAY_1)
+
     @classmethod
     def find(cls, name: str=None, ext: str=None, reload: bool=False) -> pd.DataFrame:
         """Return list of ticker data"""
-        if cls._TICKER_DATA is None or reload:
-            cls._TICKER_DATA = super().find(name=name, ext=ext, reload=reload)
-            cls.populate()
+        with cls._LOCK:
+            data = super().find(name=name, ext=ext, reload=reload)
+            if cls._TICKER_DATA is None or reload or cls._TICKER_GENERATION != cls._GENERATION:
+                cls._TICKER_DATA = data
+                cls._TICKER_GENERATION = cls._GENERATION
+                cls.populate()
 
-        return cls._TICKER_DATA.copy()
+            return cls._TICKER_DATA.copy()
+
+    @classmethod
+    def write(cls, name: str, data: pd.DataFrame, index: bool=True, fingerprint: str=None,
+              if_exists: str=DataManager.RAISE, timeout: float=None) -> bool:
+        """Return true if writing successful, the content fingerprint of
+        ticker files is computed once here and kept in the catalog"""
+        if fingerprint is None and index and cls.generate_metadata(name) is not None:
+            fingerprint = Ticker.compute_fingerprint(data)
+
+        return super().write(name, data, index, fingerprint, if_exists, timeout)
 
     @classmethod
     def find_by_metadata(cls, metadata: TickerMetadata,
                          reload: bool=False) -> pd.DataFrame | Ticker:
-        """Return locally saved ticker"""
+        """Return locally saved ticker, stitched from several files
+        when no single one covers the range"""
         if not cls.validate_metadata(metadata):
             return None
 
-        df = cls.find(reload=reload)
-        df = df.dropna(subset=[cls._PROVIDER, cls._SYMBOL, cls._START, cls._END, cls._TIMEFRAME])
-
+        df = cls._find_segments(metadata, reload)
         if df is None or len(df) == 0:
             return None
 
-        if metadata.provider is not None:
-            df = df[df[cls._PROVIDER].str.contains(metadata.provider, case=False)]
-
-        if metadata.symbol is not None:
-            df = df[df[cls._SYMBOL].str.contains(metadata.symbol.value, case=False)]
+        mask = (df[cls._START] <= metadata.start) & (df[cls._END] >= metadata.end)
+        if not mask.any():
+            (filenames, gaps) = cls.find_coverage(metadata)
+            if gaps or not filenames:
+                return None
 
-        if metadata.timeframe is not None:
-            df = df[df[cls._TIMEFRAME].str.contains(metadata.timeframe.name, case=False)]
+            return cls._load(metadata, filenames)
 
-        mask = (df[cls._START] <= metadata.start) & (df[cls._END] >= metadata.end)
-        df = df.loc[mask]
+        df = df.loc[mask].sort_values(by=[cls._SIZE])
+        return cls._load(metadata, [df[cls._NAME].iloc[0]])
 
-        if len(df) == 0:
-            return None
+    @classmethod
+    def find_coverage(cls, metadata: TickerMetadata,
+                      reload: bool=False) -> tuple[list[str], list[tuple[dt, dt]]]:
+        """Return the smallest set of files covering the range in time order
+        and the gaps of the range that no file covers"""
+        if not cls.validate_metadata(metadata):
+            return ([], [])
 
-        df = df.sort_values(by=[cls._SIZE])
+        df = cls._find_segments(metadata, reload)
+        if df is None or len(df) == 0:
+            return ([], [(metadata.start, metadata.end)])
+
+        intervals = pd.IntervalIndex.from_arrays(pd.to_datetime(df[cls._START]),
+                                                 pd.to_datetime(df[cls._END]), closed="both")
+        df = df.loc[intervals.overlaps(pd.Interval(pd.Timestamp(metadata.start),
+                                                   pd.Timestamp(metadata.end), closed="both"))]
+        df = df.sort_values(by=[cls._START, cls._END], ascending=[True, False])
+
+        (filenames, gaps, reach) = ([], [], metadata.start)
+        (starts, ends, names) = (df[cls._START].tolist(), df[cls._END].tolist(),
+                                 df[cls._NAME].tolist())
+        i = 0
+        while reach < metadata.end:
+            # the file reaching furthest among those starting before the covered part ends
+            (best, best_end) = (None, reach)
+            while i < len(starts) and starts[i] <= reach:
+                if ends[i] > best_end:
+                    (best, best_end) = (names[i], ends[i])
+                i += 1
+
+            if best is not None:
+                filenames.append(best)
+                reach = best_end
+            elif i < len(starts):
+                gaps.append((reach, starts[i]))
+                reach = starts[i]
+            else:
+                gaps.append((reach, metadata.end))
+                reach = metadata.end
 
-        filename = df[cls._NAME].iloc[0]
-        ticker_metadata = cls.generate_metadata(filename)
-        ticker_data = cls.read(filename, cls._INDEX_COL)
+        return (filenames, gaps)
 
-        if ticker_metadata.start == metadata.start and ticker_metadata.end == metadata.end:
-            return Ticker(
-                symbol    = ticker_metadata.symbol,
-                start     = ticker_metadata.start,
-                end       = ticker_metadata.end,
-                timeframe = ticker_metadata.timeframe,
-                data      = ticker_data
-            )
+    @classmethod
+    def find_gaps(cls, metadata: TickerMetadata, reload: bool=False) -> list[tuple[dt, dt]]:
+        """Return the parts of the range missing from the locally saved files"""
+        return cls.find_coverage(metadata, reload)[1]
 
-        tz = ticker_data.index.tz
-        return Ticker(
-                symbol    = ticker_metadata.symbol,
-                start     = metadata.start,
-                end       = metadata.end,
-                timeframe = ticker_metadata.timeframe,
-                data      = ticker_data.loc[
-                    pd.Timestamp(metadata.start, tz=tz):pd.Timestamp(metadata.end, tz=tz)]
-            )
+    @classmethod
+    def find_many(cls, metadatas: list[TickerMetadata], max_workers: int=None,
+                  reload: bool=False) -> tuple[list[Ticker | None], dict[int, Exception]]:
+        """Return locally saved tickers in request order, loaded on a thread pool,
+        and the errors of the failed requests by position, a failure is not fatal"""
+        cls.find(reload=reload)
+
+        (tickers, errors) = ([None] * len(metadatas), {})
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(cls.find_by_metadata, metadata): i
+                       for (i, metadata) in enumerate(metadatas)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    tickers[i] = future.result()
+                except Exception as exp: # pylint: disable=broad-exception-caught
+                    errors[i] = exp
+                    print(f"{metadatas[i].symbol.value} - Loading failed: "
+                          f"{type(exp).__name__} {exp}")
+
+        return (tickers, errors)
 
     @classmethod
     def find_by_filename(cls, filename: str,
@@ -95,35 +162,173 @@ class TickerManager(DataManager):
             reload   = reload
         )
 
+    @classmethod
+    def open_chunked(cls, filename: str, chunk_size: int=None,
+                     memory_budget: int=None) -> ChunkedTicker:
+        """Return locally saved csv ticker loaded lazily by chunks"""
+        metadata = cls.generate_metadata(filename)
+        if metadata is None or not cls.exist(filename, reload=True):
+            return None
+
+        if not filename.lower().endswith(ChunkedTicker.EXT):
+            print(f"{filename} - Chunked loading is only supported for "
+                  f"{ChunkedTicker.EXT} files")
+            return None
+
+        ticker = ChunkedTicker(metadata.symbol, metadata.start, metadata.end,
+                               metadata.timeframe, cls.DATA_DIR + filename)
+        if chunk_size is not None:
+            ticker.chunk_size = chunk_size
+        if memory_budget is not None:
+            ticker.memory_budget = memory_budget
+
+        # the byte scan is done once per file version and chunk size
+        entry = cls.get_catalog().get(filename)
+        (key, version) = ((ticker.path, ticker.chunk_size), (entry["size"], entry["mtime"]))
+        with cls._LOCK:
+            cached = cls._CHUNK_INDEXES.get(key)
+        if cached is not None and cached[0] == version:
+            ticker.set_index(cached[1])
+        else:
+            index = ticker.get_index()
+            with cls._LOCK:
+                cls._CHUNK_INDEXES[key] = (version, index)
+
+        return ticker
+
+    @classmethod
+    def write_store(cls, filename: str) -> str | None:
+        """Copy a locally saved ticker into the memory mapped tick store,
+        return the store directory"""
+        metadata = cls.generate_metadata(filename)
+        if metadata is None or not cls.exist(filename, reload=True):
+            return None
+
+        return TickStore.write(metadata.provider, cls._read_ticker(filename))
+
+    @classmethod
+    def write_partitioned(cls, filename: str, ext: str=None) -> list[str]:
+        """Copy a locally saved ticker into the monthly partitioned store,
+        return the partition paths"""
+        metadata = cls.generate_metadata(filename)
+        if metadata is None or not cls.exist(filename, reload=True):
+            return []
+
+        return PartitionedStore.write(metadata.provider, cls._read_ticker(filename), ext)
+
+    @classmethod
+    def find_partitioned(cls, metadata: TickerMetadata, max_workers: int=None) -> Ticker | None:
+        """Return the ticker of the metadata range read from the overlapping partitions"""
+        if not cls.validate_metadata(metadata):
+            return None
+
+        names = PartitionedStore.get_partitions(metadata.provider, metadata.symbol,
+                                                metadata.timeframe, metadata.start, metadata.end)
+        key = (tuple(names), metadata.start, metadata.end, metadata.timeframe)
+        version = tuple((stat.st_size, stat.st_mtime_ns)
+                        for stat in (os.stat(name) for name in names))
+        ticker = cls.CACHE.get(key, version)
+        if ticker is not None:
+            return ticker
+
+        ticker = PartitionedStore.read(metadata.provider, metadata.symbol, metadata.timeframe,
+                                       metadata.start, metadata.end, max_workers)
+        if ticker is not None:
+            cls.CACHE.put(key, version, ticker)
+        return ticker
+
+    @classmethod
+    def validate(cls, filename: str, repair: bool=False,
+                 validator: TickerValidator=None) -> ValidationReport | None:
+        """Validate a locally saved ticker and keep the result in the catalog,
+        repair rewrites the file without the bad rows"""
+        metadata = cls.generate_metadata(filename)
+        if metadata is None or not cls.exist(filename):
+            return None
+
+        validator = validator or TickerValidator()
+        ticker = cls._read_ticker(filename)
+        report = validator.validate(ticker)
+        if repair and report.get_issue_count():
+            ticker = validator.repair(ticker)
+            cls.write(filename, ticker.data, if_exists=cls.REPLACE)
+            report = validator.validate(ticker)
+
+        cls.get_catalog().set_validation(filename, dt.now().isoformat(timespec="seconds"),
+                                         report.to_dict())
+        return report
+
+    @classmethod
+    def validate_all(cls, repair: bool=False, validator: TickerValidator=None) -> pd.DataFrame:
+        """Validate every locally saved ticker, return the validations of the catalog"""
+        df = cls.find(reload=True).dropna(subset=[cls._PROVIDER])
+        for filename in df[cls._NAME]:
+            cls.validate(filename, repair, validator)
+
+        return cls.get_catalog().get_validations()
+
+    @classmethod
+    def build_pyramid(cls, filename: str) -> list[str]:
+        """Resample a locally saved ticker to every higher timeframe of the pyramid,
+        each level from the one below, save the missing levels next to it
+        and return the filenames of all levels"""
+        metadata = cls.generate_metadata(filename)
+        if metadata is None or not cls.exist(filename, reload=True):
+            return []
+
+        (source, ticker) = (filename, None)
+        filenames = []
+        for timeframe in cls.PYRAMID:
+            if timeframe.value.id <= metadata.timeframe.value.id:
+                continue
+
+            name = cls.generate_resampled_filename(filename, timeframe)
+            filenames.append(name)
+            if cls.exist(name):
+                (source, ticker) = (name, None)
+                continue
+
+            if ticker is None:
+                ticker = cls._read_ticker(source)
+            ticker = ticker.resample(timeframe)
+            cls.write(name, ticker.data, if_exists=cls.SKIP)
+            source = name
+
+        cls.find(reload=True)
+        return filenames
+
     @classmethod
     def populate(cls):
-        """Populate metadata"""
-        providers = []
-        symbols = []
-        starts = []
-        ends = []
-        timeframes = []
+        """Populate metadata, file names are parsed once and kept in the catalog"""
+        catalog = cls.get_catalog()
+        parsed = catalog.get_metadata()
 
+        missing = {}
         for value in cls._TICKER_DATA.loc[:, cls._NAME]:
+            if value in parsed:
+                continue
+
             metadata = cls.generate_metadata(value)
             if metadata is None:
-                providers.append(np.nan)
-                symbols.append(np.nan)
-                starts.append(np.nan)
-                ends.append(np.nan)
-                timeframes.append(np.nan)
+                missing[value] = (None, None, None, None, None)
             else:
-                providers.append(metadata.provider)
-                symbols.append(metadata.symbol.name)
-                starts.append(metadata.start)
-                ends.append(metadata.end)
-                timeframes.append(metadata.timeframe.name)
-
-        cls._TICKER_DATA.loc[:, cls._PROVIDER] = providers
-        cls._TICKER_DATA.loc[:, cls._SYMBOL] = symbols
-        cls._TICKER_DATA.loc[:, cls._TIMEFRAME] = timeframes
-        cls._TICKER_DATA.loc[:, cls._START] = starts
-        cls._TICKER_DATA.loc[:, cls._END] = ends
+                missing[value] = (metadata.provider, metadata.symbol.name,
+                                  metadata.timeframe.name, metadata.start.isoformat(),
+                                  metadata.end.isoformat())
+        catalog.set_metadata(missing)
+        parsed.update(missing)
+
+        rows = [parsed[value] for value in cls._TICKER_DATA.loc[:, cls._NAME]]
+        (providers, symbols, timeframes, starts, ends) = \
+            zip(*rows) if rows else ((), (), (), (), ())
+
+        cls._TICKER_DATA.loc[:, cls._PROVIDER] = cls._nan(providers)
+        cls._TICKER_DATA.loc[:, cls._SYMBOL] = cls._nan(symbols)
+        cls._TICKER_DATA.loc[:, cls._TIMEFRAME] = cls._nan(timeframes)
+        cls._TICKER_DATA.loc[:, cls._START] = [dt.fromisoformat(start) if start else np.nan
+                                               for start in starts]
+        cls._TICKER_DATA.loc[:, cls._END] = [dt.fromisoformat(end) if end else np.nan
+                                             for end in ends]
 
         cls._TICKER_DATA.sort_values([cls._PROVIDER, cls._SYMBOL,
                                       cls._TIMEFRAME, cls._START, cls._END], inplace=True)
@@ -163,8 +368,8 @@ class TickerManager(DataManager):
         metadata = TickerMetadata(
             provider  = arr[0],
             symbol    = Symbol[arr[1].replace("-", "_")],
-            start     = dt.strptime(arr[2], cls._DATE_FORMAT),
-            end       = dt.strptime(arr[3], cls._DATE_FORMAT),
+            start     = dt.strptime(arr[2], cls.DATE_FORMAT),
+            end       = dt.strptime(arr[3], cls.DATE_FORMAT),
             timeframe = Timeframe[arr[4].replace("-", "_")]
         )
 
@@ -173,6 +378,13 @@ class TickerManager(DataManager):
 
         return metadata
 
+    @classmethod
+    def generate_resampled_filename(cls, filename: str, timeframe: Timeframe) -> str:
+        """Generate filename of the ticker resampled to the timeframe"""
+        arr = filename.split(".")[0].split(cls._SEPARATOR)
+        arr[4] = timeframe.name.replace("_", "-")
+        return cls._SEPARATOR.join(arr) + cls.FILE_EXT
+
     @classmethod
     def generate_filename(cls, metadata: TickerMetadata) -> str:
         """Generate filename from the metadata"""
@@ -181,3 +393,98 @@ class TickerManager(DataManager):
         return (f"{metadata.provider}_{symbol}_"
                 f"{metadata.start}_{metadata.end}_{timeframe}"
                 f"{cls.FILE_EXT}")
+
+    @classmethod
+    def _find_segments(cls, metadata: TickerMetadata, reload: bool) -> pd.DataFrame:
+        df = cls.find(reload=reload)
+        df = df.dropna(subset=[cls._PROVIDER, cls._SYMBOL, cls._START, cls._END, cls._TIMEFRAME])
+
+        if metadata.provider is not None:
+            df = df[df[cls._PROVIDER].str.contains(metadata.provider, case=False)]
+
+        if metadata.symbol is not None:
+            df = df[df[cls._SYMBOL].str.contains(metadata.symbol.value, case=False)]
+
+        if metadata.timeframe is not None:
+            # exact match, MINUTE_1 is contained in MINUTE_15
+            df = df[df[cls._TIMEFRAME] == metadata.timeframe.name]
+
+        return df
+
+    @classmethod
+    def _read_range(cls, filename: str, start: dt, end: dt) -> Ticker:
+        if filename.lower().endswith(ChunkedTicker.EXT):
+            # only the chunks overlapping the requested range are read
+            return cls.open_chunked(filename).get_range(start, end)
+
+        # columnar files are read whole, it is faster than parsing the chunks of a csv
+        return cls._read_ticker(filename).get_range(start, end)
+
+    @classmethod
+    def _load(cls, metadata: TickerMetadata, filenames: list[str]) -> Ticker | None:
+        """Return the range read from the files, through the cache"""
+        catalog = cls.get_catalog()
+        entries = [catalog.get(filename) for filename in filenames]
+        if None in entries:
+            return None
+
+        key = (tuple(cls.DATA_DIR + filename for filename in filenames),
+               metadata.start, metadata.end, metadata.timeframe)
+        version = tuple((entry["size"], entry["mtime"]) for entry in entries)
+        ticker = cls.CACHE.get(key, version)
+        if ticker is not None:
+            return ticker
+
+        if len(filenames) > 1:
+            ticker = cls._stitch(metadata, filenames)
+        else:
+            ticker = cls._read_file(metadata, filenames[0])
+
+        if ticker is not None:
+            cls.CACHE.put(key, version, ticker)
+        return ticker
+
+    @classmethod
+    def _read_file(cls, metadata: TickerMetadata, filename: str) -> Ticker:
+        ticker_metadata = cls.generate_metadata(filename)
+
+        if ticker_metadata.start == metadata.start and ticker_metadata.end == metadata.end:
+            return Ticker(
+                symbol      = ticker_metadata.symbol,
+                start       = ticker_metadata.start,
+                end         = ticker_metadata.end,
+                timeframe   = ticker_metadata.timeframe,
+                data        = cls.read(filename, cls._INDEX_COL),
+                fingerprint = cls._get_fingerprint(filename)
+            )
+
+        return cls._read_range(filename, metadata.start, metadata.end)
+
+    @classmethod
+    def _stitch(cls, metadata: TickerMetadata, filenames: list[str]) -> Ticker:
+        (data, reach) = (None, metadata.start)
+        for filename in filenames:
+            segment = cls.generate_metadata(filename)
+            part = cls._read_range(filename, max(segment.start, reach),
+                                   min(segment.end, metadata.end))
+            data = Ticker.merge_data(data, part.expand().data)
+            reach = segment.end
+
+        return Ticker(metadata.symbol, metadata.start, metadata.end, metadata.timeframe, data)
+
+    @classmethod
+    def _get_fingerprint(cls, filename: str) -> str | None:
+        # files written before fingerprinting are hashed on first use instead
+        entry = cls.get_catalog().get(filename)
+        return None if entry is None else entry["fingerprint"]
+
+    @classmethod
+    def _nan(cls, values: tuple) -> list:
+        return [np.nan if value is None else value for value in values]
+
+    @classmethod
+    def _read_ticker(cls, filename: str) -> Ticker:
+        metadata = cls.generate_metadata(filename)
+        return Ticker(metadata.symbol, metadata.start, metadata.end, metadata.timeframe,
+                      cls.read(filename, cls._INDEX_COL),
+                      fingerprint=cls._get_fingerprint(filename))
@@ -0,0 +1,165 @@
+"""Module of Partitioned Store Class"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime as dt, timedelta
+from typing import ClassVar
+import os
+import threading
+import numpy as np
+import pandas as pd
+
+from ..common.asset import AssetPairCode as Symbol
+from ..common.config import config
+from ..common.trade import Timeframe
+from ..data import FileLock
+from ..data.storage import StorageFactory
+from .ticker import Ticker
+
+@dataclass
+class PartitionedStore():
+    """Partitioned Store Class
+
+    Keeps tickers partitioned by provider, symbol, timeframe and month as
+    PARTITION_DIR/provider/symbol/timeframe/YYYY-MM.ext, in any storage format.
+    Range queries only open the partitions overlapping the range, read them
+    on a thread pool and slice only the first and the last one. Writers of a
+    partition hold its lock, concurrent jobs can share the store.
+    """
+    _MONTH_FORMAT: ClassVar[str] = "%Y-%m"
+    _TEMP_EXT: ClassVar[str] = ".tmp"
+    _LOCK_EXT: ClassVar[str] = ".lock"
+    _HIDDEN_PREFIX: ClassVar[str] = "."
+    _INDEX_COL: ClassVar[str] = "time"
+    _PROVIDER: ClassVar[str] = "PROVIDER"
+    _SYMBOL: ClassVar[str] = "SYMBOL"
+    _TIMEFRAME: ClassVar[str] = "TIMEFRAME"
+    _PARTITIONS: ClassVar[str] = "PARTITIONS"
+    _FIRST: ClassVar[str] = "FIRST"
+    _LAST: ClassVar[str] = "LAST"
+
+    PARTITION_DIR: ClassVar[str] = config.data_manager.partition_directory
+    FILE_EXT: ClassVar[str] = config.data_manager.file_extension
+
+    @classmethod
+    def find(cls) -> pd.DataFrame:
+        """Return list of partitioned ticker with their first and last month"""
+        data = []
+        for provider in cls._list_dir(cls.PARTITION_DIR):
+            for symbol in cls._list_dir(cls.PARTITION_DIR + provider):
+                for timeframe in cls._list_dir(cls.PARTITION_DIR + provider + os.sep + symbol):
+                    months = cls._months(provider, Symbol[symbol], Timeframe[timeframe])
+                    if months:
+                        data.append((provider, symbol, timeframe, len(months),
+                                     min(months), max(months)))
+
+        return pd.DataFrame(data, columns=[cls._PROVIDER, cls._SYMBOL, cls._TIMEFRAME,
+                                           cls._PARTITIONS, cls._FIRST, cls._LAST])
+
+    @classmethod
+    def write(cls, provider: str, ticker: Ticker, ext: str=None) -> list[str]:
+        """Split the ticker by month and write the partitions, merged into
+        the existing ones, return the partition paths"""
+        ext = ext or cls.FILE_EXT
+        storage = StorageFactory.get_storage(ext)
+        path = cls.generate_path(provider, ticker.symbol, ticker.timeframe)
+        os.makedirs(path, exist_ok=True)
+
+        if ticker.data is None or not len(ticker.data.index):
+            return []
+
+        data = ticker.expand().data
+        keys = data.index.year * 100 + data.index.month
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+
+        paths = []
+        for (first, last) in zip(np.r_[0, bounds], np.r_[bounds, len(keys)]):
+            part = data.iloc[first:last]
+            month = part.index[0].strftime(cls._MONTH_FORMAT)
+            (name, hidden) = (path + month, path + cls._HIDDEN_PREFIX + month)
+            temp = hidden + f".{os.getpid()}.{threading.get_ident()}" + cls._TEMP_EXT
+            # read, merged and replaced under the lock, concurrent writers never lose rows
+            with FileLock(hidden + cls._LOCK_EXT):
+                existing = cls._find_partition(name)
+                if existing is not None:
+                    part = Ticker.merge_data(
+                        StorageFactory.get_storage_by_name(existing)
+                        .read(existing, cls._INDEX_COL), part)
+
+                # written aside and renamed, readers never see half written partitions
+                try:
+                    storage.write(temp, part)
+                    os.replace(temp, name + ext)
+                finally:
+                    if os.path.exists(temp):
+                        os.remove(temp)
+                if existing is not None and existing != name + ext:
+                    os.remove(existing)
+            paths.append(name + ext)
+
+        return paths
+
+    @classmethod
+    def read(cls, provider: str, symbol: Symbol, timeframe: Timeframe,
+             start: dt, end: dt, max_workers: int=None) -> Ticker | None:
+        """Return the ticker between start and end (included) read from the
+        overlapping partitions only"""
+        names = cls.get_partitions(provider, symbol, timeframe, start, end)
+        if not names:
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(cls._read_partition, names))
+
+        # months in between are within the range, only the bounds are sliced
+        ticker = Ticker(symbol, start, end, timeframe, parts[0])
+        parts[0] = ticker.get_range(start, end).data
+        if len(parts) > 1:
+            parts[-1] = Ticker(symbol, start, end, timeframe, parts[-1]) \
+                .get_range(start, end).data
+
+        return Ticker(symbol, start, end, timeframe, pd.concat(parts, copy=False))
+
+    @classmethod
+    def get_partitions(cls, provider: str, symbol: Symbol, timeframe: Timeframe,
+                       start: dt, end: dt) -> list[str]:
+        """Return the paths of the partitions overlapping start and end in time order"""
+        path = cls.generate_path(provider, symbol, timeframe)
+        (start_ts, end_ts) = (pd.Timestamp(start), pd.Timestamp(end))
+        margin = timedelta(days=1) if start_ts.tzinfo is not None else timedelta(0)
+        (first, last) = ((start_ts - margin).strftime(cls._MONTH_FORMAT),
+                         (end_ts + margin).strftime(cls._MONTH_FORMAT))
+
+        return [cls._find_partition(path + month)
+                for month in cls._months(provider, symbol, timeframe)
+                if first <= month <= last]
+
+    @classmethod
+    def generate_path(cls, provider: str, symbol: Symbol, timeframe: Timeframe) -> str:
+        """Generate the directory of the partitions"""
+        return cls.PARTITION_DIR + os.sep.join([provider, symbol.name, timeframe.name]) + os.sep
+
+    @classmethod
+    def _months(cls, provider: str, symbol: Symbol, timeframe: Timeframe) -> list[str]:
+        names = cls._list_dir(cls.generate_path(provider, symbol, timeframe), files=True)
+        return sorted({os.path.splitext(name)[0] for name in names
+                       if not name.startswith(cls._HIDDEN_PREFIX)})
+
+    @classmethod
+    def _find_partition(cls, name: str) -> str | None:
+        for ext in StorageFactory.STORAGES:
+            if os.path.exists(name + ext):
+                return name + ext
+
+        return None
+
+    @classmethod
+    def _read_partition(cls, name: str) -> pd.DataFrame:
+        return StorageFactory.get_storage_by_name(name).read(name, cls._INDEX_COL)
+
+    @classmethod
+    def _list_dir(cls, path: str, files: bool=False) -> list[str]:
+        if not os.path.isdir(path):
+            return []
+
+        return sorted(entry.name for entry in os.scandir(path)
+                      if (entry.is_file() if files else entry.is_dir()))
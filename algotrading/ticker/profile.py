@@ -0,0 +1,73 @@
+"""Module of Hourly Profile Class"""
+from dataclasses import dataclass, field
+from typing import ClassVar, Iterable, Self
+import numpy as np
+import pandas as pd
+
+@dataclass
+class HourlyProfile():
+    """Hourly Profile Class
+
+    Accumulates hour of day sums of volume, spread and absolute mid change
+    (in points) with np.bincount. Data can be added chunk by chunk in time
+    order, e.g. from a streaming source, without keeping it in memory.
+    """
+    HOURS: ClassVar[int] = 24
+    _INDEX_NAME: ClassVar[str] = "hour"
+
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(HourlyProfile.HOURS,
+                                                                dtype=np.int64))
+    volume: np.ndarray = field(default_factory=lambda: np.zeros(HourlyProfile.HOURS))
+    spread: np.ndarray = field(default_factory=lambda: np.zeros(HourlyProfile.HOURS))
+    change: np.ndarray = field(default_factory=lambda: np.zeros(HourlyProfile.HOURS,
+                                                                dtype=np.int64))
+    last_mid: float = None
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> Self:
+        """Return the profile of chunks of ticker data in time order"""
+        profile = cls()
+        for chunk in chunks:
+            profile.update(chunk)
+
+        return profile
+
+    def update(self, data: pd.DataFrame) -> Self:
+        """Add a chunk of ticker data following the previous one"""
+        if data is None or len(data.index) <= 0:
+            return self
+
+        hours = data.index.hour.to_numpy()
+        mid = data.mid.to_numpy(dtype=np.float64)
+
+        # the first change of a chunk is taken from the last mid of the previous one
+        previous = np.empty_like(mid)
+        previous[0] = mid[0] if self.last_mid is None else self.last_mid
+        previous[1:] = mid[:-1]
+        points = np.power(10.0, data.digit.to_numpy())
+        change = (np.abs(mid - previous) * points).astype(np.int64)
+
+        self.counts += np.bincount(hours, minlength=self.HOURS)
+        self.volume += np.bincount(hours, weights=data.volume.to_numpy(), minlength=self.HOURS)
+        self.spread += np.bincount(hours, weights=data.spread.to_numpy(), minlength=self.HOURS)
+        self.change += np.bincount(hours, weights=change, minlength=self.HOURS).astype(np.int64)
+        self.last_mid = mid[-1]
+
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the mean volume, spread and change of every hour with data,
+        whether the change covers the spread and the color to plot"""
+        hours = np.flatnonzero(self.counts)
+        counts = self.counts[hours]
+
+        by_hour = pd.DataFrame({"volume": self.volume[hours] / counts,
+                                "spread": self.spread[hours] / counts,
+                                "change": self.change[hours] / counts},
+                               index=pd.Index(hours.astype(np.int32), name=self._INDEX_NAME))
+        by_hour["mean"] = by_hour["volume"].mean()
+        by_hour["cover"] = by_hour["change"] > by_hour["spread"]
+        by_hour["color"] = np.select([~by_hour["cover"], by_hour["volume"] > by_hour["mean"]],
+                                     ["red", "darkgreen"], "gray")
+
+        return by_hour
@@ -0,0 +1,166 @@
+"""Module of Tick Store Class"""
+from dataclasses import dataclass
+from datetime import datetime as dt
+from typing import ClassVar
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+from ..common.asset import AssetPairCode as Symbol
+from ..common.config import config
+from ..common.trade import Timeframe
+from .ticker import Ticker
+
+@dataclass
+class TickStore():
+    """Tick Store Class
+
+    Keeps every provider, symbol and timeframe as a directory of fixed width
+    column files (.npy): the timestamps as int64 UTC nanoseconds and one array
+    per data column. Tickers are opened with memory maps, nothing is parsed on
+    load, only timezone aware timestamps are copied into the index, and
+    processes reading the same data share the page cache.
+    """
+    _SEPARATOR: ClassVar[str] = "_"
+    _META: ClassVar[str] = "meta.json"
+    _TIME: ClassVar[str] = "time"
+    _COLUMN_EXT: ClassVar[str] = ".npy"
+    _TEMP_EXT: ClassVar[str] = ".tmp"
+    _PROVIDER: ClassVar[str] = "PROVIDER"
+    _SYMBOL: ClassVar[str] = "SYMBOL"
+    _TIMEFRAME: ClassVar[str] = "TIMEFRAME"
+    _START: ClassVar[str] = "START"
+    _END: ClassVar[str] = "END"
+    _ROWS: ClassVar[str] = "ROWS"
+
+    STORE_DIR: ClassVar[str] = config.data_manager.store_directory
+
+    @classmethod
+    def find(cls) -> pd.DataFrame:
+        """Return list of stored ticker"""
+        data = []
+        if os.path.exists(cls.STORE_DIR):
+            for name in sorted(os.listdir(cls.STORE_DIR)):
+                meta = cls._read_meta(cls.STORE_DIR + name)
+                if meta is not None:
+                    data.append((meta["provider"], meta["symbol"], meta["timeframe"],
+                                 pd.Timestamp(meta["first"]), pd.Timestamp(meta["last"]),
+                                 meta["rows"]))
+
+        return pd.DataFrame(data, columns=[cls._PROVIDER, cls._SYMBOL, cls._TIMEFRAME,
+                                           cls._START, cls._END, cls._ROWS])
+
+    @classmethod
+    def exist(cls, provider: str, symbol: Symbol, timeframe: Timeframe) -> bool:
+        """Return true if the ticker is stored"""
+        return os.path.exists(cls.generate_path(provider, symbol, timeframe) + cls._META)
+
+    @classmethod
+    def write(cls, provider: str, ticker: Ticker) -> str:
+        """Store the ticker columns and return the directory"""
+        path = cls.generate_path(provider, ticker.symbol, ticker.timeframe)
+        if os.path.exists(path):
+            raise FileExistsError(path)
+
+        # written aside and renamed, readers never see half written columns
+        temp = path[:-1] + cls._TEMP_EXT + os.sep
+        shutil.rmtree(temp, ignore_errors=True)
+        os.makedirs(temp)
+
+        data = ticker.data
+        index = data.index
+        times = index.tz_convert("UTC") if index.tz is not None else index
+        np.save(temp + cls._TIME + cls._COLUMN_EXT, times.asi8)
+        for column in data.columns:
+            np.save(temp + column + cls._COLUMN_EXT, data[column].to_numpy())
+
+        meta = {"provider": provider, "symbol": ticker.symbol.name,
+                "timeframe": ticker.timeframe.name,
+                "start": str(ticker.start), "end": str(ticker.end),
+                "first": str(index[0]) if len(index) else None,
+                "last": str(index[-1]) if len(index) else None,
+                "rows": len(index), "tz": str(index.tz) if index.tz is not None else None,
+                "index": index.name, "columns": list(data.columns),
+                "reversed": ticker.reversed, "digit": ticker.digit, "prices": ticker.prices}
+        with open(temp + cls._META, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+        os.replace(temp, path)
+        return path
+
+    @classmethod
+    def open(cls, provider: str, symbol: Symbol, timeframe: Timeframe,
+             start: dt=None, end: dt=None) -> Ticker | None:
+        """Return the stored ticker on memory maps, optionally between start
+        and end (included), the range is found by binary search on the timestamps"""
+        path = cls.generate_path(provider, symbol, timeframe)
+        meta = cls._read_meta(path)
+        if meta is None:
+            return None
+
+        times = cls._load(path, cls._TIME)
+        (first, last) = (0, len(times))
+        if start is not None:
+            first = int(np.searchsorted(times, cls._utc_value(start, meta["tz"]), side="left"))
+        if end is not None:
+            last = int(np.searchsorted(times, cls._utc_value(end, meta["tz"]), side="right"))
+
+        index = cls._index(times[first:last], meta["tz"])
+        index.name = meta["index"]
+        data = pd.DataFrame({column: cls._load(path, column)[first:last]
+                             for column in meta["columns"]}, index=index, copy=False)
+
+        return Ticker(symbol, start or pd.Timestamp(meta["start"]).to_pydatetime(),
+                      end or pd.Timestamp(meta["end"]).to_pydatetime(), timeframe, data,
+                      meta["reversed"], meta["digit"], meta["prices"])
+
+    @classmethod
+    def remove(cls, provider: str, symbol: Symbol, timeframe: Timeframe) -> bool:
+        """Return true if deletion successful"""
+        path = cls.generate_path(provider, symbol, timeframe)
+        if not os.path.exists(path):
+            return False
+
+        shutil.rmtree(path)
+        return not os.path.exists(path)
+
+    @classmethod
+    def generate_path(cls, provider: str, symbol: Symbol, timeframe: Timeframe) -> str:
+        """Generate the directory of the stored ticker"""
+        name = cls._SEPARATOR.join([provider, symbol.value.replace("_", "-"),
+                                    timeframe.name.replace("_", "-")])
+        return cls.STORE_DIR + name + os.sep
+
+    @classmethod
+    def _read_meta(cls, path: str) -> dict | None:
+        path = path if path.endswith(os.sep) else path + os.sep
+        if not os.path.exists(path + cls._META):
+            return None
+
+        with open(path + cls._META, encoding="utf-8") as file:
+            return json.load(file)
+
+    @classmethod
+    def _load(cls, path: str, column: str) -> np.ndarray:
+        # plain array view of the map, the memmap subclass leaks into computed columns
+        return np.asarray(np.load(path + column + cls._COLUMN_EXT, mmap_mode="r"))
+
+    @classmethod
+    def _utc_value(cls, datetime: dt, tz: str | None) -> int:
+        timestamp = pd.Timestamp(datetime)
+        if tz is not None:
+            timestamp = timestamp.tz_localize(tz) if timestamp.tzinfo is None \
+                else timestamp.tz_convert(tz)
+            timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+        return timestamp.as_unit("ns").value
+
+    @classmethod
+    def _index(cls, times: np.ndarray, tz: str | None) -> pd.DatetimeIndex:
+        values = times.view("datetime64[ns]")
+        if tz is None:
+            return pd.DatetimeIndex(values, copy=False)
+
+        # localizing copies the timestamps, the data columns stay on the maps
+        return pd.DatetimeIndex(values, copy=False).tz_localize("UTC").tz_convert(tz)
@@ -1,13 +1,16 @@
 """Module of Ticker Class"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 from typing import ClassVar, Self
+import hashlib
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from ..common.asset import AssetPairCode as Symbol
 from ..common.trade import Timeframe
 from .tick import Tick
+from .profile import HourlyProfile
 
 plt.style.use("seaborn-v0_8")
 
@@ -16,6 +19,18 @@ class Ticker():
     """Ticker Class"""
     _FIGURE_SIZE: ClassVar[tuple[float, float]] = (12, 8)
     _SYMBOL_DELIMITER: ClassVar[str] = "_"
+    _CROSS_SIGNIFICANT_DIGITS: ClassVar[int] = 6
+    _PRICES: ClassVar[tuple[str, ...]] = ("ask", "bid", "mid")
+    _INT_TYPES: ClassVar[tuple[type, ...]] = (np.int8, np.int16, np.int32, np.int64)
+    _FINGERPRINT_SIZE: ClassVar[int] = 16
+    _BAR_COLUMNS: ClassVar[tuple[str, ...]] = ("ask_open", "ask_high", "ask_low",
+                                               "bid_open", "bid_high", "bid_low",
+                                               "mid_open", "mid_high", "mid_low",
+                                               "spread_max", "spread_mean", "count")
+
+    PRICE_FLOAT64: ClassVar[str] = "float64"
+    PRICE_FLOAT32: ClassVar[str] = "float32"
+    PRICE_POINTS: ClassVar[str] = "points"
 
     symbol: Symbol
     start: dt
@@ -23,6 +38,15 @@ class Ticker():
     timeframe: Timeframe
     data: pd.DataFrame
     reversed: bool = False
+    digit: int = None
+    prices: str = PRICE_FLOAT64
+    bars: bool = None
+    fingerprint: str = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Post initialization, data with every bar column are bars unless told"""
+        if self.bars is None:
+            object.__setattr__(self, "bars", self.is_bar_data(self.data))
 
     def get_data(self, index: int = None,
                  datetime: str = None) -> pd.DataFrame | Tick | None:
@@ -31,7 +55,8 @@ class Ticker():
             return None
 
         if index is None and datetime is None:
-            return self.data.copy()
+            # compact data is decoded, callers always get float prices and the digit
+            return self.expand().data if self.is_compact() else self.data.copy()
 
         if index is not None:
             row = self.data.iloc[index]
@@ -45,6 +70,13 @@ class Ticker():
                 print(exp)
                 return None
 
+        if self.is_compact():
+            return Tick(self.symbol, row.name,
+                        self._decode_price("ask", row.ask), self._decode_price("bid", row.bid),
+                        self._decode_price("mid", row.mid),
+                        int(row.volume), self.digit,
+                        int(row.spread))
+
         return Tick(self.symbol, row.name,
                     row.ask, row.bid, row.mid,
                     int(row.volume), int(row.digit),
@@ -66,11 +98,88 @@ class Ticker():
 
     def get_digit(self) -> int:
         """Return symbol's decimal place"""
+        if self.digit is not None:
+            return self.digit
+
         if self.data is None:
             return 0
 
         return int(self.data.iloc[0].digit)
 
+    def get_fingerprint(self) -> str:
+        """Return the content fingerprint of the data, computed on first use"""
+        if self.fingerprint is None:
+            object.__setattr__(self, "fingerprint",
+                               self.compute_fingerprint(self.data, self.digit, self.prices))
+
+        return self.fingerprint
+
+    def get_range(self, start: dt, end: dt) -> Self:
+        """Return the ticker of the data between start and end (included)"""
+        (start_ts, end_ts) = (pd.Timestamp(start), pd.Timestamp(end))
+        if self.data.index.tz is not None:
+            (start_ts, end_ts) = (self._localize(start_ts, self.data.index.tz),
+                                  self._localize(end_ts, self.data.index.tz))
+
+        return Ticker(self.symbol, start, end, self.timeframe,
+                      self.data.loc[start_ts:end_ts], self.reversed, self.digit, self.prices,
+                      self.bars)
+
+    def get_prices(self, column: str="mid") -> np.ndarray:
+        """Return the prices of the column as float64, whatever the representation"""
+        return self._decode_price(column, self.data[column].to_numpy())
+
+    def is_compact(self) -> bool:
+        """Return true if the digit is kept as metadata instead of a column"""
+        return self.digit is not None
+
+    def compact(self, prices: str=PRICE_FLOAT32) -> Self | None:
+        """Return the ticker with the digit as metadata, integer columns in the smallest
+        safe integer type and prices as float64, float32 or int32 points"""
+        if self.data is None:
+            return None
+
+        if prices not in (self.PRICE_FLOAT64, self.PRICE_FLOAT32, self.PRICE_POINTS):
+            raise ValueError(f"Unknown price representation: {prices}")
+
+        if self.is_compact():
+            return self if prices == self.prices else self.expand().compact(prices)
+
+        digit = self.get_digit()
+        df = self.data.drop(columns="digit")
+        for column in df.columns:
+            values = df[column].to_numpy()
+            if self._is_price(column) and prices == self.PRICE_FLOAT32:
+                df[column] = values.astype(np.float32)
+            elif self._is_price(column) and prices == self.PRICE_POINTS:
+                points = np.rint(values * self._price_scale(column, digit))
+                if len(points) and np.abs(points).max() > np.iinfo(np.int32).max:
+                    raise ValueError(f"{column} does not fit in int32 points")
+                df[column] = points.astype(np.int32)
+            elif np.issubdtype(values.dtype, np.integer):
+                df[column] = self._smallest_int(values)
+
+        return Ticker(self.symbol, self.start, self.end, self.timeframe,
+                      df, self.reversed, digit, prices, self.bars)
+
+    def expand(self) -> Self:
+        """Return the ticker with float64 prices, int64 integers and the digit column"""
+        if not self.is_compact():
+            return self
+
+        df = self.data.copy()
+        for column in df.columns:
+            if self._is_price(column):
+                df[column] = self._decode_price(column, df[column].to_numpy())
+            elif np.issubdtype(df[column].dtype, np.integer):
+                df[column] = df[column].astype(np.int64)
+
+        position = df.columns.get_loc("volume") + 1 if "volume" in df.columns else len(df.columns)
+        df.insert(position, "digit", np.full(len(df.index), self.digit, dtype=np.int64))
+
+        return Ticker(self.symbol, self.start, self.end, self.timeframe, df, self.reversed,
+                      bars=self.bars)
+
     def plot(self):
         """Plot ticker data"""
         if self.data is None:
@@ -80,22 +189,24 @@ class Ticker():
             self.data.mid.plot(title=title, figsize=self._FIGURE_SIZE)
 
     def resample(self, to_timeframe: Timeframe) -> Self | None:
-        """Resample ticker data from lower to higher timeframe"""
+        """Resample ticker data from lower to higher timeframe into OHLC bars"""
         if self.data is None:
             return None
 
+        if self.is_compact():
+            return self.expand().resample(to_timeframe)
+
         tf_start_id = self.timeframe.value.id
         tf_end_id   = to_timeframe.value.id
 
         if tf_end_id > tf_start_id:
-            df = self.data.resample(
-                to_timeframe.value.resample, label="right").last().ffill()
+            df = self._aggregate(to_timeframe)
 
             print(f"{self.symbol.value} - Resampling {self.timeframe.value.description} -> "
                   f"{to_timeframe.value.description} successful")
 
             return Ticker(self.symbol, self.start, self.end,
-                      to_timeframe, df)
+                      to_timeframe, df, self.reversed, bars=True)
 
         print(f"{self.symbol.value} - Resampling to lower and equal timeframe is not allowed. "
               f"{self.timeframe.value.description} -> {to_timeframe.value.description}")
@@ -107,6 +218,9 @@ class Ticker():
         if self.data is None and ticker.data is None:
             return None
 
+        if self.is_compact() or ticker.is_compact():
+            return self.expand().append(ticker.expand())
+
         tf_self_id = self.timeframe.value.id
         tf_them_id = ticker.timeframe.value.id
 
@@ -114,8 +228,7 @@ class Ticker():
         symbol_them = ticker.symbol.value
 
         if tf_self_id == tf_them_id and symbol_self == symbol_them:
-            df = pd.concat(
-                [self.data, ticker.data]).drop_duplicates().sort_index()
+            df = self.merge_data(self.data, ticker.data)
             print("Appending successful")
 
             return Ticker(self.symbol, min(self.start, ticker.start), max(self.end, ticker.end),
@@ -128,42 +241,135 @@ class Ticker():
 
         return None
 
+    @classmethod
+    def merge_data(cls, data: pd.DataFrame, other: pd.DataFrame) -> pd.DataFrame:
+        """Return two time ordered data merged in time order,
+        rows of the other data replace the rows with the same time"""
+        if data is None or len(data.index) <= 0:
+            return other.copy()
+
+        if other is None or len(other.index) <= 0:
+            return data.copy()
+
+        if not (data.index.is_monotonic_increasing and other.index.is_monotonic_increasing):
+            df = pd.concat([data, other])
+            return df.loc[~df.index.duplicated(keep="last")].sort_index(kind="stable")
+
+        # the other data starts after the data ends, nothing to merge
+        if data.index[-1] < other.index[0]:
+            return pd.concat([data, other])
+
+        (times, other_times) = (data.index.as_unit("ns").asi8, other.index.as_unit("ns").asi8)
+        found = np.minimum(np.searchsorted(other_times, times), len(other_times) - 1)
+        kept = other_times[found] != times
+
+        # final position of every row of the other data, the kept rows fill the rest
+        length = np.count_nonzero(kept) + len(other_times)
+        is_other = np.zeros(length, dtype=bool)
+        is_other[np.searchsorted(times[kept], other_times) + np.arange(len(other_times))] = True
+        order = np.empty(length, dtype=np.intp)
+        order[~is_other] = np.arange(length - len(other_times))
+        order[is_other] = np.arange(length - len(other_times), length)
+
+        return pd.concat([data.loc[kept], other]).take(order)
+
     def reverse(self) -> Self | None:
         """Return the multiplicative inverse (or reciprocal) of 
         the ticker data for the currency pair"""
         if self.data is None:
             return None
 
+        if self.is_compact():
+            return self.expand().reverse()
+
         [base, quote] = self.symbol.value.split(self._SYMBOL_DELIMITER)
         print(f"Reversing {self.symbol.value} to {quote}_{base}")
 
         df = self.data.copy()
-        df["ask_temp"] = df.ask
-        df.ask = 1 / df.bid
-        df.bid = 1 / df.ask_temp
-        df.mid = 1 / df.mid
-        df = df.drop(columns="ask_temp", axis=1)
+        digits = df.digit.to_numpy()
+        (ask, bid) = (1 / df.bid.to_numpy(), 1 / df.ask.to_numpy())
+        df["ask"] = self._round(ask, digits)
+        df["bid"] = self._round(bid, digits)
+        df["mid"] = self._round(1 / df.mid.to_numpy(), digits)
+        df["spread"] = self._points(df.ask.to_numpy() - df.bid.to_numpy(), digits)
+
+        if "ask_open" in df.columns:
+            # the reciprocal swaps the sides and turns the highs into lows
+            data = self.data
+            for (side, opposite) in (("open", "open"), ("high", "low"), ("low", "high")):
+                df["ask_" + side] = self._round(1 / data["bid_" + opposite].to_numpy(), digits)
+                df["bid_" + side] = self._round(1 / data["ask_" + opposite].to_numpy(), digits)
+                df["mid_" + side] = self._round(1 / data["mid_" + opposite].to_numpy(), digits)
+            # spreads in points of the reciprocal are only known at the close
+            df = df.drop(columns=["spread_max", "spread_mean"])
 
-        df.ask = df.apply(lambda x: round(x.ask, x.digit.astype(int)), axis=1)
-        df.bid = df.apply(lambda x: round(x.bid, x.digit.astype(int)), axis=1)
-        df.mid = df.apply(lambda x: round(x.mid, x.digit.astype(int)), axis=1)
+        return Ticker(self.symbol, self.start, self.end,
+                      self.timeframe, df, True, bars=self.bars)
 
-        df.spread = round((df.ask - df.bid) * pow(10, df.digit), 0).apply(int)
+    def cross(self, ticker: Self, digit: int=None) -> Self | None:
+        """Return the cross rate of two tickers sharing a currency,
+        e.g. EUR_USD and USD_JPY give EUR_JPY. The digit defaults to
+        the one of the ticker quoted in the cross currency"""
+        if self.data is None or ticker.data is None:
+            return None
 
-        return Ticker(self.symbol, self.start, self.end,
-                      self.timeframe, df, True)
+        if self.is_compact() or ticker.is_compact():
+            return self.expand().cross(ticker.expand(), digit)
+
+        if self.timeframe != ticker.timeframe:
+            print(f"Only crossing tickers with the same timeframe is allowed. "
+                  f"{self.timeframe.value.description} -> "
+                  f"{ticker.timeframe.value.description}")
+            return None
+
+        legs = self._cross_legs(ticker)
+        if legs is None:
+            print(f"{self.symbol.value} and {ticker.symbol.value} share no currency")
+            return None
+
+        ((first, first_inverted), (second, second_inverted), symbol) = legs
+        columns = ["ask", "bid", "volume", "digit"]
+        df = first.data[columns].join(second.data[columns], how="inner",
+                                      lsuffix="_1", rsuffix="_2")
+        if len(df.index) <= 0:
+            print(f"{self.symbol.value} and {ticker.symbol.value} have no common tick")
+            return None
+
+        quote = symbol.value.split(self._SYMBOL_DELIMITER)[1]
+        quoted = [suffix for (leg, inverted, suffix) in ((first, first_inverted, "_1"),
+                                                         (second, second_inverted, "_2"))
+                  if not inverted and leg.get_currencies()[1] == quote]
+        (ask_1, bid_1) = self._orient(df.ask_1.to_numpy(), df.bid_1.to_numpy(), first_inverted)
+        (ask_2, bid_2) = self._orient(df.ask_2.to_numpy(), df.bid_2.to_numpy(), second_inverted)
+        if digit is None and quoted:
+            digit = int(df["digit" + quoted[0]].iloc[0])
+        elif digit is None:
+            # no ticker is quoted in the cross currency, keep the usual significant digits
+            price = np.median(bid_1 * bid_2)
+            digit = max(0, self._CROSS_SIGNIFICANT_DIGITS - 1 - int(np.floor(np.log10(price))))
+
+        ask = np.round(ask_1 * ask_2, digit)
+        bid = np.round(bid_1 * bid_2, digit)
+
+        data = pd.DataFrame({"ask": ask,
+                             "bid": bid,
+                             "mid": np.round((ask + bid) / 2, digit + 1),
+                             "volume": np.minimum(df.volume_1.to_numpy(), df.volume_2.to_numpy()),
+                             "digit": np.full(len(df.index), digit, dtype=np.int64),
+                             "spread": self._points(ask - bid, digit)}, index=df.index)
+
+        print(f"Crossing {self.symbol.value} and {ticker.symbol.value} to {symbol.value}")
+        return Ticker(symbol, data.index[0].to_pydatetime(), data.index[-1].to_pydatetime(),
+                      self.timeframe, data)
+
+    def get_currencies(self) -> tuple[str, str]:
+        """Return the base and quote currency of the ticker data"""
+        [base, quote] = self.symbol.value.split(self._SYMBOL_DELIMITER)
+        return (quote, base) if self.reversed else (base, quote)
 
     def analyze(self, plot_data: bool=True) -> pd.DataFrame:
         """Analyze ticker data and return the result"""
-        df = self.data.copy()
-        df["hour"] = df.index.hour
-        df["change"] = df.mid.diff().fillna(0).abs() * pow(10, df.digit)
-        df["change"] = df["change"].apply(int)
-
-        by_hour = df.groupby("hour")[["volume", "spread", "change"]].mean()
-        by_hour["mean"] = by_hour["volume"].mean()
-        by_hour["cover"] = by_hour["change"] > by_hour["spread"]
-        by_hour["color"] = by_hour.apply(self._produce_color, axis=1)
+        by_hour = HourlyProfile().update(self.expand().data).to_frame()
 
         if plot_data:
             title = f"{self.symbol.value} - by Hour"
@@ -177,10 +383,158 @@ class Ticker():
 
         return by_hour
 
-    def _produce_color(self, df: pd.DataFrame) -> str:
-        if not df["cover"]:
-            return "red"
-        elif df["cover"] and df["volume"] > df["mean"]:
-            return "darkgreen"
-        else:
-            return "gray"
+    def _aggregate(self, to_timeframe: Timeframe) -> pd.DataFrame:
+        """Return the data aggregated into bars labeled by their right edge,
+        buckets are aligned on UTC and empty buckets are dropped"""
+        data = self.data
+        period = to_timeframe.value.seconds * 1_000_000_000
+        buckets = self._buckets(to_timeframe)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)] - 1
+
+        index = pd.DatetimeIndex((buckets[starts] + 1) * period, name=data.index.name)
+        index = index.tz_localize("UTC").tz_convert(data.index.tz)
+
+        def column(name: str, fallback: str) -> np.ndarray:
+            # lower timeframes may already be bars
+            return data[name if self.bars else fallback].to_numpy()
+
+        weights = data["count"].to_numpy() if self.bars \
+            else np.ones(len(buckets), dtype=np.int64)
+        count = np.add.reduceat(weights, starts)
+        spread_sum = column("spread_mean", "spread") * weights
+
+        df = pd.DataFrame({"ask": data.ask.to_numpy()[ends],
+                           "bid": data.bid.to_numpy()[ends],
+                           "mid": data.mid.to_numpy()[ends],
+                           "volume": np.add.reduceat(data.volume.to_numpy(), starts),
+                           "digit": data.digit.to_numpy()[ends],
+                           "spread": data.spread.to_numpy()[ends]}, index=index)
+        for price in self._PRICES:
+            df[price + "_open"] = column(price + "_open", price)[starts]
+            df[price + "_high"] = np.maximum.reduceat(column(price + "_high", price), starts)
+            df[price + "_low"] = np.minimum.reduceat(column(price + "_low", price), starts)
+        df["spread_max"] = np.maximum.reduceat(column("spread_max", "spread"), starts)
+        df["spread_mean"] = np.add.reduceat(spread_sum, starts) / count
+        df["count"] = count
+
+        return df
+
+    def _buckets(self, to_timeframe: Timeframe) -> np.ndarray:
+        """Return the bucket of every row in the higher timeframe"""
+        stamps = self.data.index.as_unit("ns").asi8
+        if self.bars:
+            # bars are labeled by their right edge, provider candles by their start
+            stamps = stamps - self.timeframe.value.seconds * 1_000_000_000
+
+        return stamps // (to_timeframe.value.seconds * 1_000_000_000)
+
+    def _cross_legs(self, ticker: Self) -> tuple | None:
+        """Return both tickers oriented as base/common and common/quote
+        with the symbol of the cross"""
+        ((base_1, quote_1), (base_2, quote_2)) = (self.get_currencies(),
+                                                  ticker.get_currencies())
+        for (first_inverted, second_inverted) in ((False, False), (False, True),
+                                                  (True, False), (True, True)):
+            first = (quote_1, base_1) if first_inverted else (base_1, quote_1)
+            second = (quote_2, base_2) if second_inverted else (base_2, quote_2)
+            if first[1] != second[0] or first[0] == second[1]:
+                continue
+
+            symbols = {symbol.value: symbol for symbol in Symbol}
+            name = first[0] + self._SYMBOL_DELIMITER + second[1]
+            inverse = second[1] + self._SYMBOL_DELIMITER + first[0]
+            if name in symbols:
+                return ((self, first_inverted), (ticker, second_inverted), symbols[name])
+            if inverse in symbols:
+                return ((ticker, not second_inverted), (self, not first_inverted),
+                        symbols[inverse])
+
+        return None
+
+    @classmethod
+    def is_bar_data(cls, data: pd.DataFrame) -> bool:
+        """Return true if the data has every column of resampled bars"""
+        return data is not None and all(column in data.columns for column in cls._BAR_COLUMNS)
+
+    @classmethod
+    def compute_fingerprint(cls, data: pd.DataFrame, digit: int=None,
+                            prices: str=PRICE_FLOAT64) -> str:
+        """Return the blake2b hash of the column names, types and raw buffers of the
+        data, the same rows give the same fingerprint whatever the file format"""
+        digest = hashlib.blake2b(digest_size=cls._FINGERPRINT_SIZE)
+        if data is None:
+            return digest.hexdigest()
+
+        index = data.index
+        times = index.tz_convert("UTC") if getattr(index, "tz", None) is not None else index
+        header = ([str(column) for column in data.columns], [str(dtype) for dtype in data.dtypes],
+                  str(getattr(index, "tz", None)), digit, prices)
+        digest.update(repr(header).encode())
+        columns = [times.asi8 if isinstance(times, pd.DatetimeIndex) else times.to_numpy()]
+        columns += [data[column].to_numpy() for column in data.columns]
+        for values in columns:
+            if values.dtype.hasobject:
+                values = pd.util.hash_array(values)
+            # hashed straight from the buffers, nothing is formatted
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+
+        return digest.hexdigest()
+
+    @classmethod
+    def _is_price(cls, column: str) -> bool:
+        return column.split("_")[0] in cls._PRICES
+
+    @classmethod
+    def _price_scale(cls, column: str, digit: int) -> float:
+        # mid prices have half points
+        return pow(10.0, digit + 1 if column.startswith("mid") else digit)
+
+    @classmethod
+    def _smallest_int(cls, values: np.ndarray) -> np.ndarray:
+        if len(values) <= 0:
+            return values
+
+        (low, high) = (values.min(), values.max())
+        for int_type in cls._INT_TYPES:
+            if np.iinfo(int_type).min <= low and high <= np.iinfo(int_type).max:
+                return values.astype(int_type)
+
+        return values
+
+    def _decode_price(self, column: str, values: np.ndarray | float) -> np.ndarray | float:
+        if self.prices == self.PRICE_POINTS:
+            return values / self._price_scale(column, self.digit)
+
+        if self.prices == self.PRICE_FLOAT32:
+            # float32 keeps the price to the digit, rounding restores the float64 value
+            precision = self.digit + 1 if column.startswith("mid") else self.digit
+            return np.round(np.asarray(values, dtype=np.float64), precision)
+
+        return values
+
+    @classmethod
+    def _localize(cls, timestamp: pd.Timestamp, tz) -> pd.Timestamp:
+        return timestamp.tz_localize(tz) if timestamp.tzinfo is None \
+            else timestamp.tz_convert(tz)
+
+    @classmethod
+    def _orient(cls, ask: np.ndarray, bid: np.ndarray,
+                inverted: bool) -> tuple[np.ndarray, np.ndarray]:
+        return (1 / bid, 1 / ask) if inverted else (ask, bid)
+
+    @classmethod
+    def _round(cls, values: np.ndarray, digits: np.ndarray) -> np.ndarray:
+        # the digit is constant per ticker, the masks are only a fallback
+        if digits.min() == digits.max():
+            return np.round(values, int(digits[0]))
+
+        result = np.empty_like(values)
+        for digit in np.unique(digits):
+            mask = digits == digit
+            result[mask] = np.round(values[mask], int(digit))
+        return result
+
+    @classmethod
+    def _points(cls, values: np.ndarray, digits: np.ndarray | int) -> np.ndarray:
+        return np.rint(values * np.power(10.0, digits)).astype(np.int64)
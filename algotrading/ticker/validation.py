@@ -0,0 +1,160 @@
+"""Module of Ticker Validator Class"""
+from dataclasses import dataclass, field
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+
+from .ticker import Ticker
+
+@dataclass
+class ValidationReport():
+    """Ticker validation report, counts of bad rows and the gaps"""
+    rows: int = 0
+    duplicates: int = 0
+    unsorted: int = 0
+    crossed: int = 0
+    invalid_prices: int = 0
+    negative_spreads: int = 0
+    huge_spreads: int = 0
+    gaps: pd.DataFrame = field(default=None, repr=False)
+
+    def get_gap_count(self) -> int:
+        """Return number of gap"""
+        return 0 if self.gaps is None else len(self.gaps.index)
+
+    def get_largest_gap(self) -> float:
+        """Return the largest missing trading time in seconds"""
+        return 0.0 if not self.get_gap_count() else float(self.gaps.seconds.max())
+
+    def get_issue_count(self) -> int:
+        """Return number of bad rows"""
+        return (self.duplicates + self.unsorted + self.crossed + self.invalid_prices
+                + self.negative_spreads + self.huge_spreads)
+
+    def is_valid(self) -> bool:
+        """Return true without bad rows and gaps"""
+        return self.get_issue_count() == 0 and self.get_gap_count() == 0
+
+    def to_dict(self) -> dict:
+        """Return the counts as dictionary"""
+        return {"rows": self.rows, "duplicates": self.duplicates, "unsorted": self.unsorted,
+                "crossed": self.crossed, "invalid_prices": self.invalid_prices,
+                "negative_spreads": self.negative_spreads, "huge_spreads": self.huge_spreads,
+                "gaps": self.get_gap_count(), "largest_gap": self.get_largest_gap()}
+
+@dataclass
+class TickerValidator():
+    """Ticker Validator Class
+
+    Checks ticker data with array operations for duplicate and unsorted
+    timestamps, ask below bid, missing or non positive prices, negative or
+    huge spreads (above spread_factor times the median) and gaps longer than
+    max_gap bars of the timeframe. Gaps are measured in trading time, the
+    weekends (Saturday and Sunday UTC) are not counted.
+    """
+    _DAY: ClassVar[int] = 86400 * pow(10, 9)
+    _WEEK_DAYS: ClassVar[int] = 7
+    _TRADING_DAYS: ClassVar[int] = 5
+    # 1970-01-01 is a Thursday, days + 3 are counted from a Monday
+    _EPOCH_WEEKDAY: ClassVar[int] = 3
+    _GAP_START: ClassVar[str] = "start"
+    _GAP_END: ClassVar[str] = "end"
+    _GAP_SECONDS: ClassVar[str] = "seconds"
+    _GAP_MISSING: ClassVar[str] = "missing"
+
+    spread_factor: float = 50
+    max_gap: float = 1
+
+    def validate(self, ticker: Ticker) -> ValidationReport:
+        """Return the validation report of the ticker"""
+        report = ValidationReport(rows=ticker.get_length())
+        if not report.rows:
+            report.gaps = self._gaps(np.empty(0, dtype=np.int64), ticker)
+            return report
+
+        masks = self._masks(ticker)
+        for (name, mask) in masks.items():
+            setattr(report, name, int(np.count_nonzero(mask)))
+
+        report.gaps = self._gaps(self._times(ticker), ticker)
+        return report
+
+    def repair(self, ticker: Ticker) -> Ticker:
+        """Return the ticker sorted, without duplicate (the last row is kept)
+        and without bad rows, gaps are left as they are"""
+        data = ticker.data
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index(kind="stable")
+        data = data.loc[~data.index.duplicated(keep="last")]
+
+        repaired = Ticker(ticker.symbol, ticker.start, ticker.end, ticker.timeframe, data,
+                          ticker.reversed, ticker.digit, ticker.prices)
+        masks = self._masks(repaired)
+        bad = masks["crossed"] | masks["invalid_prices"] | masks["negative_spreads"] \
+            | masks["huge_spreads"]
+
+        return Ticker(ticker.symbol, ticker.start, ticker.end, ticker.timeframe,
+                      data.loc[~bad], ticker.reversed, ticker.digit, ticker.prices)
+
+    def _masks(self, ticker: Ticker) -> dict[str, np.ndarray]:
+        data = ticker.data
+        times = self._times(ticker)
+        (ask, bid) = (ticker.get_prices("ask"), ticker.get_prices("bid"))
+        mid = ticker.get_prices("mid") if "mid" in data.columns else (ask + bid) / 2
+        spread = data.spread.to_numpy() if "spread" in data.columns else np.zeros(len(times))
+
+        steps = np.diff(times)
+        if np.all(steps >= 0):
+            # sorted, equal timestamps are neighbours
+            duplicates = np.r_[steps == 0, False]
+        else:
+            duplicates = data.index.duplicated(keep="last")
+
+        with np.errstate(invalid="ignore"):
+            invalid = ~(np.isfinite(ask) & np.isfinite(bid) & np.isfinite(mid)) \
+                | (ask <= 0) | (bid <= 0) | (mid <= 0)
+            median = np.median(spread[spread > 0]) if np.any(spread > 0) else 0
+
+            return {"duplicates": duplicates,
+                    "unsorted": np.r_[False, steps < 0],
+                    "crossed": ask < bid,
+                    "invalid_prices": invalid,
+                    "negative_spreads": spread < 0,
+                    "huge_spreads": (spread > self.spread_factor * median) if median
+                                    else np.zeros(len(times), dtype=bool)}
+
+    def _gaps(self, times: np.ndarray, ticker: Ticker) -> pd.DataFrame:
+        seconds = ticker.timeframe.value.seconds
+        times = np.sort(times, kind="stable") if np.any(np.diff(times) < 0) else times
+        times = times[np.r_[True, np.diff(times) != 0]] if len(times) else times
+        trading = self.to_trading_time(times)
+        elapsed = np.diff(trading) / pow(10, 9)
+        positions = np.flatnonzero(elapsed > seconds * self.max_gap)
+
+        tz = ticker.data.index.tz if ticker.data is not None else None
+        (starts, ends) = (pd.to_datetime(times[positions], utc=True),
+                          pd.to_datetime(times[positions + 1], utc=True))
+        if tz is not None:
+            (starts, ends) = (starts.tz_convert(tz), ends.tz_convert(tz))
+        else:
+            (starts, ends) = (starts.tz_localize(None), ends.tz_localize(None))
+
+        return pd.DataFrame({self._GAP_START: starts, self._GAP_END: ends,
+                             self._GAP_SECONDS: elapsed[positions],
+                             self._GAP_MISSING: (elapsed[positions] // seconds - 1)
+                                                .astype(np.int64)})
+
+    @classmethod
+    def _times(cls, ticker: Ticker) -> np.ndarray:
+        index = ticker.data.index
+        # constants are in nanoseconds, whatever the unit of the stored index
+        return (index.tz_convert("UTC") if index.tz is not None else index).as_unit("ns").asi8
+
+    @classmethod
+    def to_trading_time(cls, times: np.ndarray) -> np.ndarray:
+        """Return nanoseconds since the epoch without the weekends"""
+        days = times // cls._DAY + cls._EPOCH_WEEKDAY
+        weeks = days // cls._WEEK_DAYS
+        week_start = (weeks * cls._WEEK_DAYS - cls._EPOCH_WEEKDAY) * cls._DAY
+        in_week = np.minimum(times - week_start, cls._TRADING_DAYS * cls._DAY)
+        return weeks * cls._TRADING_DAYS * cls._DAY + in_week
@@ -0,0 +1,36 @@
+"""Run the benchmark suite
+
+Usage (from the repository root):
+    python -m benchmarks --sizes 10000 100000 --pattern "ticker.*"
+    python -m benchmarks --compare benchmarks/results/A.json benchmarks/results/B.json
+"""
+import argparse
+
+from .suite import BenchmarkSuite
+
+def main():
+    """Parse arguments then run or compare benchmarks"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Backtest performance benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BenchmarkSuite.DEFAULT_SIZES,
+                        help="number of bars of the synthetic tickers")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per benchmark")
+    parser.add_argument("--lookups", type=int, default=10_000,
+                        help="number of Ticker.get_data lookups")
+    parser.add_argument("--pattern", default="*", help="glob pattern of benchmark names")
+    parser.add_argument("--output", default=None, help="directory of the JSON result")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two saved results instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(BenchmarkSuite.compare(*args.compare).to_string())
+        return
+
+    suite = BenchmarkSuite(sizes=args.sizes, repeat=args.repeat,
+                           lookups=args.lookups, pattern=args.pattern)
+    suite.run()
+    print(f"Results saved to {suite.save(args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Module of Benchmark Suite Class"""
+from dataclasses import dataclass, field
+from datetime import datetime as dt
+from contextlib import redirect_stdout
+from typing import Any, Callable, ClassVar
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from algotrading.backtesting.components.trade import Trade
+from algotrading.common.trade import PositionType, Timeframe
+from algotrading.data import DataManager
+from algotrading.ticker import Tick, Ticker, TickerGenerator
+
+@dataclass
+class BenchmarkResult:
+    """Benchmark result data definition"""
+    name: str
+    size: int
+    times: list[float]
+
+    @property
+    def min(self) -> float:
+        """Return the fastest run in seconds"""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """Return the median run in seconds"""
+        return statistics.median(self.times)
+
+    def as_dict(self) -> dict:
+        """Return result as dictionary"""
+        return {'name': self.name, 'size': self.size, 'times': self.times,
+                'min': self.min, 'median': self.median}
+
+@dataclass
+class BenchmarkSuite:
+    """Benchmark Suite Class"""
+    DEFAULT_SIZES: ClassVar[list[int]] = [10_000, 100_000, 1_000_000]
+    RESULT_DIR: ClassVar[str] = os.path.join(os.path.dirname(__file__), "results")
+    _FILENAME_FORMAT: ClassVar[str] = "%Y%m%d-%H%M%S"
+
+    sizes: list[int] = field(default_factory=lambda: BenchmarkSuite.DEFAULT_SIZES.copy())
+    repeat: int = 3
+    lookups: int = 10_000
+    pattern: str = "*"
+    seed: int = 0
+    results: list[BenchmarkResult] = field(init=False, default_factory=list)
+
+    def run(self) -> list[BenchmarkResult]:
+        """Run every benchmark matching the pattern for every size"""
+        benchmarks = {name: bench for name, bench in self._benchmarks().items()
+                      if fnmatch.fnmatch(name, self.pattern)}
+
+        # data manager benchmarks work on a temporary data directory
+        data_dir = DataManager.DATA_DIR
+        with tempfile.TemporaryDirectory() as directory:
+            DataManager.DATA_DIR = directory + os.sep
+            try:
+                for size in self.sizes:
+                    ticker = TickerGenerator(seed=self.seed).gbm(size)
+                    for name, bench in benchmarks.items():
+                        (setup, target) = bench(ticker)
+                        result = self._measure(name, size, setup, target)
+                        self.results.append(result)
+                        print(f"{name:<28} {size:>10,} bars  min: {result.min:9.4f}s  "
+                              f"median: {result.median:9.4f}s", flush=True)
+            finally:
+                DataManager.DATA_DIR = data_dir
+                DataManager.find(reload=True)
+
+        return self.results
+
+    def save(self, directory: str=None) -> str:
+        """Save results as JSON and return the file path"""
+        directory = directory or self.RESULT_DIR
+        os.makedirs(directory, exist_ok=True)
+
+        now = dt.now()
+        path = os.path.join(directory, now.strftime(self._FILENAME_FORMAT) + ".json")
+        content = {'created': now.isoformat(),
+                   'commit': self._commit(),
+                   'environment': {'python': platform.python_version(),
+                                   'numpy': np.__version__,
+                                   'pandas': pd.__version__,
+                                   'machine': platform.machine(),
+                                   'system': platform.system()},
+                   'settings': {'sizes': self.sizes, 'repeat': self.repeat,
+                                'lookups': self.lookups, 'seed': self.seed},
+                   'results': [result.as_dict() for result in self.results]}
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(content, file, indent=2)
+
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> pd.DataFrame:
+        """Return saved results as DataFrame"""
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+
+        df = pd.DataFrame(content["results"]).drop(columns="times")
+        return df.set_index(["name", "size"])
+
+    @classmethod
+    def compare(cls, baseline_path: str, current_path: str) -> pd.DataFrame:
+        """Return median times of two saved runs and their ratio,
+        a ratio below 1 means the current run is faster"""
+        baseline = cls.load(baseline_path)["median"].rename("baseline")
+        current = cls.load(current_path)["median"].rename("current")
+        df = pd.concat([baseline, current], axis="columns", join="inner")
+        df["ratio"] = df["current"] / df["baseline"]
+
+        return df
+
+    def _measure(self, name: str, size: int, setup: Callable[[], Any],
+                 target: Callable[[Any], Any]) -> BenchmarkResult:
+        times = []
+        with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+            for _ in range(self.repeat):
+                state = setup()
+                start = time.perf_counter()
+                target(state)
+                times.append(time.perf_counter() - start)
+
+        return BenchmarkResult(name, size, times)
+
+    def _benchmarks(self) -> dict[str, Callable]:
+        return {"strategy.contrarian": self._bench_contrarian,
+                "strategy.buyandhold": self._bench_buyandhold,
+                "ticker.get_data.index": self._bench_get_data_index,
+                "ticker.get_data.datetime": self._bench_get_data_datetime,
+                "ticker.resample": self._bench_resample,
+                "ticker.reverse": self._bench_reverse,
+                "ticker.analyze": self._bench_analyze,
+                "trade.run_report": self._bench_trade_report,
+                "data_manager.write": self._bench_write,
+                "data_manager.read": self._bench_read}
+
+    def _bench_contrarian(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        # imported here as the strategies load the provider implementations
+        from algotrading.backtesting.strategies import StrategyFactory, ContrarianParams
+
+        params = ContrarianParams(volume=0.1, window=3)
+        return (lambda: StrategyFactory.create_contrarian(ticker, params,
+                                                          include_buyandhold=False),
+                lambda strategy: strategy.run())
+
+    def _bench_buyandhold(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        from algotrading.backtesting.strategies import StrategyFactory, BuyAndHoldParams
+
+        params = BuyAndHoldParams(volume=0.1)
+        return (lambda: StrategyFactory.create_buyandhold(ticker, params),
+                lambda strategy: strategy.run())
+
+    def _bench_get_data_index(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        def target(indexes: np.ndarray):
+            for i in indexes:
+                ticker.get_data(index=i)
+
+        return (lambda: self._random_indexes(ticker), target)
+
+    def _bench_get_data_datetime(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        def target(datetimes: pd.DatetimeIndex):
+            for datetime in datetimes:
+                ticker.get_data(datetime=datetime)
+
+        return (lambda: ticker.data.index[self._random_indexes(ticker)], target)
+
+    def _bench_resample(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        return (lambda: None, lambda _: ticker.resample(Timeframe.HOUR_1))
+
+    def _bench_reverse(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        return (lambda: None, lambda _: ticker.reverse())
+
+    def _bench_analyze(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        return (lambda: None, lambda _: ticker.analyze(plot_data=False))
+
+    def _bench_trade_report(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        # one position every ten bars, alternating long and short
+        def setup() -> Trade:
+            trade = Trade()
+            data = ticker.data.iloc[:len(ticker.data.index) // 10 * 10]
+            for i in range(0, len(data.index) - 1, 10):
+                (tick_open, tick_close) = (self._tick(ticker, data, i),
+                                           self._tick(ticker, data, i + 9))
+                pos_type = PositionType.LONG_BUY if i % 20 == 0 else PositionType.SHORT_SELL
+                price = tick_open.ask if pos_type == PositionType.LONG_BUY else tick_open.bid
+                pos = trade.open_position(ticker.symbol, tick_open.datetime, pos_type,
+                                          0.1, price, 0)
+                trade.close_position(pos.id, tick_close)
+
+            return trade
+
+        return (setup, lambda trade: trade.get_report(rerun=True))
+
+    def _bench_write(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        filename = "BENCHMARK" + DataManager.FILE_EXT
+        return (lambda: self._remove(filename),
+                lambda _: DataManager.write(filename, ticker.data))
+
+    def _bench_read(self, ticker: Ticker) -> tuple[Callable, Callable]:
+        filename = "BENCHMARK" + DataManager.FILE_EXT
+
+        def setup():
+            if not DataManager.exist(filename, reload=True):
+                DataManager.write(filename, ticker.data)
+
+        return (setup, lambda _: DataManager.read(filename, "time"))
+
+    def _remove(self, filename: str):
+        if DataManager.exist(filename, reload=True):
+            DataManager.remove(filename)
+
+    def _random_indexes(self, ticker: Ticker) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        return rng.integers(0, ticker.get_length(), min(self.lookups, ticker.get_length()))
+
+    def _tick(self, ticker: Ticker, data: pd.DataFrame, i: int) -> Tick:
+        row = data.iloc[i]
+        return Tick(ticker.symbol, row.name, row.ask, row.bid, row.mid,
+                    int(row.volume), int(row.digit), int(row.spread))
+
+    def _commit(self) -> str:
+        try:
+            return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,71 @@
+"""Indicator Cache Class Test Suite"""
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrading.backtesting.indicators import IndicatorCache
+from algotrading.common.asset import AssetPairCode as Symbol
+from algotrading.common.trade import Timeframe
+from algotrading.ticker import Ticker
+
+class TestIndicatorCache():
+    """Test suite for IndicatorCache class"""
+    MOCK_INDEX: ClassVar[pd.DatetimeIndex] = pd.date_range(
+        "2023-01-02", periods=8, freq="h", tz="UTC", name="time")
+    MOCK_DATA: ClassVar[pd.DataFrame] = pd.DataFrame({
+            'ask': [1.10012, 1.10032, 1.10022, 1.10042, 1.10042, 1.10002, 1.10012, 1.10052],
+            'bid': [1.10008, 1.10028, 1.10018, 1.10038, 1.10038, 1.09998, 1.10008, 1.10048],
+            'mid': [1.10010, 1.10030, 1.10020, 1.10040, 1.10040, 1.10000, 1.10010, 1.10050],
+            'volume': [10, 12, 8, 15, 3, 9, 11, 7],
+            'digit': [5, 5, 5, 5, 5, 5, 5, 5],
+            'spread': [4, 4, 4, 4, 4, 4, 4, 4]
+        }, index=MOCK_INDEX)
+    MOCK_TICKER: ClassVar[Ticker] = Ticker(Symbol.EUR_USD, MOCK_INDEX[0], MOCK_INDEX[-1],
+                                           Timeframe.HOUR_1, MOCK_DATA)
+
+    def test_returns(self):
+        """Test the log returns match the returns computed by pandas"""
+        cache = IndicatorCache.from_ticker(self.MOCK_TICKER)
+        expected = np.log(self.MOCK_DATA.mid / self.MOCK_DATA.mid.shift(1))
+
+        np.testing.assert_allclose(cache.get_returns(), expected, rtol=0, atol=1e-15)
+        assert cache.get_length() == len(self.MOCK_DATA)
+
+    @pytest.mark.parametrize("window", [1, 2, 3, 7, 8, 20])
+    def test_rolling_returns(self, window: int):
+        """Test the rolling mean matches pandas rolling mean for any window"""
+        cache = IndicatorCache.from_ticker(self.MOCK_TICKER)
+        returns = np.log(self.MOCK_DATA.mid / self.MOCK_DATA.mid.shift(1))
+        expected = returns.rolling(window).mean()
+
+        np.testing.assert_allclose(cache.get_rolling_returns(window), expected,
+                                   rtol=0, atol=1e-15)
+
+    def test_rolling_returns_invalid_window(self):
+        """Test the rolling mean rejects a window lower than 1"""
+        cache = IndicatorCache.from_ticker(self.MOCK_TICKER)
+
+        with pytest.raises(ValueError):
+            cache.get_rolling_returns(0)
+
+    def test_bases_are_read_only(self):
+        """Test the shared bases can not be modified by a strategy"""
+        cache = IndicatorCache.from_ticker(self.MOCK_TICKER)
+
+        with pytest.raises(ValueError):
+            cache.get_returns()[1] = 0
+
+    def test_share_and_attach(self):
+        """Test the cache is shared through shared memory"""
+        cache = IndicatorCache.from_ticker(self.MOCK_TICKER)
+        handle = cache.share()
+        try:
+            attached = IndicatorCache.attach(handle)
+            np.testing.assert_array_equal(attached.get_rolling_returns(3),
+                                          cache.get_rolling_returns(3))
+            attached.release()
+        finally:
+            cache.release()
+
+        assert cache.get_length() == len(self.MOCK_DATA)
@@ -0,0 +1,215 @@
+"""Iterative Base Class Test Suite"""
+import asyncio
+from dataclasses import dataclass
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrading.common.asset import AssetPairCode as Symbol
+from algotrading.common.trade import PositionType
+from algotrading.ticker import Tick, TickerGenerator
+from algotrading.backtesting import BacktestingReport
+from algotrading.backtesting.components.account import Account
+from algotrading.backtesting.profiler import Profiler
+from algotrading.backtesting.strategies.base.implementation import IterativeBase
+
+@dataclass
+class MockStrategy(IterativeBase):
+    """Strategy buying on the first tick"""
+
+    async def run_async(self, chunk_size: int=None):
+        """Start backtesting on the running event loop"""
+        await self.start_async(len(self.data.index), self.on_tick, chunk_size)
+
+    def on_tick(self, i: int):
+        """on each tick"""
+        if i == 0:
+            self.long_buy(self.ticker.get_data(datetime=self.data.index[i]), 0.1)
+
+class TestIterativeBase():
+    """Test suite for IterativeBase class"""
+
+    def _strategy(self, length: int=200) -> MockStrategy:
+        ticker = TickerGenerator(seed=0).gbm(length)
+        return MockStrategy(ticker, Account(ticker.start, 10000))
+
+    def test_start_async(self):
+        """Test the asynchronous run gives the same report as the synchronous one"""
+        strategy = self._strategy()
+        asyncio.run(strategy.run_async(chunk_size=16))
+
+        expected = self._strategy()
+        expected.start(len(expected.data.index), expected.on_tick)
+        assert strategy.report.summary == expected.report.summary
+        assert strategy.runs_started == strategy.runs_finished == 1
+
+    def test_watch(self):
+        """Test watching ends with the run started after it, not before"""
+        strategy = self._strategy(2000)
+
+        async def main() -> list:
+            task = asyncio.create_task(strategy.run_async(chunk_size=10))
+            reports = [progress async for progress in strategy.watch(interval=0)]
+            await task
+            return reports
+
+        reports = asyncio.run(main())
+        assert not reports[-1].is_running
+        assert reports[-1].ticks == 2000
+        assert any(report.is_running for report in reports)
+
+        # a finished run is not watched again, a run never started is not waited for
+        reports = asyncio.run(self._collect(strategy.watch(interval=0.01)))
+        assert len(reports) == 2
+        assert strategy.runs_started == 1
+
+    def test_cancel(self):
+        """Test a cancelled run reports the ticks done so far and re-raises"""
+        strategy = self._strategy(2000)
+
+        async def main():
+            task = asyncio.create_task(strategy.run_async(chunk_size=10))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(main())
+
+        assert not strategy.is_running
+        assert 0 < strategy.report.summary.ticks < 2000
+        assert strategy.runs_finished == strategy.runs_started
+
+    def test_partial_report(self):
+        """Test the partial report covers the ticks done when it is asked"""
+        strategy = self._strategy()
+        partial = []
+
+        def on_tick(i: int):
+            strategy.on_tick(i)
+            if i == 100:
+                partial.append(strategy.get_partial_report())
+
+        strategy.start(len(strategy.data.index), on_tick)
+        assert partial[0].summary.ticks == 101
+        assert strategy.report.summary.ticks == 200
+
+    def test_profiler(self):
+        """Test tracing only covers the run and the instrumentation is removed
+        when the run fails"""
+        ticker = TickerGenerator(seed=0).gbm(200)
+        strategy = MockStrategy(ticker, Account(ticker.start, 10000),
+                                profiler=Profiler(snapshot=False))
+        assert not tracemalloc.is_tracing()
+
+        def on_tick(i: int):
+            if i == 50:
+                raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            strategy.start(len(strategy.data.index), on_tick)
+        assert not tracemalloc.is_tracing()
+        assert "get_data" not in vars(strategy.ticker)
+        assert "record_equity" not in vars(strategy)
+
+    def test_export(self):
+        """Test the exported frames are cached per trade generation and copied"""
+        strategy = self._strategy()
+        strategy.start(len(strategy.data.index), strategy.on_tick)
+
+        orders = strategy.get_orders()
+        cached = strategy._exports["orders"][2]
+        assert orders is not cached
+        assert str(orders["type"].dtype) == "category"
+        assert orders["volume"].dtype == "float64" and orders["price"].dtype == "float64"
+
+        # edits of the returned frame never reach the cache
+        orders.loc[orders.index[0], "price"] = 0.0
+        again = strategy.get_orders()
+        assert strategy._exports["orders"][2] is cached
+        assert (again["price"] > 0).all()
+
+        strategy.long_buy(strategy.ticker.get_data(datetime=strategy.data.index[-1]), 0.1)
+        assert len(strategy.get_orders()) == len(again) + 1
+        assert strategy._exports["orders"][2] is not cached
+
+    def test_risk(self):
+        """Test the risk report against a hand computed equity curve"""
+        strategy = self._strategy()
+        strategy.account = Account(strategy.ticker.start, 100)
+        # Friday evening to Monday morning, 4 hours of trading time
+        times = pd.to_datetime(["2020-01-03 22:00", "2020-01-03 23:00", "2020-01-06 00:00",
+                                "2020-01-06 01:00", "2020-01-06 01:00", "2020-01-06 02:00"],
+                               utc=True)
+        # the stop out records its tick twice, the second record is kept
+        equity = [100, 110, 99, 105, 108.9, 120]
+        margin = [1, 1, 1, 1, 0, 0]
+        strategy.equity_records = [{"datetime": time, "balance": value, "equity": value,
+                                    "marginUsed": used}
+                                   for (time, value, used) in zip(times, equity, margin)]
+        pos = strategy.trade.open_position(Symbol.EUR_USD, times[0], PositionType.LONG_BUY,
+                                           0.1, 1.1, 1)
+        strategy.trade.close_position(pos.id, Tick(Symbol.EUR_USD, times[-1],
+                                                   1.2, 1.2, 1.2, 0, 5, 0))
+
+        report = BacktestingReport()
+        arrays = strategy.get_equity_arrays()
+        strategy.calculate_drawdown(report, arrays)
+        strategy.calculate_risk(report, arrays)
+
+        returns = np.array([110 / 100, 99 / 110, 108.9 / 99, 120 / 108.9]) - 1
+        periods_per_year = 4 * 260 * 24 / 4
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        assert len(arrays["equity"]) == 5
+        assert report.equity_drawdown.max == pytest.approx(11)
+        assert report.risk.sharpe_ratio == pytest.approx(
+            returns.mean() / returns.std() * np.sqrt(periods_per_year))
+        assert report.risk.sortino_ratio == pytest.approx(
+            returns.mean() / downside * np.sqrt(periods_per_year))
+        # margin is used for 3 of the 4 trading hours
+        assert report.risk.exposure_time == pytest.approx(75)
+        assert report.risk.average_holding_time == 52 * 3600
+
+    def test_risk_gaps(self):
+        """Test the ratios and the exposure are weighted by the time between records"""
+        strategy = self._strategy()
+        times = pd.to_datetime(["2020-01-06 00:00", "2020-01-06 01:00", "2020-01-06 04:00",
+                                "2020-01-06 05:00"], utc=True)
+        arrays = {"time": times.as_unit("ns").asi8,
+                  "equity": np.array([100, 102, 101, 104], dtype=float),
+                  "marginUsed": np.array([0, 1, 0, 0], dtype=float)}
+
+        report = BacktestingReport()
+        strategy.calculate_risk(report, arrays)
+
+        returns = np.array([102 / 100, 101 / 102, 104 / 101]) - 1
+        periods_per_year = 3 * strategy.TRADING_SECONDS_PER_YEAR / (5 * 3600)
+        drawdown = 1 - 101 / 102
+        annual_return = 1.04 ** (periods_per_year / 3) - 1
+        assert report.risk.sharpe_ratio == pytest.approx(
+            returns.mean() / returns.std() * np.sqrt(periods_per_year))
+        assert report.risk.calmar_ratio == pytest.approx(annual_return / drawdown)
+        assert report.risk.exposure_time == pytest.approx(60)
+
+    def test_equity_arrays(self):
+        """Test the equity records are given back as arrays in UTC nanoseconds"""
+        strategy = self._strategy()
+        times = pd.to_datetime(["2020-01-06 01:00", "2020-01-06 02:00", "2020-01-06 02:00"],
+                               utc=True).tz_convert("America/New_York").as_unit("s")
+        strategy.equity_records = [{"datetime": time, "balance": 100, "equity": value,
+                                    "marginUsed": 1}
+                                   for (time, value) in zip(times, [100, 99, 101])]
+
+        arrays = strategy.get_equity_arrays()
+        assert arrays["time"].tolist() == [1578272400 * pow(10, 9), 1578276000 * pow(10, 9)]
+        assert arrays["equity"].tolist() == [100, 101]
+        assert arrays["balance"].dtype == np.float64
+
+        strategy.equity_records = []
+        assert all(len(values) == 0 for values in strategy.get_equity_arrays().values())
+
+    @classmethod
+    async def _collect(cls, iterator) -> list:
+        return [item async for item in iterator]
@@ -0,0 +1,76 @@
+"""Profiler Class Test Suite"""
+from dataclasses import dataclass
+import tracemalloc
+
+from algotrading.backtesting.profiler import Profiler
+
+@dataclass(frozen=True)
+class MockTicker:
+    """Frozen object with a method to instrument"""
+    value: int
+
+    def get_data(self) -> int:
+        """Return value"""
+        return self.value
+
+class TestProfiler():
+    """Test suite for Profiler class"""
+
+    def test_phase(self):
+        """Test nested phases are timed and their memory accounted"""
+        profiler = Profiler(snapshot=False)
+        profiler.start()
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                data = bytearray(1_000_000)
+            del data
+
+        report = profiler.finish()
+        (outer, inner) = (report.phases["outer"], report.phases["inner"])
+        assert outer.calls == 1 and inner.calls == 1
+        assert outer.wall_time >= inner.wall_time
+        assert inner.peak_memory >= 1_000_000
+        assert outer.peak_memory >= inner.peak_memory
+        assert report.peak_memory >= outer.peak_memory
+        assert not tracemalloc.is_tracing()
+
+    def test_count_and_restore(self):
+        """Test calls are counted and the original method is restored"""
+        profiler = Profiler(snapshot=False)
+        ticker = MockTicker(3)
+        profiler.count(ticker, "get_data", "Ticker.get_data")
+
+        for _ in range(5):
+            assert ticker.get_data() == 3
+
+        report = profiler.finish()
+        assert report.calls == {"Ticker.get_data": 5}
+        assert "get_data" not in vars(ticker)
+
+    def test_wrap(self):
+        """Test a wrapped callback is profiled on every call"""
+        profiler = Profiler(snapshot=False)
+        callback = profiler.wrap(lambda i: i * 2, "on_tick")
+
+        assert [callback(i) for i in range(4)] == [0, 2, 4, 6]
+        assert profiler.finish().phases["on_tick"].calls == 4
+
+    def test_reuse(self):
+        """Test phases do not trace memory by themselves and a reused profiler
+        starts a new report"""
+        profiler = Profiler(snapshot=False)
+        with profiler.phase("prepare"):
+            assert not tracemalloc.is_tracing()
+
+        profiler.start()
+        with profiler.phase("run"):
+            assert tracemalloc.is_tracing()
+        first = profiler.finish()
+        assert not tracemalloc.is_tracing()
+
+        with profiler.phase("run"):
+            pass
+        second = profiler.finish()
+        assert second is not first
+        assert list(second.phases) == ["run"] and second.phases["run"].calls == 1
+        assert first.phases["run"].calls == 1
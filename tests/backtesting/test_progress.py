@@ -0,0 +1,40 @@
+"""Progress Hook Classes Test Suite"""
+import io
+import logging
+
+from algotrading.backtesting import ProgressReport
+from algotrading.backtesting.progress import BarProgress, CallbackProgress, LoggingProgress
+
+class TestProgress():
+    """Test suite for progress hook classes"""
+
+    def test_bar(self):
+        """Test the bar is redrawn in place and ends with a new line"""
+        stream = io.StringIO()
+        bar = BarProgress(stride=10, width=10, stream=stream)
+        bar.on_start(ProgressReport(ticks=0, length=20))
+        bar.on_progress(ProgressReport(ticks=10, length=20))
+        bar.on_finish(ProgressReport(ticks=20, length=20))
+
+        lines = stream.getvalue().split("\r")
+        assert "10/20 (50%)" in lines[-2]
+        assert lines[-1].startswith("|██████████| 20/20 (100%)")
+        assert lines[-1].endswith("\n")
+
+    def test_callback(self):
+        """Test every progress and the final report reach the callback"""
+        reports = []
+        hook = CallbackProgress(stride=5, callback=reports.append)
+        hook.on_start(ProgressReport(ticks=0, length=10))
+        hook.on_progress(ProgressReport(ticks=5, length=10))
+        hook.on_finish(ProgressReport(ticks=10, length=10))
+
+        assert [report.ticks for report in reports] == [5, 10]
+
+    def test_logging(self, caplog):
+        """Test the progress is logged at the configured level"""
+        hook = LoggingProgress(level=logging.WARNING)
+        with caplog.at_level(logging.WARNING, logger=LoggingProgress.LOGGER_NAME):
+            hook.on_progress(ProgressReport(ticks=5, length=10, equity=100))
+
+        assert "5 of 10, equity: 100.00" in caplog.text
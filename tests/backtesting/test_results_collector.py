@@ -0,0 +1,87 @@
+"""Results Collector Class Test Suite"""
+from dataclasses import dataclass
+import pandas as pd
+import pytest
+
+from algotrading.backtesting import BacktestingReport, ProfileReport
+from algotrading.backtesting.results import ResultsCollector
+
+@dataclass
+class MockParams:
+    """Parameter set of a sweep"""
+    window: int = 1
+    volume: float = 1.0
+
+class TestResultsCollector():
+    """Test suite for ResultsCollector class"""
+
+    @staticmethod
+    def create_report(net_profit: float, drawdown: float) -> BacktestingReport:
+        """Return a report with the given net profit and equity drawdown"""
+        report = BacktestingReport()
+        report.summary.net_profit = net_profit
+        report.equity_drawdown.max = drawdown
+        report.trade.max_consecutive_wins = [3, 12.5]
+        return report
+
+    @pytest.mark.parametrize("filename", ["results.parquet", "results.arrow"])
+    def test_write_and_read(self, tmp_path, filename: str):
+        """Test the reports are flattened into typed columns and appended in batches"""
+        path = str(tmp_path / filename)
+        with ResultsCollector(path, batch_size=2) as collector:
+            for window in range(5):
+                collector.add(self.create_report(window * 10.0, 5.0),
+                              MockParams(window=window), run="sweep")
+
+        df = ResultsCollector.read(path)
+        assert collector.rows == 5
+        assert len(df) == 5
+        assert df["params.window"].tolist() == [0, 1, 2, 3, 4]
+        assert df["run"].unique().tolist() == ["sweep"]
+        assert df["summary.ticks"].dtype == "int64"
+        assert df["summary.net_profit"].dtype == "float64"
+        assert df["trade.max_consecutive_wins.total"].tolist() == [3] * 5
+        assert df["trade.max_consecutive_wins.profit"].tolist() == [12.5] * 5
+
+        df = ResultsCollector.read(path, columns=["params.window"],
+                                   filters=[("summary.net_profit", ">", 20)])
+        assert df["params.window"].tolist() == [3, 4]
+
+    def test_late_columns(self, tmp_path):
+        """Test columns first seen in later rows are kept, or refused once the file is open"""
+        path = str(tmp_path / "results.parquet")
+        collector = ResultsCollector(path, batch_size=10)
+        collector.add(self.create_report(10.0, 5.0))
+        report = self.create_report(20.0, 5.0)
+        report.profile = ProfileReport(peak_memory=1024)
+        collector.add(report, seed=1)
+        collector.flush()
+
+        collector.add(self.create_report(30.0, 5.0), run="sweep")
+        with pytest.raises(ValueError):
+            collector.close()
+
+        df = ResultsCollector.read(path)
+        assert df["profile.peak_memory"].isna().tolist() == [True, False]
+        assert df["seed"].isna().tolist() == [True, False]
+
+        with pytest.raises(ValueError):
+            collector = ResultsCollector(path)
+            collector.add(self.create_report(0, 0), seed=1)
+            collector.add(self.create_report(0, 0), seed="one")
+
+    def test_rank(self):
+        """Test the results are ranked by a column"""
+        df = pd.DataFrame({"run": [0, 1, 2], "summary.net_profit": [5.0, 15.0, 10.0]})
+
+        result = ResultsCollector.rank(df, "summary.net_profit", top=2)
+        assert result["run"].tolist() == [1, 2]
+
+    def test_pareto_front(self):
+        """Test only the non dominated results are selected"""
+        df = pd.DataFrame({"run": [0, 1, 2, 3, 4],
+                           "net_profit": [10.0, 20.0, 15.0, 5.0, 20.0],
+                           "drawdown": [1.0, 5.0, 5.0, 0.5, 4.0]})
+
+        result = ResultsCollector.pareto_front(df, {"net_profit": "max", "drawdown": "min"})
+        assert result["run"].tolist() == [0, 3, 4]
@@ -0,0 +1,58 @@
+"""Trade Class Test Suite"""
+from typing import ClassVar
+import pandas as pd
+
+from algotrading.backtesting.components.trade import Trade
+from algotrading.common.asset import AssetPairCode as Symbol
+from algotrading.common.trade import PositionType
+from algotrading.ticker import Tick
+
+class TestTrade():
+    """Test suite for Trade class"""
+    MOCK_OPEN: ClassVar[Tick] = Tick(Symbol.EUR_USD, pd.Timestamp("2023-01-02 00:00", tz="UTC"),
+                                     1.10012, 1.10008, 1.10010, 10, 5, 4)
+    MOCK_CLOSE: ClassVar[Tick] = Tick(Symbol.EUR_USD, pd.Timestamp("2023-01-02 01:00", tz="UTC"),
+                                      1.10032, 1.10028, 1.10030, 12, 5, 4)
+
+    def _open(self, trade: Trade):
+        return trade.open_position(Symbol.EUR_USD, self.MOCK_OPEN.datetime,
+                                   PositionType.LONG_BUY, 0.1, self.MOCK_OPEN.ask, 0)
+
+    def test_orders_cached_per_generation(self):
+        """Test the flattened orders and deals are reused until the trade changes"""
+        trade = Trade()
+        pos = self._open(trade)
+        orders = trade.get_orders()
+        deals = trade.get_deals()
+
+        cached = trade._orders[1]
+        assert trade.get_orders() == orders and trade._orders[1] is cached
+        assert trade.get_deals() == deals
+        assert len(orders) == 1 and len(deals) == 1
+
+        # changing the returned list leaves the cache untouched
+        orders.clear()
+        deals.append(None)
+        assert len(trade.get_orders()) == 1 and len(trade.get_deals()) == 1
+
+        trade.close_position(pos.id, self.MOCK_CLOSE)
+        assert len(trade.get_orders()) == 2
+        assert trade._orders[1] is not cached
+        assert len(trade.get_deals()) == 2
+
+    def test_generation(self):
+        """Test every change of the positions moves the generation"""
+        trade = Trade()
+        generations = [trade.generation]
+
+        pos = self._open(trade)
+        generations.append(trade.generation)
+        trade.close_position(pos.id, self.MOCK_CLOSE)
+        generations.append(trade.generation)
+        trade.close_all_position(self.MOCK_CLOSE)
+        generations.append(trade.generation)
+        trade.clear_positions()
+        generations.append(trade.generation)
+
+        assert generations == [0, 1, 2, 2, 3]
+        assert trade.get_orders() == []
@@ -0,0 +1,53 @@
+"""Shared Test Configuration"""
+# pylint: disable=protected-access
+import os
+import sys
+import types
+import pytest
+
+try:
+    import tpqoa # pylint: disable=unused-import
+except ImportError:
+    # the strategies package loads the providers, the broker client is only
+    # built at import and never called by the tests
+    tpqoa = types.ModuleType("tpqoa")
+    tpqoa.tpqoa = lambda *args, **kwargs: None
+    sys.modules["tpqoa"] = tpqoa
+
+# pylint: disable=wrong-import-position
+from algotrading.ticker import PartitionedStore, TickerManager, TickStore
+from algotrading.data import DataManager
+
+def reset_managers():
+    """Close the catalogs and drop the listings, indexes and tickers kept by the managers"""
+    with DataManager._LOCK:
+        for catalog in DataManager._CATALOGS.values():
+            catalog.close()
+        DataManager._CATALOGS.clear()
+        for manager in (DataManager, *DataManager.__subclasses__()):
+            manager._DATA = None
+            manager._GENERATION = None
+
+        TickerManager._TICKER_DATA = None
+        TickerManager._TICKER_GENERATION = None
+        TickerManager._CHUNK_INDEXES.clear()
+        TickerManager.CACHE.clear()
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path):
+    """Use temporary data, partition and store directories and empty managers"""
+    directories = {(DataManager, "DATA_DIR"): "data",
+                   (PartitionedStore, "PARTITION_DIR"): "partitions",
+                   (TickStore, "STORE_DIR"): "store"}
+    saved = {(owner, name): getattr(owner, name) for (owner, name) in directories}
+    for ((owner, name), directory) in directories.items():
+        (tmp_path / directory).mkdir()
+        setattr(owner, name, str(tmp_path / directory) + os.sep)
+
+    reset_managers()
+    try:
+        yield
+    finally:
+        for ((owner, name), value) in saved.items():
+            setattr(owner, name, value)
+        reset_managers()
@@ -0,0 +1,39 @@
+"""Catalog Class Test Suite"""
+import os
+import pandas as pd
+
+from algotrading.ticker import TickerGenerator, TickerManager
+from algotrading.data import DataManager
+
+class TestCatalog():
+    """Test suite for Catalog class"""
+    MOCK_FILENAME = "OANDA_EUR-USD_2020-01-01_2020-01-02_MINUTE-1.csv"
+
+    def test_write_remove(self):
+        """Test the catalog is updated on write and remove"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        TickerManager.write(self.MOCK_FILENAME, data)
+
+        entry = DataManager.get_catalog().get(self.MOCK_FILENAME)
+        assert entry["rows"] == 500
+        assert entry["checksum"] is not None
+        assert pd.Timestamp(entry["first"]) == data.index[0]
+        assert TickerManager.find().PROVIDER.tolist() == ["OANDA"]
+
+        TickerManager.remove(self.MOCK_FILENAME)
+        assert DataManager.get_catalog().get(self.MOCK_FILENAME) is None
+        assert TickerManager.find().empty
+
+    def test_refresh(self):
+        """Test files changed outside of the manager are picked up"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        data.to_csv(DataManager.DATA_DIR + self.MOCK_FILENAME)
+        assert DataManager.exist(self.MOCK_FILENAME)
+        assert DataManager.get_catalog().get(self.MOCK_FILENAME)["rows"] is None
+
+        generation = DataManager.get_catalog().generation
+        assert not DataManager.get_catalog().refresh()
+        assert DataManager.get_catalog().generation == generation
+
+        os.remove(DataManager.DATA_DIR + self.MOCK_FILENAME)
+        assert not DataManager.exist(self.MOCK_FILENAME)
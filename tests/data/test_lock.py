@@ -0,0 +1,57 @@
+"""File Lock Class Test Suite"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import pandas as pd
+import pytest
+
+from algotrading.ticker import TickerGenerator, TickerManager
+from algotrading.data import DataManager, FileLock
+
+class TestFileLock():
+    """Test suite for FileLock class and the locked writes of DataManager"""
+    MOCK_FILENAME = "OANDA_EUR-USD_2020-01-01_2020-01-02_MINUTE-1.csv"
+
+    def test_timeout(self):
+        """Test a held lock is not acquired by another holder until released"""
+        path = DataManager.DATA_DIR + "test.lock"
+        with FileLock(path):
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.1).acquire()
+
+        other = FileLock(path, timeout=0.1)
+        other.acquire()
+        assert other.is_locked()
+        other.release()
+
+    def test_write_modes(self):
+        """Test existing files raise, are kept or are replaced"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        assert TickerManager.write(self.MOCK_FILENAME, data)
+        with pytest.raises(FileExistsError):
+            TickerManager.write(self.MOCK_FILENAME, data)
+
+        assert TickerManager.write(self.MOCK_FILENAME, data.iloc[:100], if_exists="skip")
+        assert DataManager.get_catalog().get(self.MOCK_FILENAME)["rows"] == 500
+        assert TickerManager.write(self.MOCK_FILENAME, data.iloc[:100], if_exists="replace")
+        assert DataManager.get_catalog().get(self.MOCK_FILENAME)["rows"] == 100
+        assert TickerManager.find().NAME.tolist() == [self.MOCK_FILENAME]
+
+    def test_read_or_write(self):
+        """Test concurrent callers produce the file once and read it"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        calls = []
+
+        def produce() -> pd.DataFrame:
+            calls.append(threading.get_ident())
+            time.sleep(0.2)
+            return data
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: TickerManager.read_or_write(self.MOCK_FILENAME, produce, "time"),
+                range(4)))
+
+        assert len(calls) == 1
+        for result in results:
+            pd.testing.assert_frame_equal(result, data, check_freq=False)
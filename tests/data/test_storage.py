@@ -0,0 +1,49 @@
+"""Storage Classes Test Suite"""
+import pandas as pd
+import pytest
+
+from algotrading.ticker import Ticker, TickerGenerator, TickerManager
+from algotrading.data import DataManager
+from algotrading.data.storage import StorageFactory
+
+class TestStorage():
+    """Test suite for storage formats"""
+    MOCK_NAME = "OANDA_EUR-USD_2020-01-01_2020-01-02_MINUTE-1"
+
+    @pytest.mark.parametrize("ext", list(StorageFactory.STORAGES))
+    def test_round_trip(self, ext):
+        """Test every format gives back the data with its timezone aware index"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        DataManager.write(self.MOCK_NAME + ext, data)
+        read = DataManager.read(self.MOCK_NAME + ext, "time")
+
+        assert str(read.index.tz) == str(data.index.tz)
+        pd.testing.assert_frame_equal(read, data, check_freq=False, check_names=False)
+
+    @pytest.mark.parametrize("ext", list(StorageFactory.STORAGES))
+    def test_fingerprint(self, ext):
+        """Test the stored fingerprint matches the data read back from every format"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        TickerManager.write(self.MOCK_NAME + ext, data)
+        read = TickerManager.read(self.MOCK_NAME + ext, "time")
+
+        stored = DataManager.get_catalog().get(self.MOCK_NAME + ext)["fingerprint"]
+        assert stored == Ticker.compute_fingerprint(data)
+        assert Ticker.compute_fingerprint(read) == stored
+
+    def test_convert_all(self):
+        """Test the csv files are converted and the read times reported"""
+        data = TickerGenerator(seed=0).gbm(500).data
+        DataManager.write(self.MOCK_NAME + ".csv", data)
+        report = DataManager.convert_all(".csv", ".npz", "time", remove=True)
+
+        assert report.TARGET.tolist() == [self.MOCK_NAME + ".npz"]
+        assert (report["READ TIME (S)"] > 0).all()
+        assert not DataManager.exist(self.MOCK_NAME + ".csv", reload=True)
+        pd.testing.assert_frame_equal(DataManager.read(self.MOCK_NAME + ".npz", "time"), data,
+                                      check_freq=False, check_names=False)
+
+    def test_unsupported(self):
+        """Test an unknown extension is refused"""
+        with pytest.raises(ValueError):
+            StorageFactory.get_storage(".xls")
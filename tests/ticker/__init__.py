@@ -0,0 +1 @@
+"""Initialize package"""
@@ -0,0 +1,21 @@
+"""Ticker Buffer Class Test Suite"""
+import pandas as pd
+
+from algotrading.ticker import TickerBuffer, TickerGenerator
+
+class TestTickerBuffer():
+    """Test suite for TickerBuffer class"""
+
+    def test_append(self):
+        """Test appending segments in place grows the buffer and resolves overlaps"""
+        ticker = TickerGenerator(seed=0).gbm(5000)
+        data = ticker.data
+        buffer = TickerBuffer(ticker.symbol, ticker.timeframe, capacity=16)
+
+        for (start, end) in ((0, 1000), (900, 3000), (3000, 3001), (2000, 2500), (3001, 5000)):
+            buffer.append(data.iloc[start:end])
+
+        assert buffer.get_length() == 5000
+        assert buffer.capacity >= 5000
+        pd.testing.assert_frame_equal(buffer.get_data(), data, check_freq=False)
+        assert buffer.get_ticker().end == data.index[-1].to_pydatetime()
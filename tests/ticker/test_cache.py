@@ -0,0 +1,44 @@
+"""Ticker Cache Class Test Suite"""
+from datetime import datetime as dt
+
+from algotrading.common.trade import Timeframe
+from algotrading.data import DataManager
+from algotrading.ticker import TickerCache, TickerGenerator, TickerManager, TickerMetadata
+
+class TestTickerCache():
+    """Test suite for TickerCache class"""
+    MOCK_FILENAME = "OANDA_EUR-USD_2020-01-01_2020-01-09_MINUTE-1" + DataManager.FILE_EXT
+
+    def test_find_cached(self):
+        """Test repeated loads are served from the cache until the file changes"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        TickerManager.write(self.MOCK_FILENAME, ticker.data)
+        metadata = TickerMetadata("OANDA", ticker.symbol, dt(2020, 1, 2), dt(2020, 1, 3),
+                                  Timeframe.MINUTE_1)
+
+        first = TickerManager.find_by_metadata(metadata)
+        assert TickerManager.find_by_metadata(metadata) is first
+        stats = TickerManager.CACHE.get_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.bytes == TickerCache.get_size(first)
+
+        TickerManager.remove(self.MOCK_FILENAME)
+        TickerManager.write(self.MOCK_FILENAME, ticker.data.iloc[:2000])
+        assert TickerManager.find_by_metadata(metadata) is not first
+        assert TickerManager.CACHE.get_stats().invalidations == 1
+
+    def test_budget(self):
+        """Test the least recently used tickers are evicted over the budget"""
+        tickers = [TickerGenerator(seed=seed).gbm(1000) for seed in range(3)]
+        cache = TickerCache(budget=2 * TickerCache.get_size(tickers[0]))
+        for (i, ticker) in enumerate(tickers[:2]):
+            cache.put((("file",), i), 0, ticker)
+
+        assert cache.get((("file",), 0), 0) is tickers[0]
+        cache.put((("file",), 2), 0, tickers[2])
+        assert cache.get((("file",), 1), 0) is None
+        assert cache.get((("file",), 0), 0) is tickers[0]
+        assert cache.get_stats().evictions == 1
+
+        cache.invalidate("file")
+        assert cache.get_stats().entries == 0
@@ -0,0 +1,44 @@
+"""Chunked Ticker Class Test Suite"""
+import numpy as np
+import pandas as pd
+
+from algotrading.common.trade import Timeframe
+from algotrading.ticker import ChunkedTicker, TickerGenerator
+
+class TestChunkedTicker():
+    """Test suite for ChunkedTicker class"""
+
+    def _create(self, path: str, length: int, **kwargs) -> tuple:
+        ticker = TickerGenerator(seed=0).gbm(length)
+        ticker.data.to_csv(path)
+        chunked = ChunkedTicker(ticker.symbol, ticker.start, ticker.end,
+                                ticker.timeframe, str(path), **kwargs)
+        return (ticker, chunked)
+
+    def test_get_data(self, tmp_path):
+        """Test ticks are read from the chunks holding them"""
+        (ticker, chunked) = self._create(tmp_path / "ticker.csv", 2500, chunk_size=1000)
+
+        assert chunked.get_length() == 2500
+        assert chunked.get_chunk_count() == 3
+        for i in (0, 999, 1000, 2499, -1):
+            assert chunked.get_data(index=i) == ticker.get_data(index=i)
+        datetime = ticker.data.index[1500]
+        assert chunked.get_data(datetime=datetime) == ticker.get_data(datetime=datetime)
+        np.testing.assert_allclose(chunked.get_data().mid, ticker.data.mid)
+
+    def test_memory_budget(self, tmp_path):
+        """Test the least recently used chunks are evicted above the budget"""
+        (_, chunked) = self._create(tmp_path / "ticker.csv", 5000, chunk_size=500,
+                                    memory_budget=100_000)
+        for _ in chunked.iter_chunks():
+            assert chunked._cache_bytes <= chunked.memory_budget or len(chunked._cache) == 1
+
+        assert list(chunked._cache)[-1] == chunked.get_chunk_count() - 1
+
+    def test_resample(self, tmp_path):
+        """Test resampling by chunk joins the bars split across chunks"""
+        (ticker, chunked) = self._create(tmp_path / "ticker.csv", 3000, chunk_size=700)
+
+        pd.testing.assert_frame_equal(chunked.resample(Timeframe.HOUR_1).data,
+                                      ticker.resample(Timeframe.HOUR_1).data, check_freq=False)
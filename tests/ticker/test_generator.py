@@ -0,0 +1,73 @@
+"""Ticker Generator Class Test Suite"""
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrading.common.trade import Timeframe
+from algotrading.ticker import Ticker, TickerGenerator, Regime, SpreadProfile
+
+class TestTickerGenerator():
+    """Test suite for TickerGenerator class"""
+    COLUMNS: ClassVar[list[str]] = ["ask", "bid", "mid", "volume", "digit", "spread"]
+    REGIMES: ClassVar[list[Regime]] = [Regime(0, 0.05, 200), Regime(0.2, 0.4, 50)]
+
+    def test_gbm_schema(self):
+        """Test the generated ticker has the provider's column schema"""
+        ticker = TickerGenerator(seed=1).gbm(1000)
+        data = ticker.get_data()
+
+        assert isinstance(ticker, Ticker)
+        assert list(data.columns) == self.COLUMNS
+        assert data.index.name == "time"
+        assert str(data.index.tz) == "UTC"
+        assert data.index.is_monotonic_increasing
+        assert data.volume.dtype == np.int64
+        assert data.spread.dtype == np.int64
+        assert ticker.get_length() == 1000
+        assert ticker.get_digit() == 5
+
+    def test_quotes_consistency(self):
+        """Test ask, bid and spread are consistent on the point grid"""
+        data = TickerGenerator(seed=2, spread=SpreadProfile(mean=3, std=4)).gbm(5000).data
+
+        assert (data.ask > data.bid).all()
+        assert (data.spread >= 1).all()
+        np.testing.assert_array_equal(np.rint((data.ask - data.bid) * 1e5), data.spread)
+
+    def test_skip_weekends(self):
+        """Test no bar is generated on weekends"""
+        data = TickerGenerator(seed=3, timeframe=Timeframe.HOUR_1).gbm(2000).data
+        assert (data.index.dayofweek < 5).all()
+
+        data = TickerGenerator(seed=3, timeframe=Timeframe.HOUR_1,
+                               skip_weekends=False).gbm(2000).data
+        assert (data.index.dayofweek >= 5).any()
+
+    @pytest.mark.parametrize("method, args",
+                             [("gbm", (500,)),
+                              ("regime_switching", (500, 1.3, REGIMES))])
+    def test_reproducible(self, method: str, args: tuple):
+        """Test the same seed generates the same ticker"""
+        first = getattr(TickerGenerator(seed=7), method)(*args).data
+        second = getattr(TickerGenerator(seed=7), method)(*args).data
+        third = getattr(TickerGenerator(seed=8), method)(*args).data
+
+        pd.testing.assert_frame_equal(first, second)
+        assert not first.equals(third)
+
+    def test_bootstrap(self):
+        """Test the bootstrap resamples the returns, spreads and volumes of a ticker"""
+        source = TickerGenerator(seed=4).regime_switching(300, 1.3, self.REGIMES)
+        ticker = TickerGenerator(seed=5).bootstrap(source, 1000, block_size=20)
+        data = ticker.get_data()
+
+        assert ticker.get_length() == 1000
+        assert data.mid.iloc[0] == pytest.approx(source.data.mid.iloc[0], abs=1e-5)
+        assert set(data.spread).issubset(set(source.data.spread))
+        assert set(data.volume).issubset(set(source.data.volume))
+
+    def test_invalid_length(self):
+        """Test generating an empty ticker is rejected"""
+        with pytest.raises(ValueError):
+            TickerGenerator().gbm(0)
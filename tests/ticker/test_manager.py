@@ -0,0 +1,112 @@
+"""Ticker Manager Class Test Suite"""
+from typing import ClassVar
+from datetime import datetime as dt
+import numpy as np
+import pandas as pd
+
+from algotrading.common.asset import AssetPairCode as Symbol
+from algotrading.common.trade import Timeframe
+from algotrading.data import DataManager
+from algotrading.ticker import ChunkedTicker, Ticker, TickerGenerator, TickerManager, \
+    TickerMetadata
+
+class TestTickerManager():
+    """Test suite for TickerManager class"""
+    MOCK_FILENAME: ClassVar[str] = ("OANDA_EUR-USD_2020-01-01_2020-01-09_MINUTE-1"
+                                    + DataManager.FILE_EXT)
+
+    def test_build_pyramid(self):
+        """Test every higher timeframe is saved and loaded directly"""
+        ticker = TickerGenerator(seed=0).gbm(5 * 1440)
+        TickerManager.write(self.MOCK_FILENAME, ticker.data)
+
+        filenames = TickerManager.build_pyramid(self.MOCK_FILENAME)
+        assert [TickerManager.generate_metadata(name).timeframe for name in filenames] == \
+            [Timeframe.MINUTE_15, Timeframe.HOUR_1, Timeframe.HOUR_4, Timeframe.DAY_1]
+
+        hourly = TickerManager.find_by_filename(filenames[1])
+        expected = ticker.resample(Timeframe.HOUR_1).data
+        assert hourly.timeframe == Timeframe.HOUR_1
+        assert hourly.data.index.equals(expected.index)
+        np.testing.assert_allclose(hourly.data.to_numpy(dtype=float),
+                                   expected.to_numpy(dtype=float))
+
+        # built once, existing levels are kept
+        assert TickerManager.build_pyramid(self.MOCK_FILENAME) == filenames
+
+    def test_find_coverage(self):
+        """Test a range held in several files is stitched and the gaps reported"""
+        ticker = TickerGenerator(seed=0).gbm(12 * 1440)
+        for (start, end) in ((1, 5), (2, 3), (4, 9), (12, 15)):
+            segment = ticker.get_range(dt(2020, 1, start), dt(2020, 1, end))
+            TickerManager.write(f"OANDA_EUR-USD_2020-01-{start:02d}_2020-01-{end:02d}_MINUTE-1"
+                                + DataManager.FILE_EXT, segment.data)
+
+        metadata = TickerMetadata("OANDA", ticker.symbol, dt(2020, 1, 2), dt(2020, 1, 8),
+                                  Timeframe.MINUTE_1)
+        (filenames, gaps) = TickerManager.find_coverage(metadata)
+        assert [TickerManager.generate_metadata(name).end.day for name in filenames] == [5, 9]
+        assert not gaps
+
+        stitched = TickerManager.find_by_metadata(metadata)
+        pd.testing.assert_frame_equal(stitched.data,
+                                      ticker.data.loc["2020-01-02":"2020-01-08 00:00"],
+                                      check_freq=False)
+
+        metadata = TickerMetadata("OANDA", ticker.symbol, dt(2020, 1, 2), dt(2020, 1, 20),
+                                  Timeframe.MINUTE_1)
+        assert TickerManager.find_gaps(metadata) == [(dt(2020, 1, 9), dt(2020, 1, 12)),
+                                                     (dt(2020, 1, 15), dt(2020, 1, 20))]
+        assert TickerManager.find_by_metadata(metadata) is None
+
+    def test_find_many(self):
+        """Test tickers are returned in request order and failures are reported"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        TickerManager.write(self.MOCK_FILENAME, ticker.data)
+        broken = self.MOCK_FILENAME.replace("EUR-USD", "GBP-USD")
+        with open(DataManager.DATA_DIR + broken, "w", encoding="utf-8") as file:
+            file.write("time,ask\nnot a date,1\n")
+
+        metadatas = [TickerMetadata("OANDA", symbol, dt(2020, 1, 2), dt(2020, 1, 3),
+                                    Timeframe.MINUTE_1)
+                     for symbol in (Symbol.GBP_USD, Symbol.EUR_USD, Symbol.USD_JPY)]
+        (tickers, errors) = TickerManager.find_many(metadatas, max_workers=2)
+
+        assert tickers[0] is None and tickers[2] is None
+        assert tickers[1].symbol == Symbol.EUR_USD
+        assert list(errors) == [0]
+
+    def test_fingerprint(self):
+        """Test the fingerprint is kept at write time and identifies the content"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        TickerManager.write(self.MOCK_FILENAME, ticker.data)
+
+        loaded = TickerManager.find_by_filename(self.MOCK_FILENAME)
+        assert loaded.fingerprint == ticker.get_fingerprint()
+        assert Ticker.compute_fingerprint(loaded.data) == loaded.fingerprint
+        assert TickerManager.find(self.MOCK_FILENAME).FINGERPRINT.iloc[0] == loaded.fingerprint
+
+        changed = ticker.data.copy()
+        changed.iloc[-1, 0] += 0.00001
+        assert Ticker.compute_fingerprint(changed) != loaded.fingerprint
+        assert ticker.get_range(dt(2020, 1, 2), dt(2020, 1, 3)).get_fingerprint() \
+            != loaded.fingerprint
+
+    def test_open_chunked_index(self, monkeypatch):
+        """Test the chunk index is scanned once per file version"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        filename = self.MOCK_FILENAME.replace(DataManager.FILE_EXT, ".csv")
+        TickerManager.write(filename, ticker.data)
+
+        scans = []
+        build_index = ChunkedTicker._build_index
+        monkeypatch.setattr(ChunkedTicker, "_build_index",
+                            lambda chunked: scans.append(1) or build_index(chunked))
+        for _ in range(3):
+            chunked = TickerManager.open_chunked(filename, chunk_size=1000)
+        assert len(scans) == 1
+        assert chunked.get_data(index=2000) == ticker.get_data(index=2000)
+
+        TickerManager.write(filename, ticker.data.iloc[:1500], if_exists="replace")
+        assert TickerManager.open_chunked(filename, chunk_size=1000).get_length() == 1500
+        assert len(scans) == 2
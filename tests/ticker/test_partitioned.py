@@ -0,0 +1,56 @@
+"""Partitioned Store Class Test Suite"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime as dt
+import pandas as pd
+
+from algotrading.ticker import TickerGenerator, PartitionedStore
+
+class TestPartitionedStore():
+    """Test suite for PartitionedStore class"""
+    MOCK_PROVIDER = "OANDA"
+
+    def test_read_range(self):
+        """Test a range spanning several months is read from its partitions"""
+        ticker = TickerGenerator(seed=0).gbm(45 * 1440)
+        paths = PartitionedStore.write(self.MOCK_PROVIDER, ticker, ".npz")
+        assert [os.path.basename(path) for path in paths] == \
+            ["2020-01.npz", "2020-02.npz", "2020-03.npz"]
+
+        stored = PartitionedStore.read(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe,
+                                       dt(2020, 1, 20), dt(2020, 2, 3))
+        pd.testing.assert_frame_equal(stored.data,
+                                      ticker.data.loc["2020-01-20":"2020-02-03 00:00"],
+                                      check_freq=False)
+        assert PartitionedStore.read(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe,
+                                     dt(2021, 1, 1), dt(2021, 2, 1)) is None
+
+    def test_write_merge(self):
+        """Test writing into existing partitions merges the rows"""
+        ticker = TickerGenerator(seed=0).gbm(40 * 1440)
+        PartitionedStore.write(self.MOCK_PROVIDER, ticker.get_range(dt(2020, 1, 1),
+                                                                    dt(2020, 1, 20)))
+        PartitionedStore.write(self.MOCK_PROVIDER, ticker.get_range(dt(2020, 1, 10),
+                                                                    dt(2020, 2, 28)))
+
+        stored = PartitionedStore.read(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe,
+                                       dt(2020, 1, 1), dt(2020, 2, 28))
+        pd.testing.assert_frame_equal(stored.data, ticker.data, check_freq=False)
+        assert PartitionedStore.find().PARTITIONS.tolist() == [2]
+
+    def test_write_concurrent(self):
+        """Test concurrent writers of a partition keep every row, empty tickers write nothing"""
+        ticker = TickerGenerator(seed=0).gbm(10 * 1440)
+        assert PartitionedStore.write(self.MOCK_PROVIDER,
+                                      ticker.get_range(dt(2021, 1, 1), dt(2021, 1, 2))) == []
+
+        days = [ticker.get_range(dt(2020, 1, day), dt(2020, 1, day, 23, 59))
+                for day in range(1, 15)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda day: PartitionedStore.write(self.MOCK_PROVIDER, day, ".npz"),
+                              days))
+
+        stored = PartitionedStore.read(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe,
+                                       dt(2020, 1, 1), dt(2020, 1, 31))
+        pd.testing.assert_frame_equal(stored.data, ticker.data, check_freq=False)
+        assert PartitionedStore.find().PARTITIONS.tolist() == [1]
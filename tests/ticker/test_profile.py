@@ -0,0 +1,26 @@
+"""Hourly Profile Class Test Suite"""
+import pandas as pd
+
+from algotrading.ticker import HourlyProfile, TickerGenerator
+
+class TestHourlyProfile():
+    """Test suite for HourlyProfile class"""
+
+    def test_means(self):
+        """Test the hourly means match a pandas group by"""
+        data = TickerGenerator(seed=0).gbm(3 * 1440).data
+        by_hour = HourlyProfile().update(data).to_frame()
+
+        change = (data.mid.diff().fillna(0).abs() * pow(10, data.digit)).astype(int)
+        expected = data.assign(change=change).groupby(
+            data.index.hour.rename("hour"))[["volume", "spread", "change"]].mean()
+        pd.testing.assert_frame_equal(by_hour[["volume", "spread", "change"]], expected)
+        assert set(by_hour["color"]) <= {"red", "darkgreen", "gray"}
+
+    def test_chunks(self):
+        """Test the profile built chunk by chunk equals the one of the whole data"""
+        data = TickerGenerator(seed=0).gbm(3 * 1440).data
+        chunks = (data.iloc[i:i + 1000] for i in range(0, len(data.index), 1000))
+
+        pd.testing.assert_frame_equal(HourlyProfile.from_chunks(chunks).to_frame(),
+                                      HourlyProfile().update(data).to_frame())
@@ -0,0 +1,35 @@
+"""Tick Store Class Test Suite"""
+from datetime import datetime as dt
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrading.ticker import TickerGenerator, TickStore
+
+class TestTickStore():
+    """Test suite for TickStore class"""
+    MOCK_PROVIDER = "OANDA"
+
+    def test_open(self):
+        """Test the ticker columns are given back on read only memory maps"""
+        ticker = TickerGenerator(seed=0).gbm(3000)
+        TickStore.write(self.MOCK_PROVIDER, ticker)
+        stored = TickStore.open(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe)
+
+        pd.testing.assert_frame_equal(stored.data, ticker.data, check_freq=False)
+        assert not stored.data.mid.to_numpy().flags.writeable
+        assert not stored.data.ask.to_numpy().flags.writeable
+        with pytest.raises(FileExistsError):
+            TickStore.write(self.MOCK_PROVIDER, ticker)
+
+    def test_open_range(self):
+        """Test a range is sliced from the maps"""
+        ticker = TickerGenerator(seed=0).gbm(3000)
+        TickStore.write(self.MOCK_PROVIDER, ticker.compact(ticker.PRICE_POINTS))
+        stored = TickStore.open(self.MOCK_PROVIDER, ticker.symbol, ticker.timeframe,
+                                dt(2020, 1, 1, 12), dt(2020, 1, 2))
+
+        expected = ticker.data.loc["2020-01-01 12:00":"2020-01-02 00:00"]
+        assert stored.is_compact()
+        pd.testing.assert_index_equal(stored.data.index, expected.index)
+        np.testing.assert_allclose(stored.get_prices("mid"), expected.mid)
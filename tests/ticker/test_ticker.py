@@ -0,0 +1,125 @@
+"""Ticker Class Test Suite"""
+from typing import ClassVar
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrading.common.asset import AssetPairCode as Symbol
+from algotrading.common.trade import Timeframe
+from algotrading.ticker import Ticker, TickerGenerator
+
+class TestTicker():
+    """Test suite for Ticker class"""
+    MOCK_INDEX: ClassVar[pd.DatetimeIndex] = pd.date_range(
+        "2023-01-02", periods=4, freq="h", tz="UTC", name="time")
+    MOCK_EUR_USD: ClassVar[Ticker] = Ticker(
+        Symbol.EUR_USD, MOCK_INDEX[0], MOCK_INDEX[-1], Timeframe.HOUR_1,
+        pd.DataFrame({'ask': [1.10012, 1.10032, 1.10022, 1.10042],
+                      'bid': [1.10008, 1.10028, 1.10018, 1.10038],
+                      'mid': [1.10010, 1.10030, 1.10020, 1.10040],
+                      'volume': [10, 12, 8, 15],
+                      'digit': [5, 5, 5, 5],
+                      'spread': [4, 4, 4, 4]}, index=MOCK_INDEX))
+    MOCK_USD_JPY: ClassVar[Ticker] = Ticker(
+        Symbol.USD_JPY, MOCK_INDEX[1], MOCK_INDEX[-1], Timeframe.HOUR_1,
+        pd.DataFrame({'ask': [150.012, 150.032, 150.022],
+                      'bid': [150.004, 150.024, 150.014],
+                      'mid': [150.008, 150.028, 150.018],
+                      'volume': [20, 5, 30],
+                      'digit': [3, 3, 3],
+                      'spread': [8, 8, 8]}, index=MOCK_INDEX[1:]))
+
+    def test_reverse(self):
+        """Test the reversed quotes are the rounded reciprocals with swapped sides"""
+        data = self.MOCK_EUR_USD.data
+        df = self.MOCK_EUR_USD.reverse().data
+
+        assert list(df.ask) == [round(1 / bid, 5) for bid in data.bid]
+        assert list(df.bid) == [round(1 / ask, 5) for ask in data.ask]
+        assert list(df.mid) == [round(1 / mid, 5) for mid in data.mid]
+        assert list(df.spread) == [int(round((ask - bid) * 1e5)) for (ask, bid)
+                                   in zip(df.ask, df.bid)]
+        assert df.spread.dtype == np.int64
+
+    def test_cross(self):
+        """Test the cross is synthesized on the common ticks from both legs"""
+        ticker = self.MOCK_EUR_USD.cross(self.MOCK_USD_JPY)
+        expected = self.MOCK_EUR_USD.data.loc[self.MOCK_INDEX[1:]]
+
+        assert ticker.symbol == Symbol.EUR_JPY
+        assert ticker.get_digit() == 3
+        assert ticker.data.index.equals(self.MOCK_INDEX[1:])
+        np.testing.assert_allclose(ticker.data.ask,
+                                   np.round(expected.ask * self.MOCK_USD_JPY.data.ask, 3))
+        np.testing.assert_allclose(ticker.data.bid,
+                                   np.round(expected.bid * self.MOCK_USD_JPY.data.bid, 3))
+        assert list(ticker.data.volume) == [12, 5, 15]
+        assert (ticker.data.spread > 0).all()
+
+    def test_cross_inverse_leg(self):
+        """Test a leg quoted the other way round is inverted"""
+        ticker = self.MOCK_USD_JPY.cross(self.MOCK_EUR_USD)
+        reference = self.MOCK_EUR_USD.cross(self.MOCK_USD_JPY)
+
+        assert ticker.symbol == Symbol.EUR_JPY
+        pd.testing.assert_frame_equal(ticker.data, reference.data)
+        assert self.MOCK_EUR_USD.cross(self.MOCK_EUR_USD) is None
+
+    def test_resample(self):
+        """Test the bars match the pandas reductions and drop empty buckets"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        data = ticker.data
+        df = ticker.resample(Timeframe.HOUR_1).data
+        resampler = data.resample("1h", label="right")
+
+        expected = {"ask": resampler.ask.last(), "bid_open": resampler.bid.first(),
+                    "mid_high": resampler.mid.max(), "ask_low": resampler.ask.min(),
+                    "volume": resampler.volume.sum(), "spread_max": resampler.spread.max(),
+                    "spread_mean": resampler.spread.mean(), "count": resampler.ask.count()}
+        for (column, values) in expected.items():
+            np.testing.assert_allclose(df[column], values.dropna(), err_msg=column)
+        assert not df.isna().any().any()
+
+    def test_resample_levels(self):
+        """Test resampling bars again gives the bars of the lower timeframe"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        direct = ticker.resample(Timeframe.HOUR_4).data
+        levels = ticker.resample(Timeframe.MINUTE_15).resample(Timeframe.HOUR_4).data
+
+        assert direct.index.equals(levels.index)
+        np.testing.assert_allclose(direct.to_numpy(dtype=float), levels.to_numpy(dtype=float))
+
+    def test_resample_count(self):
+        """Test a count column of tick data is not taken for bars"""
+        ticker = TickerGenerator(seed=0).gbm(3 * 1440)
+        counted = Ticker(ticker.symbol, ticker.start, ticker.end, ticker.timeframe,
+                         ticker.data.assign(count=5))
+        assert not counted.bars and ticker.resample(Timeframe.HOUR_1).bars
+
+        expected = ticker.resample(Timeframe.HOUR_1).data
+        pd.testing.assert_frame_equal(counted.resample(Timeframe.HOUR_1).data[expected.columns],
+                                      expected)
+
+    def test_merge_data(self):
+        """Test overlapping data is merged in time order with the newer rows kept"""
+        data = TickerGenerator(seed=0).gbm(1000).data
+        other = data.iloc[500:800].assign(volume=-1)
+        merged = Ticker.merge_data(data.iloc[:600], other)
+
+        assert merged.index.equals(data.index[:800])
+        assert (merged.volume.iloc[500:] == -1).all()
+        pd.testing.assert_frame_equal(Ticker.merge_data(data.iloc[:600], data.iloc[600:]), data,
+                                      check_freq=False)
+
+    @pytest.mark.parametrize("prices", [Ticker.PRICE_FLOAT32, Ticker.PRICE_POINTS])
+    def test_compact(self, prices: str):
+        """Test the compact ticker halves the memory and expands back exactly"""
+        ticker = TickerGenerator(seed=0).gbm(1000)
+        compact = ticker.compact(prices)
+
+        assert compact.get_digit() == 5 and "digit" not in compact.data.columns
+        assert compact.data.memory_usage().sum() < ticker.data.memory_usage().sum() / 2
+        assert compact.get_data(index=10) == ticker.get_data(index=10)
+        np.testing.assert_array_equal(compact.get_prices("ask"), ticker.data.ask)
+        pd.testing.assert_frame_equal(compact.expand().data, ticker.data)
+        pd.testing.assert_frame_equal(compact.get_data(), ticker.get_data())
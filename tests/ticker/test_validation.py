@@ -0,0 +1,56 @@
+"""Ticker Validator Class Test Suite"""
+from typing import ClassVar
+import pandas as pd
+
+from algotrading.ticker import Ticker, TickerGenerator, TickerManager, TickerValidator
+from algotrading.data import DataManager
+
+class TestTickerValidator():
+    """Test suite for TickerValidator class"""
+    MOCK_FILENAME: ClassVar[str] = ("OANDA_EUR-USD_2020-01-01_2020-01-09_MINUTE-1"
+                                    + DataManager.FILE_EXT)
+
+    def _damage(self, ticker: Ticker) -> Ticker:
+        data = ticker.data.copy()
+        data.iloc[10, data.columns.get_loc("ask")] = data.bid.iloc[10] - 0.001
+        data.iloc[20, data.columns.get_loc("spread")] = -3
+        data.iloc[30, data.columns.get_loc("spread")] = 100000
+        data = pd.concat([data.iloc[:40], data.iloc[[39]], data.iloc[100:]])
+        return Ticker(ticker.symbol, ticker.start, ticker.end, ticker.timeframe, data)
+
+    def test_validate(self):
+        """Test every kind of bad row and the gap are found, weekends excluded"""
+        ticker = TickerGenerator(seed=0).gbm(5 * 1440)
+        validator = TickerValidator()
+        assert validator.validate(ticker).is_valid()
+
+        report = validator.validate(self._damage(ticker))
+        assert (report.duplicates, report.crossed, report.negative_spreads,
+                report.huge_spreads, report.unsorted) == (1, 1, 1, 1, 0)
+        assert report.get_gap_count() == 1
+        assert report.gaps.missing.tolist() == [60]
+
+        repaired = validator.validate(validator.repair(self._damage(ticker)))
+        assert repaired.get_issue_count() == 0
+
+    def test_validate_units(self):
+        """Test an index stored in microseconds gives the same report"""
+        ticker = self._damage(TickerGenerator(seed=0).gbm(5 * 1440))
+        data = ticker.data.copy()
+        data.index = data.index.as_unit("us")
+        micro = Ticker(ticker.symbol, ticker.start, ticker.end, ticker.timeframe, data)
+
+        validator = TickerValidator()
+        (expected, report) = (validator.validate(ticker), validator.validate(micro))
+        assert report.to_dict() == expected.to_dict()
+        pd.testing.assert_frame_equal(report.gaps, expected.gaps)
+
+    def test_validate_stored(self):
+        """Test stored files are repaired and the results kept in the catalog"""
+        ticker = TickerGenerator(seed=0).gbm(5 * 1440)
+        TickerManager.write(self.MOCK_FILENAME, self._damage(ticker).data)
+
+        validations = TickerManager.validate_all(repair=True)
+        assert validations.name.tolist() == [self.MOCK_FILENAME]
+        assert validations.duplicates.tolist() == [0]
+        assert TickerManager.read(self.MOCK_FILENAME).shape[0] == 5 * 1440 - 60 - 3